@@ -81,8 +81,10 @@ class PaddleOCRFacade:
         self.llm_provider = llm_provider
         self.llm_model = llm_model
 
-        # 初始化 OCR 引擎管理器
+        # 初始化 OCR 引擎管理器（每個工作各自建立 Facade，
+        # 以行程內快取共用已載入的引擎，避免每次重新載入模型）
         self.engine_manager = OCREngineManager(
+            reuse_engine=True,
             mode=mode,
             device=device,
             use_orientation_classify=use_orientation_classify,
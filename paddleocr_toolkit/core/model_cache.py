@@ -6,14 +6,51 @@ v1.2.0新增 - 提升重复文件处理速度10x+
 """
 
 import hashlib
+import os
 import pickle
 import time
+from collections import OrderedDict, namedtuple
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, Optional
 import shutil
 
 from paddleocr_toolkit.utils.logger import logger
 
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# zstd frame 的开头标记，用来区分压缩与未压缩（旧版）的缓存文件
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# 缓存内容无法解码时可能抛出的异常（文件损坏、截断或类定义已变更）
+_DECODE_ERRORS = (
+    pickle.UnpicklingError,
+    EOFError,
+    ValueError,
+    TypeError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    KeyError,
+) + ((zstandard.ZstdError,) if HAS_ZSTD else ())
+
+# _load_disk_entry() 无法读取时的返回值（缓存结果本身可能是 None）
+_MISSING = object()
+
+
+# 与 functools.lru_cache 的 cache_info() 相同的字段
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "currsize", "maxsize"])
+
+
+def _new_hash():
+    """创建 16 字节 (128 bit) 的 BLAKE2b 哈希对象"""
+    return hashlib.blake2b(digest_size=16)
+
 
 class ModelCache:
     """
@@ -63,7 +100,7 @@ class ModelCache:
         """创建缓存键"""
         # 将参数转为字符串
         params_str = f"{mode}_{sorted(kwargs.items())}"
-        return hashlib.md5(params_str.encode()).hexdigest()
+        return hashlib.blake2b(params_str.encode(), digest_size=16).hexdigest()
 
     def _load_model(self, mode: str, **kwargs):
         """加载模型（占位符）"""
@@ -80,26 +117,63 @@ class ModelCache:
         return {"cached_models": len(self._cache), "models": list(self._cache.keys())}
 
 
+# 模块级单例引用，首次调用 get_model_cache() 时才创建，
+# 之后的存取可略过 __new__ 的判断
+_model_cache: Optional[ModelCache] = None
+
+
+def get_model_cache() -> ModelCache:
+    """
+    获取模型缓存单例
+
+    Returns:
+        ModelCache: 与 ModelCache() 相同的单例
+    """
+    global _model_cache
+    if _model_cache is None:
+        _model_cache = ModelCache()
+    return _model_cache
+
+
 class ResultCache:
     """
     OCR结果缓存
     使用LRU策略，避免重复处理相同文件
     """
 
-    def __init__(self, cache_dir: Optional[Path] = None, max_size: int = 1000):
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_size: int = 1000,
+        min_disk_bytes: int = 0,
+        ttl_seconds: Optional[float] = None,
+        compress: bool = True,
+    ):
         """
         初始化结果缓存
 
         Args:
             cache_dir: 缓存目录
             max_size: 最大缓存数量
+            min_disk_bytes: 序列化后小于此大小的结果只保留在内存，不写入磁盘
+                （0 表示全部写入磁盘）
+            ttl_seconds: 内存缓存项目的存活时间（秒），过期后从内存移除；
+                磁盘缓存不受影响（None 表示不过期）
+            compress: 是否以 zstd (level 3) 压缩磁盘缓存（需安装 zstandard）
         """
         self.cache_dir = cache_dir or Path.home() / ".paddleocr" / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 热路径以字符串拼接路径，避免每次查询都建立 Path 对象
+        self._cache_dir_prefix = str(self.cache_dir) + os.sep
         self.max_size = max_size
-
-        # 内存缓存（使用LRU）
-        self.memory_cache: Dict[str, Any] = {}
+        self.min_disk_bytes = max(0, min_disk_bytes)
+        self.ttl_ns = None if ttl_seconds is None else int(ttl_seconds * 1e9)
+        self.compress = compress and HAS_ZSTD
+
+        # 内存缓存（使用LRU：最近使用的项目移到末尾，超出容量时从开头淘汰）
+        self.memory_cache: "OrderedDict[str, Any]" = OrderedDict()
+        # 启用 TTL 时记录各项目写入内存的时间（time.monotonic_ns）
+        self._stored_at: Dict[str, int] = {}
         self.cache_hits = 0
         self.cache_misses = 0
 
@@ -111,16 +185,19 @@ class ResultCache:
             file_path: 文件路径
 
         Returns:
-            SHA256哈希值
+            BLAKE2b-128哈希值（仅作缓存键，比 SHA256 更快）
         """
-        sha256 = hashlib.sha256()
-
         with open(file_path, "rb") as f:
-            # 分块读取，避免大文件内存问题
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256.update(chunk)
+            # Python 3.11+ 直接以 readinto 读入共用缓冲区，不产生中间 bytes
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, _new_hash).hexdigest()
 
-        return sha256.hexdigest()
+            # 旧版本以 1 MiB 分块读取，减少 Python 层循环次数
+            file_hash = _new_hash()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
 
     def get(self, file_path: str, mode: str) -> Optional[Any]:
         """
@@ -137,27 +214,70 @@ class ResultCache:
         file_hash = self._compute_file_hash(file_path)
         cache_key = f"{file_hash}_{mode}"
 
-        # 1. 检查内存缓存
+        # 1. 检查内存缓存（过期项目直接移除，再往下检查磁盘）
         if cache_key in self.memory_cache:
-            self.cache_hits += 1
-            return self.memory_cache[cache_key]
+            if self._is_expired(cache_key, time.monotonic_ns()):
+                self._evict(cache_key)
+            else:
+                self.memory_cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                return self.memory_cache[cache_key]
 
         # 2. 检查磁盘缓存
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
-        if cache_file.exists():
-            try:
-                with open(cache_file, "rb") as f:
-                    result = pickle.load(f)
+        cache_file = f"{self._cache_dir_prefix}{cache_key}.pkl"
+        if os.path.isfile(cache_file):
+            result = self._load_disk_entry(cache_file)
+            if result is not _MISSING:
                 # 加載到記憶體快取
-                self.memory_cache[cache_key] = result
+                self._store(cache_key, result)
+                self._check_cache_size()
                 self.cache_hits += 1
                 return result
-            except Exception as e:
-                logger.warning(f"加載快取失敗: {e}")
 
         self.cache_misses += 1
         return None
 
+    def _load_disk_entry(self, cache_file: str) -> Any:
+        """
+        读取并解码磁盘缓存文件
+
+        读取时的 IO 错误（权限、文件描述符耗尽等）可能只是暂时的，保留文件；
+        只有内容确定无法解码时才删除文件，避免每次查询都重复失败。
+
+        Args:
+            cache_file: 缓存文件路径
+
+        Returns:
+            缓存的结果，无法读取时返回 _MISSING
+        """
+        try:
+            # 一次读入整个文件再反序列化
+            with open(cache_file, "rb") as f:
+                data = f.read()
+        except Exception as e:
+            logger.warning(f"讀取快取失敗: {e}")
+            return _MISSING
+
+        if data[:4] == _ZSTD_MAGIC and not HAS_ZSTD:
+            # 保留文件，安装 zstandard 后仍可读取
+            logger.warning(f"快取已壓縮但未安裝 zstandard，略過: {cache_file}")
+            return _MISSING
+
+        try:
+            if data[:4] == _ZSTD_MAGIC:
+                data = zstandard.ZstdDecompressor().decompress(data)
+            return pickle.loads(data)
+        except _DECODE_ERRORS as e:
+            logger.warning(f"快取內容損壞，已刪除: {e}")
+            try:
+                os.remove(cache_file)
+            except OSError:
+                pass
+            return _MISSING
+        except Exception as e:
+            logger.warning(f"加載快取失敗: {e}")
+            return _MISSING
+
     def set(self, file_path: str, mode: str, result: Any):
         """
         设置缓存
@@ -171,33 +291,71 @@ class ResultCache:
         cache_key = f"{file_hash}_{mode}"
 
         # 1. 保存到内存
-        self.memory_cache[cache_key] = result
+        self._store(cache_key, result)
 
         # 2. 保存到磁盘
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
+        cache_file = f"{self._cache_dir_prefix}{cache_key}.pkl"
         try:
-            with open(cache_file, "wb") as f:
-                pickle.dump(result, f)
+            # 先完整序列化再以单次 write 写入，避免 pickle.dump 分多次写入文件；
+            # protocol 5 (PEP 574) 让 numpy 数组以 PickleBuffer 序列化，
+            # pickle.loads 自动识别协议，旧缓存仍可读取
+            payload = pickle.dumps(result, protocol=5)
+            # 过小的结果只留在内存，省去一次文件写入
+            if len(payload) >= self.min_disk_bytes:
+                if self.compress:
+                    # 表格、版面等结构化结果压缩率高，压缩比写入多余字节更快
+                    payload = zstandard.ZstdCompressor(level=3).compress(payload)
+                with open(cache_file, "wb", buffering=0) as f:
+                    f.write(payload)
         except Exception as e:
             logger.error("Failed to save cache: %s", e)
 
-        # 3. 检查缓存大小
+        # 3. 清理过期项目并检查缓存大小
+        self._sweep_expired()
         self._check_cache_size()
 
+    def _store(self, cache_key: str, result: Any):
+        """写入内存缓存并标记为最近使用"""
+        self.memory_cache[cache_key] = result
+        self.memory_cache.move_to_end(cache_key)
+        if self.ttl_ns is not None:
+            self._stored_at[cache_key] = time.monotonic_ns()
+
+    def _is_expired(self, cache_key: str, now: int) -> bool:
+        """判断内存缓存项目是否超过 TTL"""
+        if self.ttl_ns is None:
+            return False
+        return now - self._stored_at.get(cache_key, now) > self.ttl_ns
+
+    def _evict(self, cache_key: str):
+        """从内存缓存移除项目"""
+        self.memory_cache.pop(cache_key, None)
+        self._stored_at.pop(cache_key, None)
+
+    def _sweep_expired(self, limit: int = 8):
+        """
+        从最久未使用的一端检查最多 limit 个项目并移除已过期者
+
+        每次 set() 只做有限的检查，使内存在流量间歇时也能逐步回收，
+        而不必扫描整个缓存。
+        """
+        if self.ttl_ns is None:
+            return
+        now = time.monotonic_ns()
+        for cache_key in list(islice(self.memory_cache, limit)):
+            if self._is_expired(cache_key, now):
+                self._evict(cache_key)
+
     def _check_cache_size(self):
-        """检查并清理过大的缓存"""
-        if len(self.memory_cache) > self.max_size:
-            # 简单的FIFO清理策略
-            # 实际应该使用LRU
-            keys_to_remove = list(self.memory_cache.keys())[
-                : len(self.memory_cache) - self.max_size
-            ]
-            for key in keys_to_remove:
-                del self.memory_cache[key]
+        """检查并清理过大的缓存（LRU：淘汰最久未使用的项目）"""
+        while len(self.memory_cache) > self.max_size:
+            cache_key, _ = self.memory_cache.popitem(last=False)
+            self._stored_at.pop(cache_key, None)
 
     def clear(self):
         """清理所有缓存"""
         self.memory_cache.clear()
+        self._stored_at.clear()
 
         # 清理磁盘缓存
         for cache_file in self.cache_dir.glob("*.pkl"):
@@ -218,6 +376,20 @@ class ResultCache:
             "disk_cached": len(list(self.cache_dir.glob("*.pkl"))),
         }
 
+    def cache_info(self) -> CacheInfo:
+        """
+        获取轻量缓存统计
+
+        只读取计数器与内存缓存大小，不像 get_stats() 需要扫描磁盘目录，
+        适合在处理过程中频繁调用。
+
+        Returns:
+            CacheInfo: (hits, misses, currsize, maxsize)
+        """
+        return CacheInfo(
+            self.cache_hits, self.cache_misses, len(self.memory_cache), self.max_size
+        )
+
     def print_stats(self):
         """打印缓存统计"""
         stats = self.get_stats()
@@ -243,12 +415,16 @@ def cached_ocr_result(mode: str):
         def process_image(image_path):
             return ocr_engine.ocr(image_path)
     """
+    # 缓存实例在装饰器工厂中创建一次，并预先绑定 get/set，
+    # 每次调用只需读取闭包变量
     cache = ResultCache()
+    cache_get = cache.get
+    cache_set = cache.set
 
     def decorator(func):
         def wrapper(file_path, *args, **kwargs):
             # 尝试从缓存获取
-            cached_result = cache.get(file_path, mode)
+            cached_result = cache_get(file_path, mode)
             if cached_result is not None:
                 return cached_result
 
@@ -256,7 +432,7 @@ def cached_ocr_result(mode: str):
             result = func(file_path, *args, **kwargs)
 
             # 保存到缓存
-            cache.set(file_path, mode, result)
+            cache_set(file_path, mode, result)
 
             return result
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """
 OCR 快取管理模組
-基於檔案雜湊 (MD5) 儲存與檢索 OCR 結果
+基於檔案雜湊 (BLAKE2b-128) 儲存與檢索 OCR 結果
 """
 
 import hashlib
@@ -11,6 +11,11 @@ from pathlib import Path
 from typing import Any, Optional
 
 
+def _new_hash():
+    """建立 16 位元組 (128 bit) 的 BLAKE2b 雜湊物件"""
+    return hashlib.blake2b(digest_size=16)
+
+
 class OCRCache:
     """
     OCR 結果快取類別
@@ -28,13 +33,20 @@ class OCRCache:
 
     def _get_file_hash(self, file_path: str) -> str:
         """
-        計算檔案的 MD5 雜湊值
+        計算檔案的 BLAKE2b-128 雜湊值
+
+        雜湊僅作為快取鍵使用，BLAKE2b 比 MD5 更快且長度相同（32 個十六進位字元）
         """
-        hash_md5 = hashlib.md5()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            # Python 3.11+ 以 readinto 讀入共用緩衝區，不產生中間 bytes
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, _new_hash).hexdigest()
+
+            # 舊版本以 1 MiB 分塊讀取，減少 Python 層迴圈次數
+            file_hash = _new_hash()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
 
     def get(self, file_path: str, mode: str) -> Optional[Any]:
         """
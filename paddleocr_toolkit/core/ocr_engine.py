@@ -10,8 +10,11 @@ OCR 引擎管理器 - 管理 PaddleOCR 引擎生命週期
 """
 
 import logging
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 from paddleocr_toolkit.utils.logger import logger
 from paddleocr_toolkit.core.config import settings
@@ -21,33 +24,102 @@ from paddleocr_toolkit.utils.logger import logger
 if TYPE_CHECKING:
     from paddleocr_toolkit.plugins.loader import PluginLoader
 
-try:
-    from paddleocr import PaddleOCR, PPStructure
+# paddleocr 匯入需數秒（連帶載入 paddle），延遲到第一次初始化引擎時才匯入。
+# 以下名稱為 None 表示尚未解析；已設定（例如被測試替換）的名稱不會被覆寫。
+PaddleOCR: Any = None
+PPStructure: Any = None
+# Export as PPStructureV3 for backward compatibility and tests
+PPStructureV3: Any = None
+PaddleOCRVL: Any = None
+FormulaRecPipeline: Any = None
+HAS_STRUCTURE: Optional[bool] = None
+HAS_VL: Optional[bool] = None
+HAS_FORMULA: Optional[bool] = None
 
-    # Export as PPStructureV3 for backward compatibility and tests
-    PPStructureV3 = PPStructure
-    HAS_STRUCTURE = True
-except ImportError:
-    PaddleOCR = None  # type: ignore
-    PPStructure = None  # type: ignore
-    PPStructureV3 = None  # type: ignore
-    HAS_STRUCTURE = False
+# None: 尚未嘗試匯入；False: paddleocr 不可用
+_paddleocr_module: Any = None
 
-try:
-    from paddleocr import PaddleOCRVL
 
-    HAS_VL = True
-except ImportError:
-    PaddleOCRVL = None  # type: ignore
-    HAS_VL = False
+def _load_paddleocr() -> None:
+    """匯入 paddleocr 並解析尚未設定的引擎類別與 HAS_* 旗標"""
+    global _paddleocr_module, PaddleOCR, PPStructure, PPStructureV3
+    global PaddleOCRVL, FormulaRecPipeline, HAS_STRUCTURE, HAS_VL, HAS_FORMULA
 
-try:
-    from paddleocr import FormulaRecPipeline
+    if _paddleocr_module is None:
+        try:
+            import paddleocr
+
+            _paddleocr_module = paddleocr
+        except ImportError:
+            _paddleocr_module = False
+
+    module = _paddleocr_module or None
+    if PaddleOCR is None:
+        PaddleOCR = getattr(module, "PaddleOCR", None)
+    if PPStructure is None:
+        PPStructure = getattr(module, "PPStructure", None)
+    if PPStructureV3 is None:
+        PPStructureV3 = PPStructure
+    if PaddleOCRVL is None:
+        PaddleOCRVL = getattr(module, "PaddleOCRVL", None)
+    if FormulaRecPipeline is None:
+        FormulaRecPipeline = getattr(module, "FormulaRecPipeline", None)
+
+    if HAS_STRUCTURE is None:
+        HAS_STRUCTURE = PaddleOCR is not None and PPStructure is not None
+    if HAS_VL is None:
+        HAS_VL = PaddleOCRVL is not None
+    if HAS_FORMULA is None:
+        HAS_FORMULA = FormulaRecPipeline is not None
+
+
+# 行程內引擎快取（僅供 reuse_engine=True 的管理器使用）：模型載入需數秒與
+# 大量記憶體，相同類別與參數的管理器共用同一個引擎例項。
+# 以 LRU 保留最多 _ENGINE_CACHE_MAX_SIZE 個引擎，超過時淘汰最久未使用者
+_ENGINE_CACHE: "OrderedDict[Tuple, Tuple[Any, threading.Lock]]" = OrderedDict()
+_ENGINE_CACHE_LOCK = threading.Lock()
+_ENGINE_CACHE_MAX_SIZE = 2
+
+
+def _get_cached_engine(
+    factory: Callable[..., Any], **kwargs
+) -> Tuple[Any, Optional[threading.Lock]]:
+    """
+    取得（必要時建立）快取的引擎例項
+
+    Args:
+        factory: 引擎類別或建構函式
+        **kwargs: 建構引數
+
+    Returns:
+        Tuple[Any, Optional[threading.Lock]]: (引擎例項, 該引擎專用的預測鎖)；
+            引數不可雜湊而未快取時不共用，鎖為 None
+    """
+    try:
+        key = (factory, tuple(sorted(kwargs.items())))
+        hash(key)
+    except TypeError:
+        # 引數不可雜湊時不快取
+        return factory(**kwargs), None
+
+    with _ENGINE_CACHE_LOCK:
+        cached = _ENGINE_CACHE.get(key)
+        if cached is None:
+            cached = (factory(**kwargs), threading.Lock())
+            _ENGINE_CACHE[key] = cached
+            while len(_ENGINE_CACHE) > _ENGINE_CACHE_MAX_SIZE:
+                # 仍在使用被淘汰引擎的管理器保有自己的參照，不受影響
+                _ENGINE_CACHE.popitem(last=False)
+        else:
+            _ENGINE_CACHE.move_to_end(key)
+            logger.info("Reusing cached OCR engine")
+    return cached
 
-    HAS_FORMULA = True
-except ImportError:
-    FormulaRecPipeline = None  # type: ignore
-    HAS_FORMULA = False
+
+def clear_engine_cache() -> None:
+    """清除行程內的引擎快取，釋放已載入的模型"""
+    with _ENGINE_CACHE_LOCK:
+        _ENGINE_CACHE.clear()
 
 
 class OCRMode(Enum):
@@ -92,6 +164,7 @@ class OCREngineManager:
         use_doc_unwarping: bool = False,
         use_textline_orientation: bool = False,
         plugin_loader: Optional["PluginLoader"] = None,
+        reuse_engine: bool = False,
         **kwargs,
     ):
         """
@@ -103,6 +176,8 @@ class OCREngineManager:
             use_orientation_classify: 是否啟用檔案方向自動校正
             use_doc_unwarping: 是否啟用檔案彎曲校正
             use_textline_orientation: 是否啟用文字行方向偵測
+            reuse_engine: 是否使用行程內引擎快取；啟用時 close() 不會釋放模型，
+                需要釋放時請呼叫 clear_engine_cache()
             **kwargs: 其他引擎引數
         """
         self.mode = OCRMode(mode) if isinstance(mode, str) else mode
@@ -118,7 +193,29 @@ class OCREngineManager:
         self.engine: Optional[Any] = None
         self.structure_engine: Optional[Any] = None
         self.plugin_loader = plugin_loader
+        self.reuse_engine = reuse_engine
         self._is_initialized = False
+        # 共用快取引擎時序列化預測呼叫（推論器不保證執行緒安全）；
+        # 管理器自有的引擎不加鎖
+        self._engine_lock: Optional[threading.Lock] = None
+
+    def _create_engine(
+        self, factory: Callable[..., Any], **kwargs
+    ) -> Tuple[Any, Optional[threading.Lock]]:
+        """
+        建立引擎；reuse_engine 啟用時改由行程內快取取得
+
+        Args:
+            factory: 引擎類別或建構函式
+            **kwargs: 建構引數
+
+        Returns:
+            Tuple[Any, Optional[threading.Lock]]: (引擎例項, 預測鎖)；
+                引擎不是來自快取時鎖為 None
+        """
+        if self.reuse_engine:
+            return _get_cached_engine(factory, **kwargs)
+        return factory(**kwargs), None
 
     def init_engine(self) -> None:
         """
@@ -133,6 +230,7 @@ class OCREngineManager:
             return
 
         logger.info("Initializing PaddleOCR 3.x (Mode: %s)...", self.mode.value)
+        _load_paddleocr()
 
         try:
             if self.mode == OCRMode.STRUCTURE:
@@ -161,7 +259,8 @@ class OCREngineManager:
         if PaddleOCR is None:
             raise ImportError("PaddleOCR 模組不可用，請執行 'pip install paddleocr'")
 
-        self.engine = PaddleOCR(
+        self.engine, self._engine_lock = self._create_engine(
+            PaddleOCR,
             use_doc_orientation_classify=self.config.get(
                 "use_doc_orientation_classify", True
             ),
@@ -176,7 +275,9 @@ class OCREngineManager:
             raise ImportError("PPStructureV3 模組不可用，請執行 'pip install paddleocr'")
 
         logger.info("  Loading PPStructure engine...")
-        self.engine = PPStructureV3(show_log=True, layout=True, table=True, ocr=True)
+        self.engine, self._engine_lock = self._create_engine(
+            PPStructureV3, show_log=True, layout=True, table=True, ocr=True
+        )
         logger.info("[OK] PPStructure initialized (Structure Mode)")
 
     def _init_vl_engine(self) -> None:
@@ -184,7 +285,8 @@ class OCREngineManager:
         if not HAS_VL or PaddleOCRVL is None:
             raise ImportError("PaddleOCRVL 模組不可用，請執行 'pip install paddleocr'")
 
-        self.engine = PaddleOCRVL(
+        self.engine, self._engine_lock = self._create_engine(
+            PaddleOCRVL,
             use_doc_orientation_classify=self.config.get(
                 "use_doc_orientation_classify", True
             ),
@@ -197,7 +299,8 @@ class OCREngineManager:
         if not HAS_FORMULA or FormulaRecPipeline is None:
             raise ImportError("FormulaRecPipeline 模組不可用，請執行 'pip install paddleocr'")
 
-        self.engine = FormulaRecPipeline(
+        self.engine, self._engine_lock = self._create_engine(
+            FormulaRecPipeline,
             use_doc_orientation_classify=self.config.get(
                 "use_doc_orientation_classify", True
             ),
@@ -222,8 +325,8 @@ class OCREngineManager:
             if PPStructure is None:
                 raise ImportError("PPStructure 模組不可用")
 
-            self.structure_engine = PPStructure(
-                show_log=True, layout=True, table=True, ocr=True
+            self.structure_engine, self._engine_lock = self._create_engine(
+                PPStructure, show_log=True, layout=True, table=True, ocr=True
             )
             # 設定 engine 為 structure_engine 以便其他方法使用
             self.engine = self.structure_engine
@@ -260,19 +363,7 @@ class OCREngineManager:
                 input_data = plugin.process_before_ocr(input_data)
 
         # 2. 執行預測
-        if self.mode == OCRMode.BASIC and hasattr(self.engine, "ocr"):
-            # Use standard ocr() method which returns list structure
-            # PaddleOCR v3/PaddleX ocr() might not accept kwargs if it forwards to predict()
-            results = self.engine.ocr(input_data)
-        elif self.mode in [OCRMode.STRUCTURE, OCRMode.HYBRID] and hasattr(self.engine, "__call__"):
-            # PPStructure 在新版本使用 __call__ 而非 predict
-            results = self.engine(input_data, **kwargs)
-        elif hasattr(self.engine, "predict"):
-            # Fallback for older API that has predict()
-            results = self.engine.predict(input_data, **kwargs)
-        else:
-            # 最後嘗試直接調用
-            results = self.engine(input_data, **kwargs)
+        results = self._run_engine(input_data, **kwargs)
 
         # 3. 外掛後處理
         if self.plugin_loader:
@@ -281,6 +372,45 @@ class OCREngineManager:
 
         return results
 
+    def _run_engine(self, input_data, **kwargs):
+        """依模式呼叫底層引擎（不含外掛處理）"""
+        with self._engine_lock or nullcontext():
+            if self.mode == OCRMode.BASIC and hasattr(self.engine, "ocr"):
+                # Use standard ocr() method which returns list structure
+                # PaddleOCR v3/PaddleX ocr() might not accept kwargs if it forwards to predict()
+                return self.engine.ocr(input_data)
+            elif self.mode in [OCRMode.STRUCTURE, OCRMode.HYBRID] and hasattr(self.engine, "__call__"):
+                # PPStructure 在新版本使用 __call__ 而非 predict
+                return self.engine(input_data, **kwargs)
+            elif hasattr(self.engine, "predict"):
+                # Fallback for older API that has predict()
+                return self.engine.predict(input_data, **kwargs)
+            else:
+                # 最後嘗試直接調用
+                return self.engine(input_data, **kwargs)
+
+    def warmup(self) -> None:
+        """
+        以小型空白影像執行一次預測（預熱）
+
+        讓第一頁的實際處理延遲不包含推論圖建立與記憶體配置。
+        預熱失敗只記錄警告，不影響後續使用。
+
+        Raises:
+            RuntimeError: 當引擎未初始化時
+        """
+        if not self._is_initialized or self.engine is None:
+            raise RuntimeError("引擎未初始化，請先呼叫 init_engine()")
+
+        import numpy as np
+
+        blank = np.full((32, 32, 3), 255, dtype=np.uint8)
+        try:
+            self._run_engine(blank)
+            logger.info("[OK] OCR engine warmed up")
+        except Exception as e:
+            logger.warning("Engine warmup failed: %s", e)
+
     def is_initialized(self) -> bool:
         """
         檢查引擎是否已初始化
@@ -317,8 +447,9 @@ class OCREngineManager:
     def close(self) -> None:
         """關閉引擎，釋放資源"""
         if self.engine is not None:
-            # PaddleOCR 引擎通常不需要顯式關閉
-            # 但我們可以清理引用
+            # PaddleOCR 引擎通常不需要顯式關閉，這裡只清理引用。
+            # reuse_engine 啟用時引擎仍保留在行程快取中供下次重用，
+            # 需要釋放模型時請呼叫 clear_engine_cache()
             self.engine = None
             self.structure_engine = None
             self._is_initialized = False
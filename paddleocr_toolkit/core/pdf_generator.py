@@ -5,8 +5,11 @@ PaddleOCR Toolkit - PDF 生成器
 使用 Umi-OCR 邏輯建立雙層可搜尋 PDF。
 """
 
+import io
 import logging
-from typing import List
+import os
+import tempfile
+from typing import BinaryIO, List, Optional, Union
 
 try:
     import fitz
@@ -40,6 +43,7 @@ class PDFGenerator:
         debug_mode: bool = False,
         compress_images: bool = False,
         jpeg_quality: int = 85,
+        flush_every: int = 50,
     ):
         """
         初始化 PDF 生成器
@@ -49,6 +53,9 @@ class PDFGenerator:
             debug_mode: 如果為 True，文字會顯示為粉紅色（方便除錯）
             compress_images: 如果為 True，使用 JPEG 壓縮圖片以減少檔案大小
             jpeg_quality: JPEG 壓縮品質（0-100，預設 85）
+            flush_every: 每新增幾頁就將文件寫入暫存檔並重新開啟，
+                使記憶體用量不隨頁數成長（0 表示全部保留在記憶體）。
+                暫存檔位於輸出目錄，由 save() 或 close() 刪除
         """
         if not HAS_FITZ:
             raise ImportError("PyMuPDF (fitz) 未安裝，請執行: pip install pymupdf")
@@ -59,13 +66,17 @@ class PDFGenerator:
         self.debug_mode = debug_mode
         self.compress_images = compress_images
         self.jpeg_quality = max(0, min(100, jpeg_quality))
+        self.flush_every = max(0, flush_every)
+        self._tmp_path: Optional[str] = None
 
-    def add_page(self, image_path: str, ocr_results: List[OCRResult]) -> bool:
+    def add_page(
+        self, image_path: Union[str, bytes, BinaryIO], ocr_results: List[OCRResult]
+    ) -> bool:
         """
         新增一頁到 PDF
 
         Args:
-            image_path: 原始圖片路徑
+            image_path: 原始圖片路徑，或已編碼圖片的 bytes / 二進位檔案物件
             ocr_results: OCR 辨識結果列表
 
         Returns:
@@ -75,9 +86,20 @@ class PDFGenerator:
             logger.warning("Pillow not installed")
             return False
 
+        # 記憶體中的圖片資料直接以 stream 插入，不需先寫成檔案
+        if isinstance(image_path, bytes):
+            image_data = image_path
+        elif hasattr(image_path, "read"):
+            image_data = image_path.read()
+        else:
+            image_data = None
+
         try:
             # 開啟圖片以取得尺寸
-            img = Image.open(image_path)
+            if image_data is not None:
+                img = Image.open(io.BytesIO(image_data))
+            else:
+                img = Image.open(image_path)
             img_width, img_height = img.size
 
             # 建立新頁面，尺寸與圖片相同
@@ -88,8 +110,6 @@ class PDFGenerator:
 
             if self.compress_images:
                 # 使用 JPEG 壓縮以減少檔案大小
-                import io
-
                 # 確保是 RGB 模式
                 if img.mode != "RGB":
                     img = img.convert("RGB")
@@ -101,6 +121,9 @@ class PDFGenerator:
                 jpeg_data = jpeg_buffer.getvalue()
                 # 插入 JPEG 資料
                 page.insert_image(rect, stream=jpeg_data)
+            elif image_data is not None:
+                # 直接插入原始圖片資料（無損但較大）
+                page.insert_image(rect, stream=image_data)
             else:
                 # 直接插入原始圖片（PNG 格式，無損但較大）
                 page.insert_image(rect, filename=image_path)
@@ -109,11 +132,12 @@ class PDFGenerator:
             for result in ocr_results:
                 self._insert_invisible_text(page, result)
 
-            self.page_count += 1
+            self._finish_page()
             return True
 
         except Exception as e:
-            logger.warning("Failed to add page (%s): %s", image_path, e)
+            source = "<memory>" if image_data is not None else image_path
+            logger.warning("Failed to add page (%s): %s", source, e)
             return False
 
     def add_page_from_pixmap(self, pixmap, ocr_results: List[OCRResult]) -> bool:
@@ -128,48 +152,142 @@ class PDFGenerator:
             bool: 是否成功新增頁面
         """
         try:
+            if self.compress_images:
+                # 使用 JPEG 壓縮以減少檔案大小
+                return self.add_page_from_jpeg_bytes(
+                    self.encode_jpeg(pixmap), pixmap.width, pixmap.height, ocr_results
+                )
+
             img_width = pixmap.width
             img_height = pixmap.height
 
             # 建立新頁面
             page = self.doc.new_page(width=img_width, height=img_height)
 
-            # 插入 pixmap 作為背景
+            # 直接插入 pixmap（PNG 格式，無損但較大）
             rect = fitz.Rect(0, 0, img_width, img_height)
+            page.insert_image(rect, pixmap=pixmap)
 
-            if self.compress_images:
-                # 使用 JPEG 壓縮以減少檔案大小
-                import io
+            # 疊加透明文字層
+            for result in ocr_results:
+                self._insert_invisible_text(page, result)
 
-                # 將 pixmap 轉換為 PIL Image
-                # 注意：這裡假設 pixmap 已經是 RGB 模式 (alpha=False)
-                pil_image = Image.frombytes(
-                    "RGB", [pixmap.width, pixmap.height], pixmap.samples
-                )
+            self._finish_page()
+            return True
 
-                # 儲存為 JPEG 到記憶體緩衝區
-                jpeg_buffer = io.BytesIO()
-                pil_image.save(
-                    jpeg_buffer, format="JPEG", quality=self.jpeg_quality, optimize=True
-                )
-                jpeg_data = jpeg_buffer.getvalue()
-                # 插入 JPEG 資料
-                page.insert_image(rect, stream=jpeg_data)
-            else:
-                # 直接插入 pixmap（PNG 格式，無損但較大）
-                page.insert_image(rect, pixmap=pixmap)
+        except Exception as e:
+            logger.warning("Failed to add page from pixmap: %s", e)
+            return False
+
+    def encode_jpeg(self, pixmap) -> bytes:
+        """
+        將 PyMuPDF Pixmap 編碼為 JPEG
+
+        編碼結果可透過 add_page_from_jpeg_bytes 重複使用於多個生成器，
+        避免同一張頁面圖片被重複編碼。
+
+        Args:
+            pixmap: PyMuPDF 的 Pixmap 物件（RGB，alpha=False）
+
+        Returns:
+            bytes: JPEG 資料
+        """
+        # 將 pixmap 轉換為 PIL Image
+        # 注意：這裡假設 pixmap 已經是 RGB 模式 (alpha=False)
+        pil_image = Image.frombytes(
+            "RGB", [pixmap.width, pixmap.height], pixmap.samples
+        )
+
+        # 儲存為 JPEG 到記憶體緩衝區
+        jpeg_buffer = io.BytesIO()
+        pil_image.save(
+            jpeg_buffer, format="JPEG", quality=self.jpeg_quality, optimize=True
+        )
+        return jpeg_buffer.getvalue()
+
+    def add_page_from_jpeg_bytes(
+        self, jpeg_data: bytes, width: int, height: int, ocr_results: List[OCRResult]
+    ) -> bool:
+        """
+        從已編碼的 JPEG 資料新增一頁到 PDF
+
+        Args:
+            jpeg_data: JPEG 資料（例如 encode_jpeg 的輸出）
+            width: 圖片寬度
+            height: 圖片高度
+            ocr_results: OCR 辨識結果列表
+
+        Returns:
+            bool: 是否成功新增頁面
+        """
+        try:
+            # 建立新頁面並插入 JPEG 資料作為背景
+            page = self.doc.new_page(width=width, height=height)
+            rect = fitz.Rect(0, 0, width, height)
+            page.insert_image(rect, stream=jpeg_data)
 
             # 疊加透明文字層
             for result in ocr_results:
                 self._insert_invisible_text(page, result)
 
-            self.page_count += 1
+            self._finish_page()
             return True
 
         except Exception as e:
-            logger.warning("Failed to add page from pixmap: %s", e)
+            logger.warning("Failed to add page from JPEG data: %s", e)
             return False
 
+    def _finish_page(self) -> None:
+        """記錄新增的頁面，並在達到 flush_every 時寫入暫存檔"""
+        self.page_count += 1
+        if self.flush_every and self.page_count % self.flush_every == 0:
+            self._flush()
+
+    def _flush(self) -> None:
+        """
+        將目前文件寫入暫存檔並重新開啟
+
+        重新開啟後的文件從磁碟按需讀取物件，已寫入的頁面圖片不再佔用記憶體。
+        第一次完整寫入，之後以增量方式只附加新頁面。失敗時保留在記憶體繼續處理。
+        """
+        new_tmp_path = None
+        try:
+            if self._tmp_path is None:
+                output_dir = os.path.dirname(os.path.abspath(self.output_path))
+                fd, new_tmp_path = tempfile.mkstemp(
+                    suffix=".pdf.partial", dir=output_dir
+                )
+                os.close(fd)
+                self.doc.save(new_tmp_path, deflate=True)
+                self._tmp_path = new_tmp_path
+            else:
+                self.doc.save(
+                    self._tmp_path,
+                    incremental=True,
+                    encryption=fitz.PDF_ENCRYPT_KEEP,
+                )
+        except Exception as e:
+            logger.warning("Failed to flush PDF pages to disk: %s", e)
+            # 第一次寫入失敗時，mkstemp 建立的暫存檔尚未記錄，需在此刪除
+            if new_tmp_path is not None and self._tmp_path is None:
+                try:
+                    os.remove(new_tmp_path)
+                except OSError:
+                    pass
+            return
+
+        self.doc.close()
+        self.doc = fitz.open(self._tmp_path)
+
+    def _remove_tmp(self) -> None:
+        """刪除暫存檔（如果存在）"""
+        if self._tmp_path is not None:
+            try:
+                os.remove(self._tmp_path)
+            except OSError:
+                pass
+            self._tmp_path = None
+
     def _insert_invisible_text(self, page, result: OCRResult) -> None:
         """
         在頁面上插入透明文字
@@ -297,9 +415,11 @@ class PDFGenerator:
                 logger.warning("No pages to save")
                 return False
 
-            self.doc.save(self.output_path)
-            self.doc.save(self.output_path)
+            # 最終輸出完整重寫（清除未使用物件並壓縮串流），
+            # 已寫入暫存檔的頁面會從磁碟逐一讀取
+            self.doc.save(self.output_path, garbage=4, deflate=True)
             self.doc.close()
+            self._remove_tmp()
             logger.info(
                 "[OK] PDF saved: %s (%d pages)", self.output_path, self.page_count
             )
@@ -307,4 +427,32 @@ class PDFGenerator:
 
         except Exception as e:
             logger.error("Failed to save PDF: %s", e)
+            self._remove_tmp()
             return False
+
+    def close(self) -> None:
+        """
+        關閉文件並刪除暫存檔，未儲存的頁面會被捨棄
+
+        處理中斷或不再需要輸出時呼叫；save() 之後呼叫不會有任何影響。
+        """
+        try:
+            if not self.doc.is_closed:
+                self.doc.close()
+        except Exception as e:
+            logger.debug("Failed to close PDF document: %s", e)
+        self._remove_tmp()
+
+    def __enter__(self):
+        """Context manager 支援"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager 支援：離開時刪除未儲存的暫存檔"""
+        self.close()
+        return False
+
+    def __del__(self):
+        """生成器被丟棄時仍刪除暫存檔，避免在輸出目錄留下 .pdf.partial"""
+        if getattr(self, "_tmp_path", None) is not None:
+            self.close()
@@ -9,7 +9,7 @@ PDF 工具函式 - 共用的 PDF 處理邏輯
 """
 
 import io
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 
@@ -28,16 +28,24 @@ except ImportError:
     HAS_PIL = False
 
 
-def pixmap_to_numpy(pixmap: "fitz.Pixmap", copy: bool = True) -> np.ndarray:
+def pixmap_to_numpy(
+    pixmap: "fitz.Pixmap", copy: bool = True, out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
-    將 PyMuPDF Pixmap 轉換為 numpy 陣列 (RGB)
+    將 PyMuPDF Pixmap 轉換為 numpy 陣列
+
+    RGB / RGBA pixmap 轉為 (H, W, 3)（捨棄 alpha）；灰階 pixmap (n == 1)
+    不轉換色彩，回傳 (H, W, 1)。
 
     Args:
         pixmap: PyMuPDF Pixmap 物件
         copy: 是否複製陣列（True 避免記憶體問題）
+        out: 可重複使用的一維 uint8 緩衝區（可選）；copy=True 且容量至少為
+            H * W * 輸出通道數（RGB 為 3、灰階為 1）時，影像複製到緩衝區前段
+            並回傳其視圖，避免每頁重新配置記憶體；容量不足時忽略並另行配置
 
     Returns:
-        numpy.ndarray: RGB 格式的圖片陣列 (H, W, 3)
+        numpy.ndarray: 圖片陣列，(H, W, 3) RGB 或灰階時為 (H, W, 1)
     """
     img_array = np.frombuffer(pixmap.samples, dtype=np.uint8)
     img_array = img_array.reshape(pixmap.height, pixmap.width, pixmap.n)
@@ -47,7 +55,12 @@ def pixmap_to_numpy(pixmap: "fitz.Pixmap", copy: bool = True) -> np.ndarray:
         img_array = img_array[:, :, :3]
 
     if copy:
-        img_array = img_array.copy()
+        if out is not None and out.size >= img_array.size:
+            view = out[: img_array.size].reshape(img_array.shape)
+            np.copyto(view, img_array)
+            img_array = view
+        else:
+            img_array = img_array.copy()
 
     return img_array
 
@@ -11,6 +11,7 @@
 
 import json
 import logging
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -94,7 +95,9 @@ class OutputManager:
         寫入 JSON 格式
 
         Args:
-            data: JSON 資料
+            data: JSON 資料；str、bytes 與 dict 以外的可迭代物件（list、tuple、
+                range、generator、dict views 等）會以 JSON 陣列輸出，
+                啟用緩衝寫入時逐項寫出，不需先組成完整 list
             output_path: 輸出路徑（可選）
             indent: 縮排空格數
 
@@ -106,13 +109,19 @@ class OutputManager:
 
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-        if self.use_buffered and isinstance(data, list):
+        is_array = isinstance(data, Iterable) and not isinstance(
+            data, (str, bytes, Mapping)
+        )
+
+        if self.use_buffered and is_array:
             # 使用緩衝寫入器
             with BufferedJSONWriter(output_path, indent=indent) as writer:
                 for item in data:
                     writer.write(item)
         else:
-            # 標準寫入
+            # 標準寫入（json.dump 只能直接序列化 list 與 tuple）
+            if is_array and not isinstance(data, (list, tuple)):
+                data = list(data)
             with open(output_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=indent)
 
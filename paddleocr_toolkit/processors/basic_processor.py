@@ -222,33 +222,39 @@ class BasicProcessor:
             if show_progress and HAS_TQDM:
                 page_iterator = tqdm(page_iterator, desc="處理 PDF", unit="頁", ncols=80)
 
-            for page_num in page_iterator:
-                try:
-                    page = pdf_doc[page_num]
-                    pixmap = page.get_pixmap(dpi=dpi)
-                    img_array = pixmap_to_numpy(pixmap)
-
-                    # 影像前處理
-                    processed_img_array = auto_preprocess(img_array, is_scanned=True)
-
-                    # OCR
-                    ocr_output = self.engine_manager.predict(processed_img_array)
-                    ocr_results = self.result_parser.parse_basic_result(ocr_output)
-
-                    # 加入 PDF
-                    pdf_generator.add_page_from_pixmap(pixmap, ocr_results)
-                    result_summary["pages_processed"] += 1
-
-                except Exception as page_error:
-                    logging.error(f"處理第 {page_num + 1} 頁失敗: {page_error}")
-                    continue
-
-            pdf_doc.close()
-
-            # 儲存 PDF
-            if pdf_generator.save():
-                result_summary["searchable_pdf"] = output_path
-                print(f"[OK] 可搜尋 PDF 已儲存：{output_path}")
+            try:
+                for page_num in page_iterator:
+                    try:
+                        page = pdf_doc[page_num]
+                        pixmap = page.get_pixmap(dpi=dpi)
+                        img_array = pixmap_to_numpy(pixmap)
+
+                        # 影像前處理
+                        processed_img_array = auto_preprocess(
+                            img_array, is_scanned=True
+                        )
+
+                        # OCR
+                        ocr_output = self.engine_manager.predict(processed_img_array)
+                        ocr_results = self.result_parser.parse_basic_result(ocr_output)
+
+                        # 加入 PDF
+                        pdf_generator.add_page_from_pixmap(pixmap, ocr_results)
+                        result_summary["pages_processed"] += 1
+
+                    except Exception as page_error:
+                        logging.error(f"處理第 {page_num + 1} 頁失敗: {page_error}")
+                        continue
+
+                pdf_doc.close()
+
+                # 儲存 PDF
+                if pdf_generator.save():
+                    result_summary["searchable_pdf"] = output_path
+                    print(f"[OK] 可搜尋 PDF 已儲存：{output_path}")
+            finally:
+                # 中途失敗時刪除生成器的暫存檔
+                pdf_generator.close()
 
             return result_summary
 
@@ -8,7 +8,9 @@ PaddleOCR Toolkit - 混合模式 PDF 處理器
 - 生成閱讀順序正確的可搜尋 PDF
 """
 
+import html
 import logging
+import operator
 import shutil
 import tempfile
 import traceback
@@ -23,13 +25,6 @@ from paddleocr_toolkit.utils.logger import logger
 if TYPE_CHECKING:
     from paddleocr_toolkit.core.ocr_engine import OCREngineManager
 
-try:
-    from tqdm import tqdm
-
-    HAS_TQDM = True
-except ImportError:
-    HAS_TQDM = False
-
 from paddleocr_toolkit.core import OCRResult, PDFGenerator
 from paddleocr_toolkit.core.pdf_utils import pixmap_to_numpy
 from paddleocr_toolkit.core.result_parser import OCRResultParser
@@ -37,14 +32,92 @@ from paddleocr_toolkit.processors.pdf_quality import detect_pdf_quality
 from paddleocr_toolkit.processors.stats_collector import StatsCollector
 from paddleocr_toolkit.processors.image_preprocessor import auto_preprocess
 
-# 條件匯入翻譯相關模組
+# JSON 輸出優先使用 orjson（C 實作，較標準 json 快數倍），不可用時退回標準庫
 try:
-    from pdf_translator import TextInpainter
+    import orjson
 
-    HAS_TRANSLATOR = True
+    HAS_ORJSON = True
 except ImportError:
-    HAS_TRANSLATOR = False
-    TextInpainter = None
+    HAS_ORJSON = False
+
+
+def _dumps_json(data: Any) -> bytes:
+    """將資料序列化為 UTF-8 JSON（縮排 2，不跳脫非 ASCII 字元）"""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+    import json
+
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# 選用相依延遲載入：首次使用時才匯入（None 表示尚未嘗試匯入）
+# pdf_translator 會連帶載入 requests 等模組，僅查詢設定或不需擦除版時不必付出此成本
+tqdm = None
+HAS_TQDM: Optional[bool] = None
+TextInpainter = None
+HAS_TRANSLATOR: Optional[bool] = None
+
+
+def _load_tqdm() -> bool:
+    """延遲匯入 tqdm，回傳是否可用"""
+    global tqdm, HAS_TQDM
+    if HAS_TQDM is None:
+        try:
+            from tqdm import tqdm as _tqdm
+
+            tqdm = _tqdm
+            HAS_TQDM = True
+        except ImportError:
+            HAS_TQDM = False
+    return HAS_TQDM
+
+
+def _load_translator() -> bool:
+    """延遲匯入翻譯模組的 TextInpainter，回傳是否可用"""
+    global TextInpainter, HAS_TRANSLATOR
+    if HAS_TRANSLATOR is None:
+        try:
+            from pdf_translator import TextInpainter as _TextInpainter
+
+            TextInpainter = _TextInpainter
+            HAS_TRANSLATOR = True
+        except ImportError:
+            HAS_TRANSLATOR = False
+    return HAS_TRANSLATOR
+
+
+# 快取 markdown 屬性存取器，避免每個結果重複建立 getattr 查詢
+_get_markdown = operator.attrgetter("markdown")
+
+
+def _get_markdown_attr(res) -> Any:
+    """取得結果物件的 markdown 屬性，不存在時回傳 None"""
+    try:
+        return _get_markdown(res)
+    except AttributeError:
+        return None
+
+
+class _PageBuffer:
+    """
+    單次 PDF 處理期間逐頁重複使用的頁面影像緩衝區
+
+    依目前最大的頁面尺寸成長。每次 _process_pdf_internal 呼叫各自建立，
+    同一處理器同時處理多份 PDF 時不會互相覆寫頁面影像。
+    """
+
+    def __init__(self):
+        self._buffer: Optional[np.ndarray] = None
+
+    def get(self, pixmap) -> np.ndarray:
+        """取得足以容納此頁 RGB 影像的緩衝區，必要時擴充"""
+        needed = int(pixmap.width) * int(pixmap.height) * 3
+        if self._buffer is None or self._buffer.size < needed:
+            self._buffer = np.empty(needed, dtype=np.uint8)
+        return self._buffer
 
 
 class HybridPDFProcessor:
@@ -54,6 +127,10 @@ class HybridPDFProcessor:
     結合 PP-StructureV3 版面分析與 PP-OCRv5 精確座標，
     生成閱讀順序正確的可搜尋 PDF。
 
+    處理器（及其引擎管理器）應建立一次並重複用於多個 PDF，
+    避免每份文件都重新載入模型；無法共用同一個管理器時（例如每個工作
+    各自建立），以 reuse_engine=True 建立管理器，改由行程內快取共用引擎。
+
     Attributes:
         engine_manager: OCR 引擎管理器
         result_parser: 結果解析器
@@ -67,8 +144,10 @@ class HybridPDFProcessor:
         >>>
         >>> engine = OCREngineManager(mode="hybrid")
         >>> engine.init_engine()
+        >>> engine.warmup()
         >>> processor = HybridPDFProcessor(engine)
-        >>> result = processor.process_pdf("input.pdf", "output.pdf")
+        >>> for pdf in ["a.pdf", "b.pdf"]:
+        ...     result = processor.process_pdf(pdf)
     """
 
     def __init__(
@@ -180,6 +259,7 @@ class HybridPDFProcessor:
                 show_progress,
                 result_summary,
                 translate_config=translate_config,
+                quality_info=quality,
             )
 
         except Exception as e:
@@ -201,6 +281,7 @@ class HybridPDFProcessor:
         show_progress: bool,
         result_summary: Dict[str, Any],
         translate_config: Optional[Dict[str, Any]] = None,
+        quality_info: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """內部 PDF 處理邏輯"""
 
@@ -227,47 +308,69 @@ class HybridPDFProcessor:
         )
 
         # === 2. 處理所有頁面 ===
+        page_buffer = _PageBuffer()
         page_iterator = range(total_pages)
-        if show_progress and HAS_TQDM:
-            page_iterator = tqdm(page_iterator, desc="混合模式處理中", unit="頁", ncols=80)
-
-        for page_num in page_iterator:
-            try:
-                stats_collector.start_page(page_num)
-                page = pdf_doc[page_num]
-
-                # 處理單頁
-                page_md, page_txt, ocr_res = self._process_single_page(
-                    page, page_num, dpi, pdf_gen, erased_gen, inpainter
-                )
-
-                # 收集結果
-                all_markdown.append(page_md)
-                all_text.append(page_txt)
-                all_ocr_results.append(ocr_res)
-
-                result_summary["pages_processed"] += 1
-
-                # 記錄頁面統計
-                stats_collector.finish_page(
-                    page_num=page_num, text=page_txt, ocr_results=ocr_res
-                )
-
-            except Exception as page_error:
-                logging.error(f"處理第 {page_num + 1} 頁時發生錯誤: {page_error}")
-                logging.error(traceback.format_exc())
-                continue
-
-        pdf_doc.close()
-
-        # === 3. 儲存 PDF ===
-        if pdf_gen.save():
-            result_summary["searchable_pdf"] = output_path
-            logger.info("[OK] Searchable PDF saved: %s", output_path)
+        if show_progress and _load_tqdm():
+            # 限制重繪頻率（每份文件最多約 100 次），避免快速頁面時終端輸出成為瓶頸
+            page_iterator = tqdm(
+                page_iterator,
+                desc="混合模式處理中",
+                unit="頁",
+                ncols=80,
+                miniters=max(1, total_pages // 100),
+                mininterval=0.5,
+                smoothing=0.1,
+            )
 
-        if erased_gen.save():
-            result_summary["erased_pdf"] = erased_path
-            logger.info("[OK] Erased PDF saved: %s", erased_path)
+        try:
+            for page_num in page_iterator:
+                try:
+                    stats_collector.start_page(page_num)
+                    page = pdf_doc[page_num]
+
+                    # 處理單頁
+                    page_md, page_txt, ocr_res = self._process_single_page(
+                        page,
+                        page_num,
+                        dpi,
+                        pdf_gen,
+                        erased_gen,
+                        inpainter,
+                        quality_info=quality_info,
+                        page_buffer=page_buffer,
+                    )
+
+                    # 收集結果
+                    all_markdown.append(page_md)
+                    all_text.append(page_txt)
+                    all_ocr_results.append(ocr_res)
+
+                    result_summary["pages_processed"] += 1
+
+                    # 記錄頁面統計
+                    stats_collector.finish_page(
+                        page_num=page_num, text=page_txt, ocr_results=ocr_res
+                    )
+
+                except Exception as page_error:
+                    logging.error(f"處理第 {page_num + 1} 頁時發生錯誤: {page_error}")
+                    logging.error(traceback.format_exc())
+                    continue
+
+            pdf_doc.close()
+
+            # === 3. 儲存 PDF ===
+            if pdf_gen.save():
+                result_summary["searchable_pdf"] = output_path
+                logger.info("[OK] Searchable PDF saved: %s", output_path)
+
+            if erased_gen.save():
+                result_summary["erased_pdf"] = erased_path
+                logger.info("[OK] Erased PDF saved: %s", erased_path)
+        finally:
+            # 中途失敗時刪除生成器的暫存檔（已儲存者不受影響）
+            pdf_gen.close()
+            erased_gen.close()
 
         # === 4. 儲存其他輸出 ===
         self._save_outputs(
@@ -285,7 +388,7 @@ class HybridPDFProcessor:
         # === 5. 翻譯處理（如果啟用）===
         # 注意：翻譯功能需要 pdf_translator 套件
         # 如需使用，請安裝： pip install pdf-translator
-        if translate_config and HAS_TRANSLATOR:
+        if translate_config and _load_translator():
             if self.debug_mode:
                 logging.info("偵錯模式已啟用，跳過翻譯處理")
             else:
@@ -326,7 +429,7 @@ class HybridPDFProcessor:
         )
 
         # 擦除器
-        inpainter = TextInpainter() if HAS_TRANSLATOR else None
+        inpainter = TextInpainter() if _load_translator() else None
 
         logging.info(
             f"[DEBUG] PDFGenerator compress_images={pdf_generator.compress_images}, "
@@ -343,6 +446,8 @@ class HybridPDFProcessor:
         pdf_generator: PDFGenerator,
         erased_generator: PDFGenerator,
         inpainter: Optional[Any],
+        quality_info: Optional[Dict[str, Any]] = None,
+        page_buffer: Optional[_PageBuffer] = None,
     ) -> Tuple[str, str, List[OCRResult]]:
         """
         處理單一頁面（混合模式）
@@ -354,16 +459,24 @@ class HybridPDFProcessor:
             pdf_generator: PDF 生成器
             erased_generator: 擦除版生成器
             inpainter: 文字擦除器
+            quality_info: detect_pdf_quality 的偵測結果（可選）；
+                判定為清晰的數位 PDF 時跳過影像前處理
+            page_buffer: 本次 PDF 處理專用的頁面緩衝區（可選）；
+                未提供時每頁配置新陣列
 
         Returns:
             Tuple[str, str, List[OCRResult]]: (Markdown, 純文字, OCR結果)
         """
-        # 1. 轉換頁面為圖片
+        # 1. 轉換頁面為圖片（使用緩衝區時僅在本頁處理期間有效）
         pixmap = page.get_pixmap(dpi=dpi)
-        img_array = pixmap_to_numpy(pixmap)
+        out = page_buffer.get(pixmap) if page_buffer is not None else None
+        img_array = pixmap_to_numpy(pixmap, out=out)
 
-        # 2. 影像前處理 + 執行 OCR
-        processed_img_array = auto_preprocess(img_array, is_scanned=True)
+        # 2. 影像前處理 + 執行 OCR（清晰的數位頁面直接使用原圖）
+        if self._needs_preprocess(quality_info):
+            processed_img_array = auto_preprocess(img_array, is_scanned=True)
+        else:
+            processed_img_array = img_array
         structure_output = self.engine_manager.predict(processed_img_array)
 
         # 3. 提取並合併結果
@@ -381,6 +494,13 @@ class HybridPDFProcessor:
 
         return page_markdown, page_text, ocr_results
 
+    @staticmethod
+    def _needs_preprocess(quality_info: Optional[Dict[str, Any]]) -> bool:
+        """判斷頁面是否需要影像前處理（未提供品質資訊時保守地處理）"""
+        if quality_info is None:
+            return True
+        return bool(quality_info.get("is_scanned") or quality_info.get("is_blurry"))
+
     def _extract_and_merge_results(
         self, structure_output, page_num: int
     ) -> Tuple[List[OCRResult], str]:
@@ -420,7 +540,12 @@ class HybridPDFProcessor:
 
     def _extract_markdown_from_result(self, res) -> Optional[str]:
         """從單個 Structure 結果提取 Markdown"""
-        # 方法 1: 使用 save_to_markdown
+        # 方法 1: 直接使用字串型別的 markdown 屬性（不需經過暫存檔）
+        markdown = _get_markdown_attr(res)
+        if isinstance(markdown, str):
+            return markdown
+
+        # 方法 2: 使用 save_to_markdown
         temp_md_dir = tempfile.mkdtemp()
         try:
             if hasattr(res, "save_to_markdown"):
@@ -433,10 +558,6 @@ class HybridPDFProcessor:
         finally:
             shutil.rmtree(temp_md_dir, ignore_errors=True)
 
-        # 方法 2: 使用 markdown 屬性
-        if hasattr(res, "markdown") and isinstance(res.markdown, str):
-            return res.markdown
-
         return None
 
     def _generate_dual_pdfs(
@@ -449,11 +570,19 @@ class HybridPDFProcessor:
         inpainter: Optional[Any],
     ) -> None:
         """生成原文 PDF 和擦除版 PDF"""
+        # 壓縮模式下只編碼一次 JPEG，供兩個生成器共用
+        jpeg_data = None
+        if self.compress_images:
+            try:
+                jpeg_data = pdf_generator.encode_jpeg(pixmap)
+            except Exception as e:
+                logging.warning(f"JPEG 編碼失敗，改用 pixmap: {e}")
+
         # 1. 生成原文可搜尋 PDF
-        pdf_generator.add_page_from_pixmap(pixmap, ocr_results)
+        self._add_original_page(pdf_generator, pixmap, jpeg_data, ocr_results)
 
-        # 2. 生成擦除版 PDF（如果有 inpainter）
-        if inpainter and HAS_TRANSLATOR:
+        # 2. 生成擦除版 PDF（如果有 inpainter 且頁面有文字區域；空白頁無需擦除）
+        if inpainter and ocr_results and _load_translator():
             try:
                 erased_image = inpainter.inpaint_text_regions(
                     img_array, [r.bbox for r in ocr_results]
@@ -461,9 +590,26 @@ class HybridPDFProcessor:
                 erased_generator.add_page_from_array(erased_image, ocr_results)
             except Exception as e:
                 logging.warning(f"文字擦除失敗: {e}")
-                erased_generator.add_page_from_pixmap(pixmap, ocr_results)
+                self._add_original_page(
+                    erased_generator, pixmap, jpeg_data, ocr_results
+                )
         else:
-            erased_generator.add_page_from_pixmap(pixmap, ocr_results)
+            self._add_original_page(erased_generator, pixmap, jpeg_data, ocr_results)
+
+    @staticmethod
+    def _add_original_page(
+        generator: PDFGenerator,
+        pixmap,
+        jpeg_data: Optional[bytes],
+        ocr_results: List[OCRResult],
+    ) -> None:
+        """以原始頁面圖片新增一頁（有預先編碼的 JPEG 時直接重用）"""
+        if jpeg_data is not None:
+            generator.add_page_from_jpeg_bytes(
+                jpeg_data, pixmap.width, pixmap.height, ocr_results
+            )
+        else:
+            generator.add_page_from_pixmap(pixmap, ocr_results)
 
     def _save_outputs(
         self,
@@ -486,8 +632,6 @@ class HybridPDFProcessor:
 
         # 儲存 JSON
         if json_output:
-            import json
-
             try:
                 # 將 OCR 結果轉換為可序列化格式
                 json_data = {
@@ -509,8 +653,8 @@ class HybridPDFProcessor:
                     ],
                 }
 
-                with open(json_output, "w", encoding="utf-8") as f:
-                    json.dump(json_data, f, ensure_ascii=False, indent=2)
+                with open(json_output, "wb") as f:
+                    f.write(_dumps_json(json_data))
                 result_summary["json_file"] = json_output
                 logger.info("[OK] JSON saved: %s", json_output)
             except Exception as e:
@@ -519,14 +663,16 @@ class HybridPDFProcessor:
         # 儲存 HTML
         if html_output:
             try:
-                # 建立簡單的 HTML 輸出
+                # 建立簡單的 HTML 輸出（所有片段收集後一次 join，文字只跳脫一次）
+                esc = html.escape
+                title = esc(Path(pdf_path).name)
                 html_content = [
                     "<!DOCTYPE html>",
                     '<html lang="zh-TW">',
                     "<head>",
                     '    <meta charset="UTF-8">',
                     '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
-                    f"    <title>OCR 結果 - {Path(pdf_path).name}</title>",
+                    f"    <title>OCR 結果 - {title}</title>",
                     "    <style>",
                     "        body { font-family: 'Microsoft JhengHei', sans-serif; max-width: 900px; "
                     "margin: 40px auto; padding: 20px; line-height: 1.8; }",
@@ -540,23 +686,23 @@ class HybridPDFProcessor:
                     "    </style>",
                     "</head>",
                     "<body>",
-                    f"    <h1>OCR 識別結果: {Path(pdf_path).name}</h1>",
+                    f"    <h1>OCR 識別結果: {title}</h1>",
                 ]
 
                 # 加入每頁內容
+                append = html_content.append
                 for i, markdown in enumerate(all_markdown):
-                    html_content.append(f'    <div class="page">')
-                    html_content.append(f"        <h2>第 {i + 1} 頁</h2>")
+                    append('    <div class="page">')
+                    append(f"        <h2>第 {i + 1} 頁</h2>")
 
                     # 將 Markdown 轉換為 HTML (簡單處理)
-                    lines = markdown.split("\n")
-                    for line in lines:
-                        if line.strip():
-                            html_content.append(
-                                f'        <div class="text-block">{line}</div>'
-                            )
-
-                    html_content.append("    </div>")
+                    html_content.extend(
+                        f'        <div class="text-block">{esc(line)}</div>'
+                        for line in markdown.split("\n")
+                        if line.strip()
+                    )
+
+                    append("    </div>")
 
                 html_content.extend(["</body>", "</html>"])
 
@@ -215,7 +215,8 @@ def preprocess_for_ocr(
     Returns:
         預處理後的圖片
     """
-    result = image.copy()
+    # 各步驟皆回傳新陣列，不需預先複製輸入
+    result = image
 
     # 1. 傾斜校正（最先做）
     if deskew_img:
@@ -237,6 +238,10 @@ def preprocess_for_ocr(
     if sharpen_img:
         result = sharpen(result)
 
+    # 沒有任何步驟產生新陣列時，仍回傳副本以免呼叫端修改到原圖
+    if result is image:
+        result = image.copy()
+
     return result
 
 
@@ -74,10 +74,10 @@ class ParallelPDFProcessor:
         from paddleocr_toolkit.core.ocr_engine import OCREngineManager
 
         try:
-            # 建立臨時引擎（進程內）
-            # 註：在進程池中頻繁初始化引擎會耗時，
-            # 實際生產環境建議使用進程初始化 (initializer) 保持引擎常駐
-            engine = OCREngineManager(**ocr_config)
+            # 建立引擎管理器（進程內）
+            # 註：reuse_engine 讓底層引擎由 ocr_engine 的行程快取保存，
+            # 同一工作進程處理後續頁面時不會重新載入模型
+            engine = OCREngineManager(reuse_engine=True, **ocr_config)
             engine.init_engine()
 
             # 執行識別
@@ -205,11 +205,15 @@ class ParallelPDFProcessor:
         logger.info("-" * 30)
 
 
-if __name__ == "__main__":
-    # 測試腳本
+def _main() -> None:
+    """測試腳本：以 example.pdf 執行效能測試"""
     test_pdf = "example.pdf"
     if os.path.exists(test_pdf):
         processor = ParallelPDFProcessor()
         processor.benchmark(test_pdf)
     else:
         logger.warning("Please provide a test PDF file to run benchmark")
+
+
+if __name__ == "__main__":
+    _main()
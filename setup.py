@@ -45,6 +45,7 @@ setup(
         "dev": [
             "pytest>=7.4.3",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
             "black>=23.12.1",
             "isort>=5.13.2",
             "mypy>=1.7.1",
@@ -62,9 +63,17 @@ setup(
             "python-docx>=1.1.0",
             "openpyxl>=3.1.0",
         ],
+        "fast-json": [
+            "orjson>=3.8.0",
+        ],
+        "cache": [
+            "zstandard>=0.21.0",
+        ],
         "all": [
             "rich>=14.2.0",
             "psutil>=5.9.0",
+            "orjson>=3.8.0",
+            "zstandard>=0.21.0",
             "wordninja>=2.0.0",
             "fastapi>=0.104.0",
             "uvicorn[standard]>=0.24.0",
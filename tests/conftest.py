@@ -21,6 +21,120 @@ except ImportError:
     sys.modules["paddleocr"] = mock_paddle
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _limit_opencv_threads():
+    """
+    停用 OpenCV 內部執行緒池
+
+    測試圖片很小，執行緒池啟動與同步的成本高於實際運算；
+    平行化交給 pytest-xdist 的 worker 行程，也避免與其搶佔 CPU。
+    """
+    try:
+        import cv2
+    except ImportError:
+        yield
+        return
+
+    previous = cv2.getNumThreads()
+    cv2.setNumThreads(0)
+    yield
+    cv2.setNumThreads(previous)
+
+
+# 影像預處理的測試集中在 tests/test_image_preprocessor.py 單一檔案：
+# 搭配 --dist=loadfile，cv2 與 image_preprocessor 在每個 worker 只匯入一次，
+# 請勿再拆成多個測試檔。
+#
+# 共用測試圖片尺寸：預處理函式與圖片大小無關，小圖即可涵蓋所有分支
+TEST_IMAGE_SIZE = (16, 16)
+
+
+def _readonly(array):
+    """將陣列設為唯讀，避免 session 共用的圖片被測試意外修改"""
+    array.setflags(write=False)
+    return array
+
+
+@pytest.fixture(scope="session")
+def gray128():
+    """灰階圖片，像素值皆為 128（唯讀，需要修改時請 .copy()）"""
+    import numpy as np
+
+    return _readonly(np.full(TEST_IMAGE_SIZE, 128, dtype=np.uint8))
+
+
+@pytest.fixture(scope="session")
+def rgb128():
+    """彩色圖片，像素值皆為 128（唯讀，需要修改時請 .copy()）"""
+    import numpy as np
+
+    return _readonly(np.full(TEST_IMAGE_SIZE + (3,), 128, dtype=np.uint8))
+
+
+@pytest.fixture(scope="session")
+def gradient_gray():
+    """灰階漸層圖片，像素值 0 到 255（唯讀）"""
+    import numpy as np
+
+    height, width = TEST_IMAGE_SIZE
+    count = height * width
+    # 純整數運算產生 0..255 漸層，不需 linspace 的 float64 暫存陣列
+    gradient = (np.arange(count, dtype=np.uint32) * 255 // (count - 1)).astype(np.uint8)
+    return _readonly(gradient.reshape(TEST_IMAGE_SIZE))
+
+
+@pytest.fixture(scope="session")
+def bimodal_gray():
+    """灰階圖片，上半部 100、下半部 200（唯讀）"""
+    import numpy as np
+
+    image = np.full(TEST_IMAGE_SIZE, 100, dtype=np.uint8)
+    image[TEST_IMAGE_SIZE[0] // 2 :, :] = 200
+    return _readonly(image)
+
+
+@pytest.fixture(scope="session")
+def noisy_rgb():
+    """固定亂數種子的彩色雜訊圖片，像素值 100 到 149（唯讀）"""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    return _readonly(rng.integers(100, 150, TEST_IMAGE_SIZE + (3,), dtype=np.uint8))
+
+
+@pytest.fixture(scope="session")
+def noisy_gray():
+    """固定亂數種子的灰階雜訊圖片，像素值 100 到 149（唯讀）"""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    return _readonly(rng.integers(100, 150, TEST_IMAGE_SIZE, dtype=np.uint8))
+
+
+@pytest.fixture(scope="session")
+def output_manager_module():
+    """只匯入一次的 paddleocr_toolkit.outputs.output_manager 模組"""
+    import paddleocr_toolkit.outputs.output_manager as output_manager
+
+    return output_manager
+
+
+@pytest.fixture
+def mock_get(monkeypatch):
+    """以 Mock 取代 requests.get（LLM 客戶端測試用）"""
+    mock = MagicMock()
+    monkeypatch.setattr("requests.get", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_post(monkeypatch):
+    """以 Mock 取代 requests.post（LLM 客戶端測試用）"""
+    mock = MagicMock()
+    monkeypatch.setattr("requests.post", mock)
+    return mock
+
+
 @pytest.fixture
 def mock_ocr_engine():
     """Mock OCR engine for testing"""
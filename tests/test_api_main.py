@@ -2,7 +2,6 @@
 """
 API Main Integration Tests - Cleaned up for router refactoring
 """
-import os
 import sys
 import asyncio
 import pytest
@@ -20,9 +19,6 @@ except ImportError:
 
 from fastapi.testclient import TestClient
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 
 @pytest.fixture
 def client_fixture():
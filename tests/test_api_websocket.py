@@ -4,21 +4,29 @@ API WebSocket 整合測試
 """
 
 import asyncio
-import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
-# 確保可以匯入模組
-sys.path.append(".")
-
+import paddleocr_toolkit.api.main as api_main
 from paddleocr_toolkit.api.main import app, results, tasks
+from paddleocr_toolkit.api.routers import ocr as ocr_router
 from paddleocr_toolkit.api.websocket_manager import manager
+from paddleocr_toolkit.core.ocr_cache import OCRCache
 
 
 @pytest.fixture
-def client():
+def client(tmp_path, monkeypatch):
+    # 上傳檔與結果快取導向各測試的暫存目錄，平行 worker 不會共用專案下的 uploads/、cache/
+    upload_dir = tmp_path / "uploads"
+    cache = OCRCache(str(tmp_path / "cache"))
+    monkeypatch.setattr(api_main, "UPLOAD_DIR", upload_dir)
+    monkeypatch.setattr(api_main, "ocr_cache", cache)
+    # startup 會把上述設定注入路由模組；一併登記以便測試結束後還原
+    monkeypatch.setattr(ocr_router, "UPLOAD_DIR", upload_dir)
+    monkeypatch.setattr(ocr_router, "ocr_cache", cache)
+
     with TestClient(app) as c:
         yield c
 
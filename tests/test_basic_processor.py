@@ -3,7 +3,6 @@
 測試 BasicProcessor
 """
 
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -153,7 +152,9 @@ class TestBasicProcessorProcessPDF:
 
     @patch("paddleocr_toolkit.processors.basic_processor.fitz")
     @patch("paddleocr_toolkit.processors.basic_processor.PDFGenerator")
-    def test_process_pdf_basic(self, mock_pdf_gen_class, mock_fitz, processor):
+    def test_process_pdf_basic(
+        self, mock_pdf_gen_class, mock_fitz, processor, tmp_path
+    ):
         """測試基本 PDF 處理"""
         # Mock PDF
         mock_pdf = MagicMock()
@@ -174,24 +175,17 @@ class TestBasicProcessorProcessPDF:
         processor.result_parser = Mock()
         processor.result_parser.parse_basic_result.return_value = []
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            pdf_path = tmp.name
+        pdf_path = str(tmp_path / "test.pdf")
 
-        try:
-            with patch(
-                "paddleocr_toolkit.processors.basic_processor.pixmap_to_numpy"
-            ) as mock_p2n:
-                mock_p2n.return_value = np.zeros((100, 100, 3), dtype=np.uint8)
-                result = processor.process_pdf(pdf_path, show_progress=False)
+        with patch(
+            "paddleocr_toolkit.processors.basic_processor.pixmap_to_numpy"
+        ) as mock_p2n:
+            mock_p2n.return_value = np.zeros((100, 100, 3), dtype=np.uint8)
+            result = processor.process_pdf(pdf_path, show_progress=False)
 
-                assert result["mode"] == "basic"
-                assert result["pages_processed"] == 1
-                assert result["searchable_pdf"] is not None
-        finally:
-            import os
-
-            if os.path.exists(pdf_path):
-                os.remove(pdf_path)
+            assert result["mode"] == "basic"
+            assert result["pages_processed"] == 1
+            assert result["searchable_pdf"] is not None
 
 
 class TestBasicProcessorUtilityMethods:
@@ -5,7 +5,6 @@ Batch Processor 單元測試（整合版）
 
 import os
 import sys
-import tempfile
 import time
 import importlib
 import builtins
@@ -14,9 +13,6 @@ import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 
-# 新增專案路徑
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 try:
     import fitz
 
@@ -290,81 +286,63 @@ class TestPdfToImagesParallel:
     """測試 pdf_to_images_parallel"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_convert_pdf(self):
+    def test_convert_pdf(self, tmp_path):
         """測試轉換 PDF"""
         # 建立測試 PDF
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            doc = fitz.open()
-            for i in range(3):
-                page = doc.new_page(width=100, height=100)
-                page.insert_text((10, 50), f"Page {i+1}")
-            doc.save(temp_path)
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            results = pdf_to_images_parallel(temp_path, dpi=72)
+        doc = fitz.open()
+        for i in range(3):
+            page = doc.new_page(width=100, height=100)
+            page.insert_text((10, 50), f"Page {i+1}")
+        doc.save(temp_path)
+        doc.close()
 
-            assert len(results) == 3
-            assert all(isinstance(r, tuple) for r in results)
-            assert all(len(r) == 2 for r in results)
+        results = pdf_to_images_parallel(temp_path, dpi=72)
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert len(results) == 3
+        assert all(isinstance(r, tuple) for r in results)
+        assert all(len(r) == 2 for r in results)
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_convert_specific_pages(self):
+    def test_convert_specific_pages(self, tmp_path):
         """測試轉換指定頁面"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            doc = fitz.open()
-            for i in range(5):
-                doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            results = pdf_to_images_parallel(temp_path, pages=[0, 2, 4])
+        doc = fitz.open()
+        for i in range(5):
+            doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-            assert len(results) == 3
-            page_nums = [r[0] for r in results]
-            assert 0 in page_nums
-            assert 2 in page_nums
-            assert 4 in page_nums
+        results = pdf_to_images_parallel(temp_path, pages=[0, 2, 4])
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert len(results) == 3
+        page_nums = [r[0] for r in results]
+        assert 0 in page_nums
+        assert 2 in page_nums
+        assert 4 in page_nums
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_with_progress_callback(self):
+    def test_with_progress_callback(self, tmp_path):
         """測試進度回撥"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            doc = fitz.open()
-            for i in range(3):
-                doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            progress_calls = []
+        doc = fitz.open()
+        for i in range(3):
+            doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-            def on_progress(current, total):
-                progress_calls.append((current, total))
+        progress_calls = []
 
-            results = pdf_to_images_parallel(temp_path, progress_callback=on_progress)
+        def on_progress(current, total):
+            progress_calls.append((current, total))
 
-            assert len(results) == 3
-            assert len(progress_calls) == 3
+        results = pdf_to_images_parallel(temp_path, progress_callback=on_progress)
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert len(results) == 3
+        assert len(progress_calls) == 3
 
     def test_pdf_to_images_parallel_exceptions(self):
         """Cover lines 102-104 (Exception inside thread loop)"""
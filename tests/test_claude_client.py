@@ -4,7 +4,7 @@
 """
 
 import sys
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -24,8 +24,9 @@ from paddleocr_toolkit.llm.llm_client import ClaudeClient, create_llm_client
 class TestClaudeClient:
     """測試 ClaudeClient 類別"""
 
-    @pytest.fixture
-    def client(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls):
         return ClaudeClient(api_key="test_key", model="claude-test")
 
     def test_init(self, client):
@@ -34,7 +35,6 @@ class TestClaudeClient:
         assert client.model == "claude-test"
         assert "anthropic.com" in client.base_url
 
-    @patch("requests.post")
     def test_is_available_success(self, mock_post, client):
         """測試可用性檢查 (成功)"""
         mock_response = Mock()
@@ -47,7 +47,6 @@ class TestClaudeClient:
         args, kwargs = mock_post.call_args
         assert kwargs["headers"]["x-api-key"] == "test_key"
 
-    @patch("requests.post")
     def test_is_available_failure(self, mock_post, client):
         """測試可用性檢查 (失敗 - 401)"""
         mock_response = Mock()
@@ -56,7 +55,6 @@ class TestClaudeClient:
 
         assert client.is_available() is False
 
-    @patch("requests.post")
     def test_generate_success(self, mock_post, client):
         """測試生成文字 (成功)"""
         mock_response = Mock()
@@ -75,7 +73,6 @@ class TestClaudeClient:
         assert payload["messages"][0]["content"] == "Hi"
         assert payload["model"] == "claude-test"
 
-    @patch("requests.post")
     def test_generate_error_format(self, mock_post, client):
         """測試生成文字 (格式錯誤)"""
         mock_response = Mock()
@@ -86,7 +83,6 @@ class TestClaudeClient:
         result = client.generate("Hi")
         assert result == ""
 
-    @patch("requests.post")
     def test_generate_http_error(self, mock_post, client):
         """測試生成文字 (HTTP 錯誤)"""
         mock_response = Mock()
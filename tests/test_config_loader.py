@@ -5,14 +5,10 @@
 
 import argparse
 import os
-import sys
 import tempfile
 
 import pytest
 
-# 新增專案路徑
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from paddleocr_toolkit.core.config_loader import (
     DEFAULT_CONFIG,
     apply_config_to_args,
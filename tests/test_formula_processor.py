@@ -3,8 +3,6 @@
 測試 FormulaProcessor
 """
 
-import tempfile
-import os
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -87,7 +85,7 @@ class TestFormulaProcessorProcessPDF:
         return FormulaProcessor(mock_engine)
 
     @patch("paddleocr_toolkit.processors.formula_processor.fitz")
-    def test_process_pdf_formula(self, mock_fitz, processor):
+    def test_process_pdf_formula(self, mock_fitz, processor, tmp_path):
         """測試 PDF 公式識別"""
         # Mock PDF
         mock_pdf = MagicMock()
@@ -102,24 +100,17 @@ class TestFormulaProcessorProcessPDF:
         mock_output = [([[0, 0], [10, 0], [10, 10], [0, 10]], "\\alpha + \\beta", 0.95)]
         processor.engine_manager.predict = Mock(return_value=mock_output)
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            pdf_path = tmp.name
+        pdf_path = str(tmp_path / "test.pdf")
 
-        try:
-            with patch(
-                "paddleocr_toolkit.processors.formula_processor.pixmap_to_numpy"
-            ):
-                result = processor.process_pdf(pdf_path, show_progress=False)
+        with patch("paddleocr_toolkit.processors.formula_processor.pixmap_to_numpy"):
+            result = processor.process_pdf(pdf_path, show_progress=False)
 
-                assert result["pages_processed"] == 1
-                assert result["total_formulas"] == 1
-                assert (
-                    result["formulas_by_page"][0]["formulas"][0]["latex"]
-                    == "\\alpha + \\beta"
-                )
-        finally:
-            if os.path.exists(pdf_path):
-                os.remove(pdf_path)
+            assert result["pages_processed"] == 1
+            assert result["total_formulas"] == 1
+            assert (
+                result["formulas_by_page"][0]["formulas"][0]["latex"]
+                == "\\alpha + \\beta"
+            )
 
 
 class TestFormulaProcessorUtility:
@@ -141,21 +132,16 @@ class TestFormulaProcessorUtility:
         text = processor.extract_formulas_text(formulas)
         assert text == "a+b=c\n\nE=mc^2"
 
-    def test_save_latex(self, processor):
+    def test_save_latex(self, processor, tmp_path):
         """測試儲存 LaTeX 檔案"""
         formulas_by_page = [{"page": 1, "formulas": [{"latex": "x=1"}]}]
 
-        with tempfile.NamedTemporaryFile(suffix=".tex", delete=False) as tmp:
-            tex_path = tmp.name
-
-        try:
-            processor._save_latex(formulas_by_page, tex_path)
-            content = Path(tex_path).read_text(encoding="utf-8")
-            assert "x=1" in content
-            assert "第 1 頁" in content
-        finally:
-            if os.path.exists(tex_path):
-                os.remove(tex_path)
+        tex_path = str(tmp_path / "test.tex")
+
+        processor._save_latex(formulas_by_page, tex_path)
+        content = Path(tex_path).read_text(encoding="utf-8")
+        assert "x=1" in content
+        assert "第 1 頁" in content
 
 
 # Added from Ultra Coverage
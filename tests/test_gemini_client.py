@@ -4,7 +4,7 @@
 """
 
 import sys
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -32,7 +32,6 @@ class TestGeminiClient:
         assert "key=test-key" in client.api_url
         assert "gemini-3-flash" in client.api_url
 
-    @patch("requests.get")
     def test_is_available_success(self, mock_get):
         """測試可用性檢查成功"""
         mock_response = Mock()
@@ -43,7 +42,6 @@ class TestGeminiClient:
         assert client.is_available() is True
         mock_get.assert_called_once()
 
-    @patch("requests.get")
     def test_is_available_failure(self, mock_get):
         """測試可用性檢查失敗"""
         mock_response = Mock()
@@ -53,7 +51,6 @@ class TestGeminiClient:
         client = GeminiClient(api_key="invalid-key")
         assert client.is_available() is False
 
-    @patch("requests.post")
     def test_generate_success(self, mock_post):
         """測試生成文字成功"""
         mock_response = Mock()
@@ -71,7 +68,6 @@ class TestGeminiClient:
         args, kwargs = mock_post.call_args
         assert kwargs["json"]["contents"][0]["parts"][0]["text"] == "Say hello"
 
-    @patch("requests.post")
     def test_generate_error_format(self, mock_post):
         """測試錯誤回應格式處理"""
         mock_response = Mock()
@@ -84,7 +80,6 @@ class TestGeminiClient:
 
         assert result == ""
 
-    @patch("requests.post")
     def test_generate_http_error(self, mock_post):
         """測試 HTTP 錯誤處理"""
         mock_response = Mock()
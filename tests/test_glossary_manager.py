@@ -5,14 +5,10 @@ Glossary Manager 單元測試
 
 import csv
 import os
-import sys
 import tempfile
 
 import pytest
 
-# 新增專案路徑
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from paddleocr_toolkit.processors.glossary_manager import (
     GlossaryEntry,
     GlossaryManager,
@@ -3,15 +3,11 @@
 Image Preprocessor 單元測試（擴充套件版）
 """
 
-import os
-import sys
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 
-# 新增專案路徑
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 try:
     import cv2
 
@@ -19,6 +15,9 @@ try:
 except ImportError:
     HAS_CV2 = False
 
+# 需要 OpenCV 的測試類別統一以此標記，缺少 cv2 時整個類別一次略過
+requires_cv2 = pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
+
 from paddleocr_toolkit.processors.image_preprocessor import (
     auto_preprocess,
     binarize,
@@ -26,170 +25,161 @@ from paddleocr_toolkit.processors.image_preprocessor import (
     deskew,
     enhance_contrast,
     preprocess_for_ocr,
+    resize_image_if_needed,
     sharpen,
 )
 
+# 與圖片大小無關的測試使用小圖；deskew 的畫線測試需要足夠解析度才保留 100x100
+SIZE = (16, 16)
+DESKEW_SIZE = (100, 100)
 
-class TestEnhanceContrast:
-    """測試對比度增強"""
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_basic_enhance(self):
-        """測試基本對比度增強"""
-        image = np.ones((100, 100), dtype=np.uint8) * 128
+def _line_canvas(shape, start, end, color):
+    """建立白底唯讀圖片，指定 color 時畫一條線（deskew 不會修改輸入）"""
+    image = np.full(shape, 255, dtype=np.uint8)
+    if color is not None:
+        cv2.line(image, start, end, color, 2)
+    image.setflags(write=False)
+    return image
 
-        result = enhance_contrast(image, clip_limit=1.5)
 
-        assert result.shape == image.shape
-        assert result.dtype == np.uint8
+@pytest.fixture(scope="module")
+def skewed_rgb():
+    """白底 RGB 圖片，含一條 45 度斜線"""
+    return _line_canvas(DESKEW_SIZE + (3,), (10, 10), (90, 90), (0, 0, 0))
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_rgb_enhance(self):
-        """測試 RGB 圖片增強"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
 
-        result = enhance_contrast(image, clip_limit=1.2)
+@pytest.fixture(scope="module")
+def skewed_gray():
+    """白底灰階圖片，含一條 45 度斜線"""
+    return _line_canvas(DESKEW_SIZE, (10, 10), (90, 90), 0)
 
-        assert result.shape == image.shape
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_with_tile_size(self):
-        """測試不同 tile size"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
+@pytest.fixture(scope="module")
+def horizontal_rgb():
+    """白底 RGB 圖片，含一條水平線"""
+    return _line_canvas(DESKEW_SIZE + (3,), (10, 50), (90, 50), (0, 0, 0))
 
-        result = enhance_contrast(image, clip_limit=2.0, tile_size=16)
-
-        assert result.shape == image.shape
 
+@pytest.fixture(scope="module")
+def blank_rgb():
+    """純白 RGB 圖片，沒有任何線條"""
+    return _line_canvas(DESKEW_SIZE + (3,), None, None, None)
 
-class TestBinarize:
-    """測試二值化"""
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_simple_binarize(self):
-        """測試簡單二值化"""
-        image = np.linspace(0, 255, 100 * 100, dtype=np.uint8).reshape(100, 100)
-
-        result = binarize(image, method="simple")
-
-        assert result is not None
-        assert result.dtype == np.uint8
+@requires_cv2
+class TestEnhanceContrast:
+    """測試對比度增強"""
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_adaptive_threshold(self):
-        """測試自適應閾值"""
-        image = np.ones((100, 100), dtype=np.uint8) * 128
-        image[50:, :] = 200
+    @pytest.mark.parametrize(
+        "image_fixture,clip_limit,tile_size",
+        [
+            ("gray128", 1.5, 8),  # 基本對比度增強
+            ("rgb128", 1.2, 8),  # RGB 圖片增強
+            ("rgb128", 2.0, 16),  # 不同 tile size
+        ],
+    )
+    def test_enhance(self, request, image_fixture, clip_limit, tile_size):
+        """測試對比度增強"""
+        image = request.getfixturevalue(image_fixture)
 
-        result = binarize(image, method="adaptive")
+        result = enhance_contrast(image, clip_limit=clip_limit, tile_size=tile_size)
 
+        assert result.shape == image.shape
         assert result.dtype == np.uint8
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_otsu_threshold(self):
-        """測試 Otsu 閾值"""
-        image = np.ones((100, 100), dtype=np.uint8) * 100
-        image[50:, :] = 200
 
-        result = binarize(image, method="otsu")
+@requires_cv2
+class TestBinarize:
+    """測試二值化"""
 
+    @pytest.mark.parametrize(
+        "image_fixture,method",
+        [
+            ("gradient_gray", "simple"),  # 簡單二值化
+            ("bimodal_gray", "adaptive"),  # 自適應閾值
+            ("bimodal_gray", "otsu"),  # Otsu 閾值
+            ("rgb128", "simple"),  # RGB 圖片二值化
+        ],
+    )
+    def test_binarize(self, request, image_fixture, method):
+        """測試二值化"""
+        image = request.getfixturevalue(image_fixture)
+
+        result = binarize(image, method=method)
+
+        # 二值化結果一律轉回 BGR
+        assert result.shape == image.shape[:2] + (3,)
         assert result.dtype == np.uint8
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_binarize_rgb(self):
-        """測試 RGB 圖片二值化"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
-
-        result = binarize(image, method="simple")
-
-        assert result is not None
-
 
+@requires_cv2
 class TestSharpen:
     """測試銳化"""
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_basic_sharpen(self):
-        """測試基本銳化"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
+    @pytest.mark.parametrize(
+        "image_fixture,strength",
+        [
+            ("rgb128", 1.0),  # 基本銳化
+            ("gray128", 1.0),  # 灰階圖片銳化
+            ("rgb128", 2.0),  # 銳化強度
+        ],
+    )
+    def test_sharpen(self, request, image_fixture, strength):
+        """測試銳化"""
+        image = request.getfixturevalue(image_fixture)
 
-        result = sharpen(image)
+        result = sharpen(image, strength=strength)
 
         assert result.shape == image.shape
         assert result.dtype == np.uint8
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_grayscale_sharpen(self):
-        """測試灰階圖片銳化"""
-        image = np.ones((100, 100), dtype=np.uint8) * 128
-
-        result = sharpen(image)
-
-        assert result.shape == image.shape
-
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_sharpen_strength(self):
-        """測試銳化強度"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
-
-        result = sharpen(image, strength=2.0)
-
-        assert result.shape == image.shape
-
 
+@requires_cv2
 class TestDenoise:
     """測試去噪"""
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_basic_denoise(self):
+    def test_basic_denoise(self, noisy_rgb):
         """測試基本去噪"""
-        image = np.random.randint(100, 150, (50, 50, 3), dtype=np.uint8)
+        image = noisy_rgb
 
         result = denoise(image, strength=5)
 
         assert result.shape == image.shape
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_grayscale_denoise(self):
+    def test_grayscale_denoise(self, noisy_gray):
         """測試灰階去噪"""
-        image = np.random.randint(100, 150, (50, 50), dtype=np.uint8)
+        image = noisy_gray
 
         result = denoise(image, strength=5)
 
         assert result.shape == image.shape
 
 
+@requires_cv2
 class TestDeskew:
     """測試傾斜校正"""
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_basic_deskew(self):
+    def test_basic_deskew(self, skewed_rgb):
         """測試基本傾斜校正"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 255
-        # 畫一條直線
-        cv2.line(image, (10, 10), (90, 90), (0, 0, 0), 2)
+        image = skewed_rgb
 
         result = deskew(image, max_angle=10.0)
 
         assert result.shape == image.shape
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_deskew_no_lines(self):
+    def test_deskew_no_lines(self, blank_rgb):
         """測試沒有線條的圖片"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 255
+        image = blank_rgb
 
         result = deskew(image)
 
         # 沒有線條時應該返回原圖
         assert result.shape == image.shape
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_deskew_grayscale_input(self):
+    def test_deskew_grayscale_input(self, skewed_gray):
         """測試灰階圖片輸入"""
-        # 建立灰階圖片
-        gray_image = np.ones((100, 100), dtype=np.uint8) * 255
-        # 畫一條直線
-        cv2.line(gray_image, (10, 10), (90, 90), 0, 2)
+        gray_image = skewed_gray
 
         result = deskew(gray_image)
 
@@ -200,58 +190,40 @@ class TestDeskew:
             len(result.shape) == 3 and result.shape[2] == 3
         )
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_deskew_small_angle(self):
+    def test_deskew_small_angle(self, horizontal_rgb):
         """測試小角度（< 0.5 度）不旋轉"""
-        # 建立幾乎水平的線條圖片
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 255
-        # 畫一條幾乎水平的線
-        cv2.line(image, (10, 50), (90, 50), (0, 0, 0), 2)
+        # 幾乎水平的線條圖片
+        image = horizontal_rgb
 
         result = deskew(image)
 
         # 角度很小時應該直接返回（雖然可能經過處理）
         assert result.shape == image.shape
 
-    def test_deskew_without_cv2(self, monkeypatch):
-        """測試缺少 cv2 時的降級行為"""
-        # Mock HAS_CV2 = False
-        import paddleocr_toolkit.processors.image_preprocessor as module
-
-        monkeypatch.setattr(module, "HAS_CV2", False)
-
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
-
-        # 應該返回原圖
-        result = deskew(image)
-        assert np.array_equal(result, image)
-
 
+@requires_cv2
 class TestPreprocessForOCR:
     """測試 OCR 預處理管線"""
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_default_preprocess(self):
+    def test_default_preprocess(self, rgb128):
         """測試預設預處理"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
+        image = rgb128
 
         result = preprocess_for_ocr(image)
 
         assert result.shape == image.shape
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_full_preprocess(self):
+    def test_full_preprocess(self, rgb128):
         """測試完整預處理"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
+        image = rgb128
 
         result = preprocess_for_ocr(image, enhance=True, sharpen_img=True)
 
         assert result.shape == image.shape
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_no_preprocess(self):
+    def test_no_preprocess(self, rgb128):
         """測試不做預處理"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
+        image = rgb128
 
         result = preprocess_for_ocr(
             image,
@@ -264,20 +236,18 @@ class TestPreprocessForOCR:
 
         assert np.array_equal(result, image)
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_preprocess_with_binarize(self):
+    def test_preprocess_with_binarize(self, rgb128):
         """測試啟用二值化的預處理"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
+        image = rgb128
 
         result = preprocess_for_ocr(image, enhance=True, binarize_img=True)  # 測試這個分支
 
         assert result is not None
         assert result.shape == image.shape
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_preprocess_all_options_enabled(self):
+    def test_preprocess_all_options_enabled(self, rgb128):
         """測試啟用所有預處理選項"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
+        image = rgb128
 
         result = preprocess_for_ocr(
             image,
@@ -292,22 +262,21 @@ class TestPreprocessForOCR:
         assert result.shape == image.shape
 
 
+@requires_cv2
 class TestAutoPreprocess:
     """測試自動預處理"""
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_normal_image(self):
+    def test_normal_image(self, rgb128):
         """測試一般圖片"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
+        image = rgb128
 
         result = auto_preprocess(image, is_scanned=False)
 
         assert result.shape == image.shape
 
-    @pytest.mark.skipif(not HAS_CV2, reason="OpenCV not installed")
-    def test_scanned_image(self):
+    def test_scanned_image(self, rgb128):
         """測試掃描圖片"""
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
+        image = rgb128
 
         result = auto_preprocess(image, is_scanned=True)
 
@@ -317,33 +286,16 @@ class TestAutoPreprocess:
 class TestMissingDependencies:
     """測試缺少依賴時的降級行為"""
 
-    def test_functions_without_cv2(self, monkeypatch):
-        """測試缺少 cv2 時的降級行為"""
-        # Mock HAS_CV2 = False
+    @pytest.mark.parametrize(
+        "func", [enhance_contrast, denoise, binarize, sharpen, deskew]
+    )
+    def test_functions_without_cv2(self, monkeypatch, rgb128, func):
+        """測試缺少 cv2 時各函式都返回原圖"""
         import paddleocr_toolkit.processors.image_preprocessor as module
 
         monkeypatch.setattr(module, "HAS_CV2", False)
 
-        image = np.ones((100, 100, 3), dtype=np.uint8) * 128
-
-        # 測試所有函式都返回原圖（降級行為）
-        assert np.array_equal(enhance_contrast(image), image)
-        assert np.array_equal(denoise(image), image)
-        assert np.array_equal(binarize(image), image)
-        assert np.array_equal(sharpen(image), image)
-
-
-# 執行測試
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
-
-# Added from Ultra Coverage
-from paddleocr_toolkit.processors.image_preprocessor import (
-    resize_image_if_needed,
-    deskew,
-)
-from unittest.mock import MagicMock, patch
-import numpy as np
+        assert np.array_equal(func(rgb128), rgb128)
 
 
 class TestImagePreprocessorUltra:
@@ -356,8 +308,9 @@ class TestImagePreprocessorUltra:
             assert res == "invalid.jpg"
             assert not resized
 
+    @requires_cv2
     def test_deskew_logic(self):
-        img = np.zeros((100, 100), dtype=np.uint8)
+        img = np.zeros(SIZE, dtype=np.uint8)
         # Mock HoughLines to return a line (lines 153-156)
         # theta ~ pi/2 (1.57) -> angle ~ 0
         mock_lines = np.array([[[10, 1.62]]])  # 1.62 rad ~ 92.8 deg -> angle ~ 2.8
@@ -379,3 +332,8 @@ class TestImagePreprocessorUltra:
         with patch("cv2.HoughLines", return_value=mock_lines_small):
             res = deskew(img)
             assert res is img
+
+
+# 執行測試
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
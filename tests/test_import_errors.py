@@ -1,58 +1,79 @@
 # -*- coding: utf-8 -*-
 import importlib
 import sys
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+
+import pytest
+
+# (模組路徑, 要模擬缺少的依賴, 預期變為 False 的旗標)
+MODULES = [
+    ("paddleocr_toolkit.processors.pdf_processor", "fitz", "HAS_FITZ"),
+    ("paddleocr_toolkit.processors.pdf_quality", "fitz", "HAS_FITZ"),
+    (
+        "paddleocr_toolkit.processors.structure_processor",
+        "paddleocr_toolkit.core.models",
+        None,
+    ),
+    ("paddleocr_toolkit.processors.ocr_workaround", "fitz", "HAS_FITZ"),
+    (
+        "paddleocr_toolkit.processors.parallel_pdf_processor",
+        "fitz",
+        "HAS_PYMUPDF",
+    ),
+    ("paddleocr_toolkit.processors.translation_processor", "fitz", "HAS_FITZ"),
+    ("paddleocr_toolkit.processors.ocr_workaround", "numpy", "HAS_NUMPY"),
+    (
+        "paddleocr_toolkit.processors.parallel_pdf_processor",
+        "numpy",
+        "HAS_NUMPY",
+    ),
+    ("paddleocr_toolkit.processors.image_preprocessor", "numpy", "HAS_NUMPY"),
+    ("paddleocr_toolkit.processors.image_preprocessor", "cv2", "HAS_CV2"),
+    ("paddleocr_toolkit.processors.translation_processor", "tqdm", "HAS_TQDM"),
+    (
+        "paddleocr_toolkit.processors.translation_processor",
+        "pdf_translator",
+        None,
+    ),
+    ("paddleocr_toolkit.processors.basic_processor", "tqdm", "HAS_TQDM"),
+    ("paddleocr_toolkit.processors.formula_processor", "tqdm", "HAS_TQDM"),
+    ("paddleocr_toolkit.processors.batch_processor", "numpy", "HAS_NUMPY"),
+    ("paddleocr_toolkit.processors.batch_processor", "fitz", "HAS_FITZ"),
+]
+
+
+@pytest.fixture(scope="module")
+def reloaded_modules():
+    """
+    記錄在缺少依賴下 reload 過的模組，並在本檔案測試結束後各 reload 一次還原
+
+    每次 reload 都會重新執行整個模組，因此不需在每個案例後立即還原；
+    --dist=loadfile 保證本檔案的測試在同一個 worker 中依序執行。
+    """
+    modules = {}
+    yield modules
+    for mod_path, mod in modules.items():
+        sys.modules[mod_path] = mod
+        try:
+            importlib.reload(mod)
+        except Exception:
+            pass
 
 
 class TestImportErrorsUltra:
-    def test_all_import_errors(self):
-        modules = [
-            ("paddleocr_toolkit.processors.pdf_processor", "fitz", "HAS_FITZ"),
-            ("paddleocr_toolkit.processors.pdf_quality", "fitz", "HAS_FITZ"),
-            (
-                "paddleocr_toolkit.processors.structure_processor",
-                "paddleocr_toolkit.core.models",
-                None,
-            ),
-            ("paddleocr_toolkit.processors.ocr_workaround", "fitz", "HAS_FITZ"),
-            (
-                "paddleocr_toolkit.processors.parallel_pdf_processor",
-                "fitz",
-                "HAS_PYMUPDF",
-            ),
-            ("paddleocr_toolkit.processors.translation_processor", "fitz", "HAS_FITZ"),
-            ("paddleocr_toolkit.processors.ocr_workaround", "numpy", "HAS_NUMPY"),
-            (
-                "paddleocr_toolkit.processors.parallel_pdf_processor",
-                "numpy",
-                "HAS_NUMPY",
-            ),
-            ("paddleocr_toolkit.processors.image_preprocessor", "numpy", "HAS_NUMPY"),
-            ("paddleocr_toolkit.processors.image_preprocessor", "cv2", "HAS_CV2"),
-            ("paddleocr_toolkit.processors.translation_processor", "tqdm", "HAS_TQDM"),
-            (
-                "paddleocr_toolkit.processors.translation_processor",
-                "pdf_translator",
-                None,
-            ),
-            ("paddleocr_toolkit.processors.basic_processor", "tqdm", "HAS_TQDM"),
-            ("paddleocr_toolkit.processors.formula_processor", "tqdm", "HAS_TQDM"),
-            ("paddleocr_toolkit.processors.batch_processor", "numpy", "HAS_NUMPY"),
-            ("paddleocr_toolkit.processors.batch_processor", "fitz", "HAS_FITZ"),
-        ]
-        for mod_path, mock_target, flag_name in modules:
+    @pytest.mark.parametrize("mod_path,mock_target,flag_name", MODULES)
+    def test_import_error(self, reloaded_modules, mod_path, mock_target, flag_name):
+        mod = importlib.import_module(mod_path)
+        reloaded_modules.setdefault(mod_path, mod)
+
+        with patch.dict(sys.modules, {mock_target: None}):
             try:
-                mod = importlib.import_module(mod_path)
-                with patch.dict(sys.modules, {mock_target: None}):
-                    try:
-                        importlib.reload(mod)
-                        if flag_name:
-                            # It might be False or just not present if conditional
-                            val = getattr(mod, flag_name, None)
-                            if val is not None:
-                                assert val is False
-                    except (ImportError, ModuleNotFoundError):
-                        pass
                 importlib.reload(mod)
-            except Exception:
-                pass
+            except (ImportError, ModuleNotFoundError):
+                return
+
+        if flag_name:
+            # It might be False or just not present if conditional
+            val = getattr(mod, flag_name, None)
+            if val is not None:
+                assert val is False
@@ -3,7 +3,6 @@
 Advanced tests for LLM Client to maximize coverage.
 """
 import pytest
-from unittest.mock import MagicMock, patch, Mock
 
 # Import conditionally to avoid import errors if requests is missing in env (though we mock it)
 from paddleocr_toolkit.llm.llm_client import (
@@ -16,28 +15,27 @@ from paddleocr_toolkit.llm.llm_client import (
 
 
 class TestLLMClientAdvanced:
-    @patch("paddleocr_toolkit.llm.llm_client.HAS_REQUESTS", False)
-    def test_no_requests_module(self):
+    @pytest.mark.parametrize(
+        "client_cls,kwargs",
+        [
+            (OllamaClient, {}),
+            (OpenAIClient, {"api_key": "k"}),
+            (GeminiClient, {"api_key": "k"}),
+            (ClaudeClient, {"api_key": "k"}),
+        ],
+    )
+    def test_no_requests_module(self, monkeypatch, client_cls, kwargs):
         """Test missing requests module raises ImportError"""
+        monkeypatch.setattr("paddleocr_toolkit.llm.llm_client.HAS_REQUESTS", False)
         with pytest.raises(ImportError):
-            OllamaClient()
-        with pytest.raises(ImportError):
-            OpenAIClient(api_key="k")
-        with pytest.raises(ImportError):
-            GeminiClient(api_key="k")
-        with pytest.raises(ImportError):
-            ClaudeClient(api_key="k")
+            client_cls(**kwargs)
 
     # === Ollama Tests ===
-    @patch(
-        "paddleocr_toolkit.llm.llm_client.requests.get",
-        side_effect=Exception("Conn Refused"),
-    )
     def test_ollama_is_available_exception(self, mock_get):
+        mock_get.side_effect = Exception("Conn Refused")
         client = OllamaClient()
         assert client.is_available() is False
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests.post")
     def test_ollama_generate_error(self, mock_post):
         client = OllamaClient()
         # 404 Error
@@ -49,15 +47,11 @@ class TestLLMClientAdvanced:
         assert client.generate("test") == ""
 
     # === OpenAI Tests ===
-    @patch(
-        "paddleocr_toolkit.llm.llm_client.requests.get",
-        side_effect=Exception("Conn Err"),
-    )
     def test_openai_is_available_exception(self, mock_get):
+        mock_get.side_effect = Exception("Conn Err")
         client = OpenAIClient(api_key="k")
         assert client.is_available() is False
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests.post")
     def test_openai_generate_error(self, mock_post):
         client = OpenAIClient(api_key="k")
 
@@ -70,7 +64,6 @@ class TestLLMClientAdvanced:
         assert client.generate("test") == ""
 
     # === Gemini Tests ===
-    @patch("paddleocr_toolkit.llm.llm_client.requests.post")
     def test_gemini_generate_error(self, mock_post):
         client = GeminiClient(api_key="k")
 
@@ -90,15 +83,11 @@ class TestLLMClientAdvanced:
         assert client.generate("test") == ""
 
     # === Claude Tests ===
-    @patch(
-        "paddleocr_toolkit.llm.llm_client.requests.post",
-        side_effect=Exception("Conn Err"),
-    )
     def test_claude_is_available_exception(self, mock_post):
+        mock_post.side_effect = Exception("Conn Err")
         client = ClaudeClient(api_key="k")
         assert client.is_available() is False
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests.post")
     def test_claude_generate_error(self, mock_post):
         client = ClaudeClient(api_key="k")
 
@@ -5,7 +5,7 @@
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 from paddleocr_toolkit.llm.llm_client import (
     create_llm_client,
     OllamaClient,
@@ -15,6 +15,29 @@ from paddleocr_toolkit.llm.llm_client import (
     LLMClient,
 )
 
+# 各提供商的成功回應內容（測試不會修改，可直接共用）
+OLLAMA_OK = {"response": "Hello World"}
+OPENAI_OK = {"choices": [{"message": {"content": "GPT Response"}}]}
+GEMINI_OK = {"candidates": [{"content": {"parts": [{"text": "Gemini Response"}]}}]}
+CLAUDE_OK = {"content": [{"text": "Claude Response"}]}
+
+
+@pytest.fixture(autouse=True)
+def mock_requests(monkeypatch):
+    """以單一 MagicMock 取代 llm_client 的 requests，避免測試發出真實請求"""
+    mock = MagicMock()
+    monkeypatch.setattr("paddleocr_toolkit.llm.llm_client.requests", mock)
+    return mock
+
+
+def make_response(status_code=200, payload=None, text=""):
+    """建立模擬的 HTTP 回應"""
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = {} if payload is None else payload
+    response.text = text
+    return response
+
 
 class TestLLMClientFactory:
     """測試 LLM Client 工廠函數"""
@@ -54,30 +77,23 @@ class TestLLMClientFactory:
 class TestOllamaClient:
     """測試 Ollama 客戶端"""
 
-    @pytest.fixture
-    def client(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls):
         return OllamaClient(base_url="http://test:11434")
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests")
     def test_is_available_success(self, mock_requests, client):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_requests.get.return_value = mock_response
+        mock_requests.get.return_value = make_response(200)
 
         assert client.is_available() is True
         mock_requests.get.assert_called_with("http://test:11434/api/tags", timeout=5)
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests")
     def test_is_available_failure(self, mock_requests, client):
         mock_requests.get.side_effect = Exception("Connection refused")
         assert client.is_available() is False
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests")
     def test_generate_success(self, mock_requests, client):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "Hello World"}
-        mock_requests.post.return_value = mock_response
+        mock_requests.post.return_value = make_response(200, OLLAMA_OK)
 
         response = client.generate("Hi")
         assert response == "Hello World"
@@ -87,11 +103,8 @@ class TestOllamaClient:
         assert kwargs["json"]["prompt"] == "Hi"
         assert kwargs["json"]["stream"] is False
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests")
     def test_generate_failure(self, mock_requests, client):
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_requests.post.return_value = mock_response
+        mock_requests.post.return_value = make_response(500)
 
         response = client.generate("Hi")
         assert response == ""  # 失敗返回空字串
@@ -100,18 +113,13 @@ class TestOllamaClient:
 class TestOpenAIClient:
     """測試 OpenAI 客戶端"""
 
-    @pytest.fixture
-    def client(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls):
         return OpenAIClient(api_key="sk-test")
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests")
     def test_generate_success(self, mock_requests, client):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "GPT Response"}}]
-        }
-        mock_requests.post.return_value = mock_response
+        mock_requests.post.return_value = make_response(200, OPENAI_OK)
 
         response = client.generate("Hi")
         assert response == "GPT Response"
@@ -120,7 +128,6 @@ class TestOpenAIClient:
         args, kwargs = mock_requests.post.call_args
         assert kwargs["headers"]["Authorization"] == "Bearer sk-test"
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests")
     def test_generate_exception(self, mock_requests, client):
         mock_requests.post.side_effect = Exception("API Error")
         response = client.generate("Hi")
@@ -130,37 +137,25 @@ class TestOpenAIClient:
 class TestGeminiClient:
     """測試 Gemini 客戶端"""
 
-    @pytest.fixture
-    def client(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls):
         return GeminiClient(api_key="gemini-key")
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests")
     def test_is_available(self, mock_requests, client):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_requests.get.return_value = mock_response
+        mock_requests.get.return_value = make_response(200)
         assert client.is_available() is True
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests")
     def test_generate_success(self, mock_requests, client):
-        mock_response = Mock()
-        mock_response.status_code = 200
         # 模擬 Gemini 複雜的結構
-        mock_response.json.return_value = {
-            "candidates": [{"content": {"parts": [{"text": "Gemini Response"}]}}]
-        }
-        mock_requests.post.return_value = mock_response
+        mock_requests.post.return_value = make_response(200, GEMINI_OK)
 
         response = client.generate("Hi")
         assert response == "Gemini Response"
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests")
     def test_generate_malformed_response(self, mock_requests, client):
-        mock_response = Mock()
-        mock_response.status_code = 200
         # 結構不完整
-        mock_response.json.return_value = {"candidates": []}
-        mock_requests.post.return_value = mock_response
+        mock_requests.post.return_value = make_response(200, {"candidates": []})
 
         response = client.generate("Hi")
         assert response == ""  # 解析失敗應返回空
@@ -169,16 +164,13 @@ class TestGeminiClient:
 class TestClaudeClient:
     """測試 Claude 客戶端"""
 
-    @pytest.fixture
-    def client(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls):
         return ClaudeClient(api_key="claude-key")
 
-    @patch("paddleocr_toolkit.llm.llm_client.requests")
     def test_generate_success(self, mock_requests, client):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"content": [{"text": "Claude Response"}]}
-        mock_requests.post.return_value = mock_response
+        mock_requests.post.return_value = make_response(200, CLAUDE_OK)
 
         response = client.generate("Hi")
         assert response == "Claude Response"
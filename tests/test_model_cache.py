@@ -4,36 +4,50 @@
 測試 paddleocr_toolkit/core/model_cache.py
 """
 
-import tempfile
-import os
+import runpy
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from paddleocr_toolkit.core.model_cache import (
+    ModelCache,
+    ResultCache,
+    cached_ocr_result,
+    get_model_cache,
+)
+
+
+@pytest.fixture(scope="module")
+def result_cache_dir(tmp_path_factory):
+    """模組共用的 ResultCache 目錄（避免寫入或清除使用者的 ~/.paddleocr/cache）"""
+    return tmp_path_factory.mktemp("result_cache")
+
 
 class TestModelCache:
     """測試模型快取"""
 
     def test_import_model_cache(self):
         """測試匯入模型快取模組"""
-        from paddleocr_toolkit.core.model_cache import ModelCache
-
         assert ModelCache is not None
 
     def test_model_cache_singleton(self):
         """測試模型快取使用單例模式"""
-        from paddleocr_toolkit.core.model_cache import ModelCache
-
         cache1 = ModelCache()
         cache2 = ModelCache()
         assert cache1 is cache2
+        assert get_model_cache() is cache1
+
+    def test_model_cache_created_lazily(self):
+        """測試模組級單例在首次呼叫 get_model_cache() 時才建立"""
+        with patch("paddleocr_toolkit.core.model_cache._model_cache", None):
+            cache = get_model_cache()
+            assert get_model_cache() is cache
+            assert cache is ModelCache()
 
     def test_model_cache_get_model(self):
         """測試獲取模型"""
-        from paddleocr_toolkit.core.model_cache import ModelCache
-
-        cache = ModelCache()
+        cache = get_model_cache()
         # 清除之前的快取
         cache.clear_cache()
 
@@ -43,18 +57,14 @@ class TestModelCache:
 
     def test_model_cache_clear(self):
         """測試清除快取"""
-        from paddleocr_toolkit.core.model_cache import ModelCache
-
-        cache = ModelCache()
+        cache = get_model_cache()
         cache.clear_cache()
         info = cache.get_cache_info()
         assert info["cached_models"] == 0
 
     def test_model_cache_get_info(self):
         """測試獲取快取資訊"""
-        from paddleocr_toolkit.core.model_cache import ModelCache
-
-        cache = ModelCache()
+        cache = get_model_cache()
         info = cache.get_cache_info()
         assert "cached_models" in info
 
@@ -64,49 +74,36 @@ class TestResultCache:
 
     def test_import_result_cache(self):
         """測試匯入結果快取"""
-        from paddleocr_toolkit.core.model_cache import ResultCache
-
         assert ResultCache is not None
 
-    def test_result_cache_init(self):
+    def test_result_cache_init(self, result_cache_dir):
         """測試結果快取初始化"""
-        from paddleocr_toolkit.core.model_cache import ResultCache
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = ResultCache(cache_dir=Path(tmpdir))
-            assert cache is not None
+        cache = ResultCache(cache_dir=result_cache_dir)
+        assert cache is not None
 
     def test_result_cache_default_init(self):
         """測試結果快取預設初始化"""
-        from paddleocr_toolkit.core.model_cache import ResultCache
-
         cache = ResultCache()
         assert cache.max_size == 1000
 
-    def test_result_cache_custom_max_size(self):
+    def test_result_cache_custom_max_size(self, result_cache_dir):
         """測試結果快取自定義大小"""
-        from paddleocr_toolkit.core.model_cache import ResultCache
-
-        cache = ResultCache(max_size=500)
+        cache = ResultCache(cache_dir=result_cache_dir, max_size=500)
         assert cache.max_size == 500
 
-    def test_result_cache_clear(self):
+    def test_result_cache_clear(self, result_cache_dir):
         """測試清除快取"""
-        from paddleocr_toolkit.core.model_cache import ResultCache
-
-        cache = ResultCache()
+        cache = ResultCache(cache_dir=result_cache_dir)
         cache.clear()
         stats = cache.get_stats()
         assert stats["memory_cached"] == 0
 
-    def test_result_cache_get_stats(self):
+    def test_result_cache_get_stats(self, result_cache_dir):
         """測試獲取統計資訊"""
-        from paddleocr_toolkit.core.model_cache import ResultCache
-
-        cache = ResultCache()
+        cache = ResultCache(cache_dir=result_cache_dir)
         stats = cache.get_stats()
-        assert "hits" in stats
-        assert "misses" in stats
+        assert stats["hits"] == 0
+        assert stats["misses"] == 0
         assert "memory_cached" in stats
 
 
@@ -115,46 +112,37 @@ class TestCachedOcrResult:
 
     def test_import_decorator(self):
         """測試匯入裝飾器"""
-        from paddleocr_toolkit.core.model_cache import cached_ocr_result
-
         assert cached_ocr_result is not None
         assert callable(cached_ocr_result)
 
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
-
-# Added from Ultra Coverage
-from paddleocr_toolkit.core.model_cache import ModelCache, ResultCache
-from unittest.mock import MagicMock, patch
-from pathlib import Path
-import runpy
-
-
 class TestModelCacheUltra:
+    @pytest.fixture(autouse=True)
+    def _no_mkdir(self, monkeypatch):
+        """這些測試的檔案操作都已 mock，不需要真的建立快取目錄"""
+        monkeypatch.setattr(Path, "mkdir", lambda *args, **kwargs: None)
+
     def test_model_cache_basic(self):
-        cache = ModelCache()
+        cache = get_model_cache()
         # Hit line 58: Using cached model
         cache.get_model("basic")
         cache.get_model("basic")
 
     def test_result_cache_disk_load_error(self):
-        with patch("pathlib.Path.mkdir"):
-            cache = ResultCache(cache_dir=Path("./tmp_cache"))
-            # Simulate disk cache exist but load fail (line 162)
-            with patch("pathlib.Path.exists", return_value=True), patch(
-                "builtins.open", side_effect=Exception("Disk error")
-            ), patch.object(cache, "_compute_file_hash", return_value="hash"):
-                res = cache.get("file.pdf", "basic")
-                assert res is None
+        cache = ResultCache(cache_dir=Path("./tmp_cache"))
+        # Simulate disk cache exist but load fail (line 162)
+        with patch("os.path.isfile", return_value=True), patch(
+            "builtins.open", side_effect=Exception("Disk error")
+        ), patch.object(cache, "_compute_file_hash", return_value="hash"):
+            res = cache.get("file.pdf", "basic")
+            assert res is None
 
     def test_result_cache_save_error(self):
-        with patch("pathlib.Path.mkdir"):
-            cache = ResultCache(cache_dir=Path("./tmp_cache"))
-            with patch(
-                "builtins.open", side_effect=Exception("Save error")
-            ), patch.object(cache, "_compute_file_hash", return_value="hash"):
-                cache.set("file.pdf", "basic", {"res": 1})
+        cache = ResultCache(cache_dir=Path("./tmp_cache"))
+        with patch("builtins.open", side_effect=Exception("Save error")), patch.object(
+            cache, "_compute_file_hash", return_value="hash"
+        ):
+            cache.set("file.pdf", "basic", {"res": 1})
 
     def test_main_block_simulation(self):
         runpy.run_module("paddleocr_toolkit.core.model_cache", run_name="__main__")
@@ -163,79 +151,200 @@ class TestModelCacheUltra:
 class TestResultCacheExtensions:
     """測試 ResultCache 進階功能"""
 
-    def test_cache_size_limit(self):
+    def test_cache_size_limit(self, result_cache_dir):
         """測試快取大小限制"""
-        from paddleocr_toolkit.core.model_cache import ResultCache
-
         # 設定小容量以便測試
-        cache = ResultCache(max_size=3)
+        cache = ResultCache(cache_dir=result_cache_dir, max_size=3)
         cache.clear()
 
         # 填充快取 (Mock _compute_file_hash 以避免真實文件讀取)
-        with patch.object(cache, "_compute_file_hash") as mock_hash:
-            # 插入 4 個項目，應該觸發清理
-            for i in range(4):
-                mock_hash.return_value = f"hash_{i}"
+        # 依呼叫順序回傳：3 次寫入、1 次讀取、第 4 次寫入
+        hashes = ["hash_0", "hash_1", "hash_2", "hash_0", "hash_3"]
+        with patch.object(cache, "_compute_file_hash", side_effect=hashes):
+            for i in range(3):
                 cache.set(f"file_{i}", "mode", f"res_{i}")
 
+            # 讀取最早插入的項目，使其成為最近使用
+            assert cache.get("file_0", "mode") == "res_0"
+
+            # 插入第 4 個項目，應該觸發清理
+            cache.set("file_3", "mode", "res_3")
+
             # 驗證記憶體快取大小不超過 3
             assert len(cache.memory_cache) == 3
-            # 舊的應該被移除 (FIFO: 0 最早)
-            assert "hash_0_mode" not in cache.memory_cache
+            # LRU: 剛讀取過的 0 保留，最久未使用的 1 被移除
+            assert "hash_0_mode" in cache.memory_cache
+            assert "hash_1_mode" not in cache.memory_cache
             assert "hash_3_mode" in cache.memory_cache
 
-    def test_compute_file_hash_real_file(self):
-        """測試真實文件哈希計算"""
-        from paddleocr_toolkit.core.model_cache import ResultCache
-
-        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as f:
-            f.write(b"content")
-            file_path = f.name
-
-        try:
-            cache = ResultCache()
-            hash1 = cache._compute_file_hash(file_path)
-
-            # 修改文件
-            with open(file_path, "wb") as f:
-                f.write(b"new content")
-            hash2 = cache._compute_file_hash(file_path)
-
-            assert hash1 != hash2
-        finally:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-
-    def test_set_get_roundtrip_disk(self):
-        """測試磁碟快取完整的寫入與讀取"""
-        from paddleocr_toolkit.core.model_cache import ResultCache
+    def test_memory_ttl(self, result_cache_dir):
+        """測試超過 TTL 的項目從記憶體快取移除"""
+        # min_disk_bytes 設得很大，確保結果不寫入磁碟
+        cache = ResultCache(
+            cache_dir=result_cache_dir, min_disk_bytes=1 << 30, ttl_seconds=10
+        )
+        now = [0]
+        hashes = {"file_a": "ttl_a", "file_b": "ttl_b", "file_c": "ttl_c"}
+        with patch("time.monotonic_ns", lambda: now[0] * 10**9), patch.object(
+            cache, "_compute_file_hash", side_effect=hashes.get
+        ):
+            cache.set("file_a", "mode", "res_a")
+            now[0] = 5
+            cache.set("file_b", "mode", "res_b")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = ResultCache(cache_dir=Path(tmpdir))
+            # a 已存在 11 秒（過期），b 只有 6 秒
+            now[0] = 11
+            assert cache.get("file_a", "mode") is None
+            assert cache.get("file_b", "mode") == "res_b"
 
-            with tempfile.NamedTemporaryFile(delete=False) as f:
-                f.write(b"test")
-                file_path = f.name
+            # 寫入新項目時順便清除最久未使用端的過期項目
+            now[0] = 20
+            cache.set("file_c", "mode", "res_c")
+            assert list(cache.memory_cache) == ["ttl_c_mode"]
 
-            try:
-                # 寫入
-                result_data = {"text": "hello"}
-                cache.set(file_path, "hybrid", result_data)
+    def test_compute_file_hash_real_file(self, result_cache_dir, tmp_path):
+        """測試真實文件哈希計算"""
+        file_path = tmp_path / "content.bin"
+        file_path.write_bytes(b"content")
 
-                # 驗證記憶體
-                assert cache.cache_hits == 0  # 還沒 get 過
+        cache = ResultCache(cache_dir=result_cache_dir)
+        hash1 = cache._compute_file_hash(str(file_path))
 
-                # 清除記憶體快取，強迫從磁碟讀取
-                cache.memory_cache.clear()
+        # 修改文件
+        file_path.write_bytes(b"new content")
+        hash2 = cache._compute_file_hash(str(file_path))
 
-                # 讀取
-                loaded = cache.get(file_path, "hybrid")
-                assert loaded == result_data
-                assert cache.cache_hits == 1  # 從磁碟命中
+        assert hash1 != hash2
 
-            finally:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+    def test_set_get_roundtrip_disk(self, result_cache_dir, tmp_path):
+        """測試磁碟快取完整的寫入與讀取"""
+        cache = ResultCache(cache_dir=result_cache_dir)
+        file_path = tmp_path / "roundtrip.bin"
+        file_path.write_bytes(b"test")
+
+        # 寫入
+        result_data = {"text": "hello"}
+        cache.set(str(file_path), "hybrid", result_data)
+
+        # 驗證記憶體
+        assert cache.cache_hits == 0  # 還沒 get 過
+
+        # 清除記憶體快取，強迫從磁碟讀取
+        cache.memory_cache.clear()
+
+        # 讀取
+        loaded = cache.get(str(file_path), "hybrid")
+        assert loaded == result_data
+        assert cache.cache_hits == 1  # 從磁碟命中
+        assert cache.cache_info() == (1, 0, 1, cache.max_size)
+
+    def test_min_disk_bytes_keeps_small_results_in_memory(self, tmp_path):
+        """測試小於 min_disk_bytes 的結果只保留在記憶體"""
+        cache = ResultCache(cache_dir=tmp_path / "cache", min_disk_bytes=4096)
+        small = tmp_path / "small.bin"
+        small.write_bytes(b"small")
+        large = tmp_path / "large.bin"
+        large.write_bytes(b"large")
+
+        cache.set(str(small), "basic", {"text": "hello"})
+        cache.set(str(large), "basic", {"text": "x" * 8192})
+
+        assert len(list(cache.cache_dir.glob("*.pkl"))) == 1
+        assert cache.get(str(small), "basic") == {"text": "hello"}
+
+        cache.memory_cache.clear()
+        assert cache.get(str(small), "basic") is None
+        assert cache.get(str(large), "basic") == {"text": "x" * 8192}
+
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_disk_compression(self, tmp_path, compress):
+        """測試磁碟快取壓縮與否都能讀回，且未壓縮檔案仍為 pickle 格式"""
+        if compress:
+            pytest.importorskip("zstandard")
+
+        cache = ResultCache(cache_dir=tmp_path / "cache", compress=compress)
+        file_path = tmp_path / "table.bin"
+        file_path.write_bytes(b"table")
+        result = {"html": "<td>cell</td>" * 1000}
+
+        cache.set(str(file_path), "structure", result)
+        (cache_file,) = cache.cache_dir.glob("*.pkl")
+        data = cache_file.read_bytes()
+        if compress:
+            assert data.startswith(b"\x28\xb5\x2f\xfd")
+            assert len(data) < 1000
+        else:
+            assert data.startswith(b"\x80\x05")
+
+        cache.memory_cache.clear()
+        assert cache.get(str(file_path), "structure") == result
+
+    def test_compressed_entry_without_zstd(self, tmp_path):
+        """測試未安裝 zstandard 時，壓縮快取視為未命中且保留檔案"""
+        cache = ResultCache(cache_dir=tmp_path / "cache", compress=False)
+        file_path = tmp_path / "table.bin"
+        file_path.write_bytes(b"table")
+        cache.set(str(file_path), "structure", {"html": "<td/>"})
+        (cache_file,) = cache.cache_dir.glob("*.pkl")
+        cache_file.write_bytes(b"\x28\xb5\x2f\xfd" + b"\x00" * 16)
+        cache.memory_cache.clear()
+
+        with patch("paddleocr_toolkit.core.model_cache.HAS_ZSTD", False):
+            assert cache.get(str(file_path), "structure") is None
+        assert cache_file.exists()
+        assert cache.cache_misses == 1
+
+    def test_corrupt_entry_removed(self, tmp_path):
+        """測試無法讀取的磁碟快取會被刪除"""
+        cache = ResultCache(cache_dir=tmp_path / "cache", compress=False)
+        file_path = tmp_path / "table.bin"
+        file_path.write_bytes(b"table")
+        cache.set(str(file_path), "structure", {"html": "<td/>"})
+        (cache_file,) = cache.cache_dir.glob("*.pkl")
+        cache_file.write_bytes(b"not a pickle")
+        cache.memory_cache.clear()
+
+        assert cache.get(str(file_path), "structure") is None
+        assert not cache_file.exists()
+
+    def test_read_error_keeps_entry(self, tmp_path):
+        """測試讀取時的暫時性 IO 錯誤視為未命中，不刪除快取檔案"""
+        cache = ResultCache(cache_dir=tmp_path / "cache", compress=False)
+        file_path = tmp_path / "table.bin"
+        file_path.write_bytes(b"table")
+        result = {"html": "<td/>"}
+        cache.set(str(file_path), "structure", result)
+        (cache_file,) = cache.cache_dir.glob("*.pkl")
+        cache.memory_cache.clear()
+
+        real_open = open
+
+        def flaky_open(path, *args, **kwargs):
+            if str(path) == str(cache_file):
+                raise OSError(24, "Too many open files")
+            return real_open(path, *args, **kwargs)
+
+        with patch("builtins.open", side_effect=flaky_open):
+            assert cache.get(str(file_path), "structure") is None
+        assert cache_file.exists()
+
+        assert cache.get(str(file_path), "structure") == result
+
+    def test_disk_roundtrip_numpy(self, result_cache_dir, tmp_path):
+        """測試含 numpy 陣列的結果以 pickle protocol 5 寫入並讀回"""
+        np = pytest.importorskip("numpy")
+
+        cache = ResultCache(cache_dir=result_cache_dir)
+        file_path = tmp_path / "arrays.bin"
+        file_path.write_bytes(b"arrays")
+
+        polys = np.arange(64, dtype=np.float32).reshape(8, 4, 2)
+        cache.set(str(file_path), "basic", {"dt_polys": polys})
+        cache.memory_cache.clear()
+
+        loaded = cache.get(str(file_path), "basic")
+        np.testing.assert_array_equal(loaded["dt_polys"], polys)
+        assert loaded["dt_polys"].dtype == np.float32
 
 
 class TestDecoratorFunctionality:
@@ -243,8 +352,6 @@ class TestDecoratorFunctionality:
 
     def test_cached_ocr_result_decorator(self):
         """測試裝飾器實際快取行為"""
-        from paddleocr_toolkit.core.model_cache import cached_ocr_result, ResultCache
-
         # Mock ResultCache 以便我們可以攔截
         mock_cache_inst = MagicMock()
         mock_cache_inst.get.return_value = None
@@ -275,3 +382,7 @@ class TestDecoratorFunctionality:
             res2 = process_func("test.pdf")
             assert res2 == "cached_result"
             mock_process.assert_not_called()  # 應該沒有調用實際函數
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -6,35 +6,56 @@ import os
 import json
 import pytest
 from pathlib import Path
-from paddleocr_toolkit.core.ocr_cache import OCRCache
 
 
-class TestOCRCache:
-    @pytest.fixture
-    def cache_obj(self, tmp_path):
-        """Fixture to create an OCRCache instance with a temporary directory"""
-        cache_dir = tmp_path / "ocr_cache"
-        return OCRCache(cache_dir=str(cache_dir))
+@pytest.fixture(scope="module")
+def cache_obj(tmp_path_factory):
+    """Shared OCRCache; keys are content hashes, so tests use distinct data"""
+    # Imported here so collecting this module does not import the package
+    from paddleocr_toolkit.core.ocr_cache import OCRCache
+
+    return OCRCache(cache_dir=str(tmp_path_factory.mktemp("ocr_cache")))
+
+
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory):
+    """Shared directory for input files; each test uses its own file names"""
+    return tmp_path_factory.mktemp("ocr_inputs")
+
 
+class TestOCRCache:
     def test_init(self, cache_obj):
         """Test cache directory creation"""
         assert cache_obj.cache_dir.exists()
         assert cache_obj.cache_dir.is_dir()
 
-    def test_get_file_hash(self, cache_obj, tmp_path):
-        """Test file MD5 hash calculation"""
-        test_file = tmp_path / "test.txt"
+    def test_get_file_hash(self, cache_obj, data_dir):
+        """Test file BLAKE2b-128 hash calculation"""
+        test_file = data_dir / "test.txt"
         test_file.write_bytes(b"hello world")
 
         file_hash = cache_obj._get_file_hash(str(test_file))
-        assert len(file_hash) == 32  # MD5 hexdigest length
+        assert len(file_hash) == 32  # 16-byte hexdigest length
 
         # Consistent hash
         assert file_hash == cache_obj._get_file_hash(str(test_file))
 
-    def test_set_and_get_hit(self, cache_obj, tmp_path):
+    def test_get_file_hash_without_file_digest(self, cache_obj, data_dir, monkeypatch):
+        """Test chunked fallback matches hashlib.file_digest"""
+        import hashlib
+
+        test_file = data_dir / "large.bin"
+        test_file.write_bytes(os.urandom((1 << 20) + 123))
+        expected = cache_obj._get_file_hash(str(test_file))
+
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        assert cache_obj._get_file_hash(str(test_file)) == expected
+        digest = hashlib.blake2b(test_file.read_bytes(), digest_size=16)
+        assert expected == digest.hexdigest()
+
+    def test_set_and_get_hit(self, cache_obj, data_dir):
         """Test cache set and successful get (hit)"""
-        test_file = tmp_path / "image.png"
+        test_file = data_dir / "image.png"
         test_file.write_bytes(b"fake_image_data")
 
         result_data = {"text": "found me", "score": 0.99}
@@ -46,9 +67,9 @@ class TestOCRCache:
         cached_res = cache_obj.get(str(test_file), mode)
         assert cached_res == result_data
 
-    def test_get_miss(self, cache_obj, tmp_path):
+    def test_get_miss(self, cache_obj, data_dir):
         """Test cache miss (file doesn't exist or different mode)"""
-        test_file = tmp_path / "missing.png"
+        test_file = data_dir / "missing.png"
         test_file.write_bytes(b"data")
 
         assert cache_obj.get(str(test_file), "basic") is None
@@ -7,62 +7,92 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from paddleocr_toolkit.core.ocr_engine import OCREngineManager, OCRMode
+import paddleocr_toolkit.core.ocr_engine as ocr_engine
+from paddleocr_toolkit.core.ocr_engine import (
+    OCREngineManager,
+    OCRMode,
+    clear_engine_cache,
+)
 
 
-class TestOCREngineManager:
-    """測試 OCR 引擎管理器"""
-
-    def test_init_basic(self):
-        """測試基本初始化"""
-        manager = OCREngineManager(mode="basic", device="cpu")
+@pytest.fixture(autouse=True)
+def mock_paddle(monkeypatch):
+    """以 mock 取代 PaddleOCR，避免測試載入真正的模型"""
+    mock = MagicMock()
+    monkeypatch.setattr(ocr_engine, "PaddleOCR", mock)
+    return mock
 
-        assert manager.mode == OCRMode.BASIC
-        assert manager.device == "cpu"
-        assert not manager.is_initialized()
 
-    def test_init_with_options(self):
-        """測試帶選項的初始化"""
-        manager = OCREngineManager(
-            mode="hybrid",
-            device="gpu",
-            use_orientation_classify=True,
-            use_doc_unwarping=True,
-        )
+@pytest.fixture
+def engine_cache():
+    """測試前後清空行程內引擎快取，避免 mock 引擎在測試之間共用"""
+    clear_engine_cache()
+    yield ocr_engine._ENGINE_CACHE
+    clear_engine_cache()
 
-        assert manager.mode == OCRMode.HYBRID
-        assert manager.config["use_doc_orientation_classify"] is True
-        assert manager.config["use_doc_unwarping"] is True
 
-    def test_init_with_enum_mode(self):
-        """測試使用列舉模式初始化"""
-        manager = OCREngineManager(mode=OCRMode.STRUCTURE)
-        assert manager.mode == OCRMode.STRUCTURE
+class TestOCREngineManager:
+    """測試 OCR 引擎管理器"""
 
-    def test_init_with_custom_kwargs(self):
-        """測試自定義kwargs"""
-        manager = OCREngineManager(custom_param="value", another_param=123)
-        assert manager.config["custom_param"] == "value"
-        assert manager.config["another_param"] == 123
+    @pytest.mark.parametrize(
+        "kwargs, mode, config",
+        [
+            ({"mode": "basic", "device": "cpu"}, OCRMode.BASIC, {"device": "cpu"}),
+            (
+                {
+                    "mode": "hybrid",
+                    "device": "gpu",
+                    "use_orientation_classify": True,
+                    "use_doc_unwarping": True,
+                },
+                OCRMode.HYBRID,
+                {"use_doc_orientation_classify": True, "use_doc_unwarping": True},
+            ),
+            ({"mode": OCRMode.STRUCTURE}, OCRMode.STRUCTURE, {}),
+            (
+                {"custom_param": "value", "another_param": 123},
+                OCRMode.BASIC,
+                {"custom_param": "value", "another_param": 123},
+            ),
+        ],
+        ids=["basic", "options", "enum_mode", "custom_kwargs"],
+    )
+    def test_init(self, kwargs, mode, config):
+        """測試初始化（字串或列舉模式、選項與自定義kwargs）"""
+        manager = OCREngineManager(**kwargs)
+
+        assert manager.mode == mode
+        assert manager.device == manager.config["device"]
+        for key, value in config.items():
+            assert manager.config[key] == value
+        assert not manager.is_initialized()
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
-    def test_init_basic_engine(self, mock_ocr):
+    def test_init_basic_engine(self, mock_paddle):
         """測試初始化基本引擎"""
         manager = OCREngineManager(mode="basic")
         manager.init_engine()
 
         assert manager.is_initialized()
-        assert mock_ocr.called
-
-    @patch("paddleocr_toolkit.core.ocr_engine.PPStructureV3")
-    @patch("paddleocr_toolkit.core.ocr_engine.HAS_STRUCTURE", True)
-    def test_init_structure_engine(self, mock_structure):
-        """測試初始化結構化引擎"""
-        manager = OCREngineManager(mode="structure")
+        assert mock_paddle.called
+
+    @pytest.mark.parametrize(
+        "mode, engine_class",
+        [("structure", "PPStructureV3"), ("hybrid", "PPStructure")],
+    )
+    def test_init_structure_engine(self, monkeypatch, mode, engine_class):
+        """測試初始化結構化引擎（structure 與 hybrid 模式）"""
+        mock_structure = MagicMock()
+        monkeypatch.setattr(ocr_engine, engine_class, mock_structure)
+        monkeypatch.setattr(ocr_engine, "HAS_STRUCTURE", True)
+
+        manager = OCREngineManager(mode=mode)
         manager.init_engine()
 
         assert manager.is_initialized()
         mock_structure.assert_called_once()
+        assert manager.engine is mock_structure.return_value
+        if mode == "hybrid":
+            assert manager.structure_engine is manager.engine
 
     @patch("paddleocr_toolkit.core.ocr_engine.HAS_STRUCTURE", False)
     def test_init_structure_without_module(self):
@@ -72,16 +102,6 @@ class TestOCREngineManager:
         with pytest.raises(ImportError, match="PPStructureV3"):
             manager.init_engine()
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PPStructureV3")
-    @patch("paddleocr_toolkit.core.ocr_engine.HAS_STRUCTURE", True)
-    def test_init_hybrid_engine(self, mock_structure):
-        """測試初始化混合引擎"""
-        manager = OCREngineManager(mode="hybrid")
-        manager.init_engine()
-
-        assert manager.structure_engine is not None
-        assert manager.engine is manager.structure_engine
-
     @patch("paddleocr_toolkit.core.ocr_engine.HAS_VL", False)
     def test_init_vl_without_module(self):
         """測試無VL模組時的錯誤"""
@@ -98,8 +118,7 @@ class TestOCREngineManager:
         with pytest.raises(ImportError, match="FormulaRecPipeline"):
             manager.init_engine()
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
-    def test_double_init_warning(self, mock_ocr):
+    def test_double_init_warning(self, mock_paddle):
         """測試重複初始化警告"""
         manager = OCREngineManager()
         manager.init_engine()
@@ -108,12 +127,11 @@ class TestOCREngineManager:
         manager.init_engine()
 
         # 只應該被呼叫一次
-        assert mock_ocr.call_count == 1
+        assert mock_paddle.call_count == 1
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
-    def test_init_failure(self, mock_ocr):
+    def test_init_failure(self, mock_paddle):
         """測試初始化失敗"""
-        mock_ocr.side_effect = Exception("Init failed")
+        mock_paddle.side_effect = Exception("Init failed")
 
         manager = OCREngineManager()
 
@@ -129,12 +147,11 @@ class TestOCREngineManager:
         with pytest.raises(RuntimeError, match="引擎未初始化"):
             manager.predict("test.jpg")
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
-    def test_predict_after_init(self, mock_ocr):
+    def test_predict_after_init(self, mock_paddle):
         """測試初始化後預測"""
         mock_engine = Mock()
         mock_engine.ocr.return_value = [["test", 0.95]]
-        mock_ocr.return_value = mock_engine
+        mock_paddle.return_value = mock_engine
 
         manager = OCREngineManager(mode="basic")
         manager.init_engine()
@@ -142,12 +159,11 @@ class TestOCREngineManager:
 
         assert mock_engine.ocr.called
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
-    def test_predict_with_kwargs(self, mock_ocr):
+    def test_predict_with_kwargs(self, mock_paddle):
         """測試帶kwargs的預測"""
         mock_engine = Mock()
         mock_engine.ocr.return_value = []
-        mock_ocr.return_value = mock_engine
+        mock_paddle.return_value = mock_engine
 
         manager = OCREngineManager()
         manager.init_engine()
@@ -155,8 +171,7 @@ class TestOCREngineManager:
 
         mock_engine.ocr.assert_called_with("test.jpg")
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
-    def test_context_manager(self, mock_ocr):
+    def test_context_manager(self):
         """測試 context manager"""
         with OCREngineManager(mode="basic") as manager:
             assert manager.is_initialized()
@@ -164,8 +179,7 @@ class TestOCREngineManager:
         # 退出後應該關閉
         assert not manager.is_initialized()
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
-    def test_context_manager_with_exception(self, mock_ocr):
+    def test_context_manager_with_exception(self):
         """測試context manager異常處理"""
         try:
             with OCREngineManager() as manager:
@@ -181,8 +195,7 @@ class TestOCREngineManager:
         manager = OCREngineManager(mode="structure")
         assert manager.get_mode() == OCRMode.STRUCTURE
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
-    def test_get_engine(self, mock_ocr):
+    def test_get_engine(self):
         """測試獲取引擎"""
         manager = OCREngineManager()
 
@@ -195,8 +208,7 @@ class TestOCREngineManager:
         engine = manager.get_engine()
         assert engine is not None
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
-    def test_close(self, mock_ocr):
+    def test_close(self):
         """測試關閉引擎"""
         manager = OCREngineManager()
         manager.init_engine()
@@ -208,6 +220,118 @@ class TestOCREngineManager:
         assert not manager.is_initialized()
         assert manager.engine is None
 
+    def test_engine_not_cached_by_default(self, mock_paddle, engine_cache):
+        """測試未啟用 reuse_engine 時每個管理器各自建立引擎"""
+        first = OCREngineManager(mode="basic")
+        first.init_engine()
+        first.close()
+
+        second = OCREngineManager(mode="basic")
+        second.init_engine()
+
+        assert mock_paddle.call_count == 2
+        assert len(engine_cache) == 0
+
+    def test_engine_reused_across_managers(self, mock_paddle, engine_cache):
+        """測試啟用 reuse_engine 時相同設定的管理器共用已載入的引擎"""
+        first = OCREngineManager(mode="basic", reuse_engine=True)
+        first.init_engine()
+        first.close()
+
+        second = OCREngineManager(mode="basic", reuse_engine=True)
+        second.init_engine()
+
+        mock_paddle.assert_called_once()
+        assert second.engine is mock_paddle.return_value
+
+        clear_engine_cache()
+        third = OCREngineManager(mode="basic", reuse_engine=True)
+        third.init_engine()
+        assert mock_paddle.call_count == 2
+
+    def test_engine_cache_evicts_least_recently_used(self, mock_paddle, engine_cache):
+        """測試快取超過上限時淘汰最久未使用的引擎"""
+
+        def init(**kwargs):
+            manager = OCREngineManager(mode="basic", reuse_engine=True, **kwargs)
+            manager.init_engine()
+            return manager
+
+        init()
+        init(use_doc_unwarping=True)
+        init()  # 重用後成為最近使用
+        init(use_textline_orientation=True)
+
+        assert len(engine_cache) == ocr_engine._ENGINE_CACHE_MAX_SIZE
+        assert mock_paddle.call_count == 3
+
+        init(use_doc_unwarping=True)  # 已被淘汰，需重新建立
+        assert mock_paddle.call_count == 4
+
+    def test_predict_lock_only_for_cached_engine(self, mock_paddle, engine_cache):
+        """測試只有共用快取引擎的管理器才序列化預測呼叫"""
+        own = OCREngineManager(mode="basic")
+        own.init_engine()
+        shared = OCREngineManager(mode="basic", reuse_engine=True)
+        shared.init_engine()
+
+        assert own._engine_lock is None
+        assert shared._engine_lock is not None
+
+    def test_warmup(self, mock_paddle):
+        """測試預熱會以空白影像呼叫引擎"""
+        manager = OCREngineManager(mode="basic")
+        manager.init_engine()
+
+        manager.warmup()
+
+        (blank,), _ = mock_paddle.return_value.ocr.call_args
+        assert blank.shape == (32, 32, 3)
+
+    def test_warmup_failure_logged(self, mock_paddle):
+        """測試預熱失敗只記錄警告"""
+        manager = OCREngineManager(mode="basic")
+        manager.init_engine()
+        mock_paddle.return_value.ocr.side_effect = RuntimeError("boom")
+
+        manager.warmup()
+
+    def test_warmup_without_init(self):
+        """測試未初始化時預熱"""
+        with pytest.raises(RuntimeError):
+            OCREngineManager().warmup()
+
+    def test_paddleocr_imported_lazily(self):
+        """測試 paddleocr 延遲到 init_engine 時才匯入"""
+        import paddleocr_toolkit.core.ocr_engine as module
+
+        fake_paddleocr = MagicMock()
+        unresolved = dict.fromkeys(
+            [
+                "_paddleocr_module",
+                "PaddleOCR",
+                "PPStructure",
+                "PPStructureV3",
+                "PaddleOCRVL",
+                "FormulaRecPipeline",
+                "HAS_STRUCTURE",
+                "HAS_VL",
+                "HAS_FORMULA",
+            ]
+        )
+        with patch.multiple(module, **unresolved), patch.dict(
+            "sys.modules", {"paddleocr": fake_paddleocr}
+        ):
+            manager = OCREngineManager(mode="basic")
+            assert module._paddleocr_module is None
+
+            manager.init_engine()
+
+            assert module._paddleocr_module is fake_paddleocr
+            assert module.PaddleOCR is fake_paddleocr.PaddleOCR
+            assert module.HAS_STRUCTURE is True
+            assert fake_paddleocr.PaddleOCR.called
+
     def test_close_without_init(self):
         """測試未初始化時關閉"""
         manager = OCREngineManager()
@@ -225,8 +349,7 @@ class TestOCREngineManager:
         assert "gpu" in repr_str
         assert "not initialized" in repr_str
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
-    def test_repr_after_init(self, mock_ocr):
+    def test_repr_after_init(self):
         """測試初始化後的字串表示"""
         manager = OCREngineManager()
         manager.init_engine()
@@ -238,31 +361,26 @@ class TestOCREngineManager:
 class TestOCRMode:
     """測試 OCRMode 列舉"""
 
-    def test_mode_values(self):
-        """測試模式值"""
-        assert OCRMode.BASIC.value == "basic"
-        assert OCRMode.STRUCTURE.value == "structure"
-        assert OCRMode.VL.value == "vl"
-        assert OCRMode.FORMULA.value == "formula"
-        assert OCRMode.HYBRID.value == "hybrid"
-
-    def test_mode_from_string(self):
-        """測試從字串建立模式"""
-        mode = OCRMode("basic")
-        assert mode == OCRMode.BASIC
+    @pytest.mark.parametrize(
+        "value, mode",
+        [
+            ("basic", OCRMode.BASIC),
+            ("structure", OCRMode.STRUCTURE),
+            ("vl", OCRMode.VL),
+            ("formula", OCRMode.FORMULA),
+            ("hybrid", OCRMode.HYBRID),
+        ],
+    )
+    def test_mode_roundtrip(self, value, mode):
+        """測試模式值與從字串建立模式"""
+        assert mode.value == value
+        assert OCRMode(value) is mode
 
     def test_all_modes(self):
         """測試所有模式"""
-        modes = list(OCRMode)
-        assert len(modes) == 5
-        assert OCRMode.BASIC in modes
-        assert OCRMode.STRUCTURE in modes
-        assert OCRMode.VL in modes
-        assert OCRMode.FORMULA in modes
-        assert OCRMode.HYBRID in modes
-
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
-    def test_predict_with_plugins(self, mock_ocr):
+        assert len(OCRMode) == 5
+
+    def test_predict_with_plugins(self, mock_paddle):
         """測試帶外掛的預測流程"""
         # Mock PluginLoader and Plugins
         mock_plugin = Mock()
@@ -275,7 +393,7 @@ class TestOCRMode:
         # Mock Engine
         mock_engine = Mock()
         mock_engine.ocr.return_value = "raw_result"
-        mock_ocr.return_value = mock_engine
+        mock_paddle.return_value = mock_engine
 
         manager = OCREngineManager(mode="basic", plugin_loader=mock_loader)
         manager.init_engine()
@@ -288,10 +406,9 @@ class TestOCRMode:
         mock_plugin.process_after_ocr.assert_called_with("raw_result")
         assert result == "processed_result"
 
-    @patch("paddleocr_toolkit.core.ocr_engine.PaddleOCR")
     @patch("paddleocr_toolkit.core.ocr_engine.PPStructure")
     @patch("paddleocr_toolkit.core.ocr_engine.HAS_STRUCTURE", True)
-    def test_init_hybrid_engine_fallback(self, mock_structure, mock_ocr):
+    def test_init_hybrid_engine_fallback(self, mock_structure, mock_paddle):
         """測試 Hybrid 模式初始化失敗降級"""
         # 模擬 PPStructure 初始化失敗
         mock_structure.side_effect = Exception("Structure Init Failed")
@@ -302,5 +419,5 @@ class TestOCRMode:
         # 驗證是否降級到 Basic Mode 初始化
         assert manager.is_initialized()
         mock_structure.assert_called_once()
-        mock_ocr.assert_called_once()  # Basic engine init called
-        assert manager.engine == mock_ocr.return_value
+        mock_paddle.assert_called_once()  # Basic engine init called
+        assert manager.engine == mock_paddle.return_value
@@ -3,15 +3,10 @@
 OCR Workaround 單元測試（擴充套件版）
 """
 
-import os
-import sys
-import tempfile
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-# 新增專案路徑
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 try:
     import fitz
 
@@ -19,6 +14,9 @@ try:
 except ImportError:
     HAS_FITZ = False
 
+requires_fitz = pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
+
+from paddleocr_toolkit.processors import ocr_workaround
 from paddleocr_toolkit.processors.ocr_workaround import (
     OCRWorkaround,
     TextBlock,
@@ -30,48 +28,56 @@ from paddleocr_toolkit.processors.ocr_workaround import (
 class TestTextBlock:
     """測試 TextBlock"""
 
-    def test_basic_creation(self):
-        """測試基本建立"""
-        block = TextBlock(text="Hello", x=10.0, y=20.0, width=100.0, height=30.0)
-
-        assert block.text == "Hello"
-        assert block.x == 10.0
-        assert block.y == 20.0
-        assert block.width == 100.0
-        assert block.height == 30.0
-
-    def test_with_color(self):
-        """測試指定顏色"""
-        block = TextBlock(text="Test", x=0, y=0, width=50, height=20, color=(1, 0, 0))
-
-        assert block.color == (1, 0, 0)
-
-    def test_default_color(self):
-        """測試預設顏色（黑色）"""
-        block = TextBlock(text="Test", x=0, y=0, width=50, height=20)
-
-        assert block.color == (0, 0, 0)
-
-    def test_unicode_text(self):
-        """測試 Unicode 文字"""
-        block = TextBlock(text="你好世界", x=0, y=0, width=100, height=30)
-
-        assert block.text == "你好世界"
+    @pytest.mark.parametrize(
+        "kwargs,expected_color",
+        [
+            # 基本建立，預設顏色為黑色
+            (dict(text="Hello", x=10.0, y=20.0, width=100.0, height=30.0), (0, 0, 0)),
+            # 指定顏色
+            (
+                dict(text="Test", x=0, y=0, width=50, height=20, color=(1, 0, 0)),
+                (1, 0, 0),
+            ),
+            # Unicode 文字
+            (dict(text="你好世界", x=0, y=0, width=100, height=30), (0, 0, 0)),
+        ],
+        ids=["basic", "color", "unicode"],
+    )
+    def test_textblock_construction(self, kwargs, expected_color):
+        """測試建立 TextBlock"""
+        block = TextBlock(**kwargs)
+
+        assert block.text == kwargs["text"]
+        assert (block.x, block.y) == (kwargs["x"], kwargs["y"])
+        assert (block.width, block.height) == (kwargs["width"], kwargs["height"])
+        assert block.color == expected_color
+
+
+@pytest.fixture(scope="module")
+def workaround():
+    """預設設定的 OCRWorkaround（測試不會修改其設定，可共用）"""
+    return OCRWorkaround()
+
+
+@pytest.fixture(scope="module")
+def blank_doc():
+    """共用的空白 PDF 文件，各測試自行新增頁面"""
+    doc = fitz.open()
+    yield doc
+    doc.close()
 
 
 class TestOCRWorkaround:
     """測試 OCRWorkaround"""
 
-    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_initialization(self):
-        """測試初始化"""
-        workaround = OCRWorkaround()
+    pytestmark = requires_fitz
 
+    def test_initialization(self, workaround):
+        """測試初始化"""
         assert workaround is not None
         assert workaround.margin == 2.0
         assert workaround.force_black is True
 
-    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
     def test_custom_settings(self):
         """測試自訂設定"""
         workaround = OCRWorkaround(
@@ -82,29 +88,19 @@ class TestOCRWorkaround:
         assert workaround.force_black is False
         assert workaround.mask_color == (0.9, 0.9, 0.9)
 
-    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_add_text_with_mask(self):
+    def test_add_text_with_mask(self, workaround, blank_doc):
         """測試新增文字遮罩"""
-        workaround = OCRWorkaround()
-
         # 建立測試頁面
-        doc = fitz.open()
-        page = doc.new_page(width=200, height=100)
+        page = blank_doc.new_page(width=200, height=100)
 
         text_block = TextBlock(text="Test", x=10, y=20, width=50, height=20)
 
         # 應該不會丟擲錯誤
         workaround.add_text_with_mask(page, text_block, "翻譯")
 
-        doc.close()
-
-    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_add_multiple_texts(self):
+    def test_add_multiple_texts(self, workaround, blank_doc):
         """測試新增多個文字"""
-        workaround = OCRWorkaround()
-
-        doc = fitz.open()
-        page = doc.new_page(width=300, height=200)
+        page = blank_doc.new_page(width=300, height=200)
 
         blocks = [
             TextBlock(text="Line 1", x=10, y=20, width=100, height=20),
@@ -115,7 +111,41 @@ class TestOCRWorkaround:
         for block in blocks:
             workaround.add_text_with_mask(page, block, f"翻譯 {block.text}")
 
-        doc.close()
+
+@pytest.fixture
+def mock_pdf(monkeypatch):
+    """以 MagicMock 取代 fitz.open，依每頁文字與圖片數模擬 PDF，不經 PyMuPDF 序列化"""
+
+    def _open(text="", images=0):
+        page = MagicMock()
+        page.get_text.return_value = text
+        page.get_images.return_value = [MagicMock()] * images
+        doc = MagicMock()
+        doc.__len__.return_value = 1
+        doc.__getitem__.return_value = page
+
+        monkeypatch.setattr(ocr_workaround, "HAS_FITZ", True)
+        monkeypatch.setattr(
+            ocr_workaround,
+            "fitz",
+            MagicMock(open=MagicMock(return_value=doc)),
+            raising=False,
+        )
+
+    return _open
+
+
+@pytest.fixture(scope="module")
+def mock_scanned_doc():
+    """單頁、文字少且含圖片的掃描件 MagicMock，模組內共用"""
+    page = MagicMock()
+    page.get_text.return_value = "short"
+    page.get_images.return_value = [1]
+    doc = MagicMock()
+    doc.__len__.return_value = 1
+    doc.__getitem__.return_value = page
+    yield doc
+    doc.reset_mock()
 
 
 class TestDetectScannedDocument:
@@ -127,47 +157,22 @@ class TestDetectScannedDocument:
 
         assert result is False
 
-    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_text_pdf(self):
+    def test_text_pdf(self, mock_pdf):
         """測試有文字的 PDF"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        mock_pdf(text="This is test text. " * 100)
 
-        try:
-            doc = fitz.open()
-            page = doc.new_page()
-            page.insert_text((100, 100), "This is test text. " * 100)
-            doc.save(temp_path)
-            doc.close()
+        result = detect_scanned_document("text.pdf")
 
-            result = detect_scanned_document(temp_path)
-
-            assert result is False
-
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert result is False
 
-    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_empty_pdf(self):
+    def test_empty_pdf(self, mock_pdf):
         """測試空白 PDF"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        mock_pdf()
 
-        try:
-            doc = fitz.open()
-            doc.new_page()
-            doc.save(temp_path)
-            doc.close()
+        result = detect_scanned_document("blank.pdf")
 
-            result = detect_scanned_document(temp_path)
-
-            # 空白 PDF 應被視為掃描件
-            assert isinstance(result, bool)
-
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # 沒有文字也沒有圖片，不視為掃描件
+        assert result is False
 
 
 class TestShouldUseOcrWorkaround:
@@ -179,67 +184,26 @@ class TestShouldUseOcrWorkaround:
 
         assert result is False
 
-    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_text_pdf(self):
+    def test_text_pdf(self, mock_pdf):
         """測試有文字的 PDF"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        mock_pdf(text="This is test text. " * 100)
 
-        try:
-            doc = fitz.open()
-            page = doc.new_page()
-            page.insert_text((100, 100), "Normal text PDF " * 50)
-            doc.save(temp_path)
-            doc.close()
+        result = should_use_ocr_workaround("text.pdf", auto_enable=True)
 
-            result = should_use_ocr_workaround(temp_path)
-
-            assert result is False
-
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert result is False
 
-    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_image_only_pdf(self):
+    def test_image_only_pdf(self, mock_pdf):
         """測試純圖片 PDF"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            doc = fitz.open()
-            page = doc.new_page(width=100, height=100)
-            # 不插入任何文字，只是空白頁
-            doc.save(temp_path)
-            doc.close()
+        mock_pdf(images=1)
 
-            result = should_use_ocr_workaround(temp_path)
+        result = should_use_ocr_workaround("scanned.pdf", auto_enable=True)
 
-            # 純圖片 PDF 應該建議使用 OCR workaround
-            assert isinstance(result, bool)
-
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-
-
-# 執行測試
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
-
-# Added from Ultra Coverage
-from paddleocr_toolkit.processors.ocr_workaround import (
-    OCRWorkaround,
-    TextBlock,
-    detect_scanned_document,
-    should_use_ocr_workaround,
-)
-from unittest.mock import MagicMock, patch
-import pytest
+        # 純圖片 PDF 應該建議使用 OCR workaround
+        assert result is True
 
 
 class TestOCRWorkaroundUltra:
-    def test_workaround_branches(self):
+    def test_workaround_branches(self, mock_scanned_doc):
         worker = OCRWorkaround()
         block_small = TextBlock("t", 0, 0, 10, 5)
         mock_page = MagicMock()
@@ -255,24 +219,21 @@ class TestOCRWorkaroundUltra:
 
         # Call process_page (lines 147-153)
         assert worker.process_page(mock_page, [(block_small, "t")]) == 1
-        mock_doc = MagicMock()
-        mock_doc.__len__.return_value = 0
-        with patch("fitz.open", return_value=mock_doc):
+        empty_doc = MagicMock()
+        empty_doc.__len__.return_value = 0
+        with patch("fitz.open", return_value=empty_doc):
             assert detect_scanned_document("test.pdf") is False
 
-        # Success path (lines 182-207)
-        mock_doc.__len__.return_value = 1
-        mock_page = MagicMock()
-        mock_page.get_text.return_value = "short"
-        mock_page.get_images.return_value = [1]
-        mock_doc.__getitem__.return_value = mock_page
-        with patch("fitz.open", return_value=mock_doc), patch(
-            "paddleocr_toolkit.processors.ocr_workaround.HAS_FITZ", True
+        # 共用的 mock_scanned_doc 不可修改，例外情境另建 MagicMock
+        broken_doc = MagicMock()
+        broken_doc.__len__.side_effect = Exception("Crash")
+        with patch("paddleocr_toolkit.processors.ocr_workaround.HAS_FITZ", True), patch(
+            "fitz.open", side_effect=[mock_scanned_doc, broken_doc]
         ):
+            # Success path (lines 182-207)
             assert detect_scanned_document("scanned.pdf") is True
 
             # Exception (line 205-207)
-            mock_doc.__len__.side_effect = Exception("Crash")
             assert detect_scanned_document("bad.pdf") is False
 
     def test_should_use_workaround(self):
@@ -287,3 +248,8 @@ class TestOCRWorkaroundUltra:
         with patch("paddleocr_toolkit.processors.ocr_workaround.HAS_FITZ", False):
             with pytest.raises(ImportError):
                 OCRWorkaround()
+
+
+# 執行測試
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,217 +3,247 @@
 OutputManager 測試
 """
 
+import builtins
+import importlib
+import io
 import json
 import sys
-import builtins
 from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import patch
 
 import pytest
 
 from paddleocr_toolkit.outputs.output_manager import OutputManager
 
 
+class _MemoryFile(io.StringIO):
+    """關閉時將內容記錄到 files[path] 的 StringIO"""
+
+    def __init__(self, files, path):
+        super().__init__()
+        self._files = files
+        self._path = path
+
+    def close(self):
+        if not self.closed:
+            self._files[self._path] = self.getvalue()
+        super().close()
+
+
 class TestOutputManager:
     """測試輸出管理器"""
 
-    def test_init_basic(self):
-        """測試基本初始化"""
-        manager = OutputManager(base_path="output/result")
+    @pytest.fixture
+    def written_files(self, monkeypatch):
+        """以記憶體中的 StringIO 取代 open，依路徑記錄寫入內容，不實際建立輸出檔"""
+        files = {}
+
+        def fake_open(path, mode="r", *args, **kwargs):
+            return _MemoryFile(files, str(path))
+
+        monkeypatch.setattr(builtins, "open", fake_open)
+        return files
 
-        assert manager.base_path == Path("output/result")
+    @pytest.fixture
+    def base_path(self, tmp_path):
+        """位於暫存目錄的輸出基礎路徑，寫入時 mkdir 不會碰到工作目錄"""
+        return str(tmp_path / "result")
+
+    @pytest.fixture
+    def manager(self, base_path):
+        """未指定格式的 OutputManager"""
+        return OutputManager(base_path=base_path)
+
+    def test_init_basic(self, manager, base_path):
+        """測試基本初始化"""
+        assert manager.base_path == Path(base_path)
         assert len(manager.formats) == 0
 
-    def test_init_with_formats(self):
+    def test_init_with_formats(self, base_path):
         """測試帶格式的初始化"""
-        manager = OutputManager(
-            base_path="output/result", formats=["md", "json", "txt"]
-        )
+        manager = OutputManager(base_path=base_path, formats=["md", "json", "txt"])
 
         assert "md" in manager.formats
         assert "json" in manager.formats
         assert "txt" in manager.formats
 
-    def test_add_format(self):
+    def test_add_format(self, manager):
         """測試新增格式"""
-        manager = OutputManager(base_path="output/result")
-
         manager.add_format("html")
         assert "html" in manager.formats
 
         manager.add_format("HTML")  # 測試大小寫
         assert "html" in manager.formats
 
-    def test_remove_format(self):
+    def test_remove_format(self, base_path):
         """測試移除格式"""
-        manager = OutputManager(base_path="output/result", formats=["md", "json"])
+        manager = OutputManager(base_path=base_path, formats=["md", "json"])
 
         manager.remove_format("md")
         assert "md" not in manager.formats
         assert "json" in manager.formats
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_write_markdown(self, mock_file):
+    def test_write_markdown(self, manager, base_path, written_files):
         """測試寫入Markdown"""
-        manager = OutputManager(base_path="output/result")
-
         path = manager.write_markdown("# Title\nContent")
 
-        assert str(Path(path)) == str(Path("output/result.md"))
-        mock_file.assert_called()
+        assert path == f"{base_path}.md"
+        assert written_files[path] == "# Title\nContent"
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_write_json(self, mock_file):
+    def test_write_json(self, manager, base_path, written_files):
         """測試寫入JSON"""
-        manager = OutputManager(base_path="output/result")
-
         data = {"key": "value", "number": 123}
         path = manager.write_json(data)
 
-        assert str(Path(path)) == str(Path("output/result.json"))
-        mock_file.assert_called()
+        assert path == f"{base_path}.json"
+        assert json.loads(written_files[path]) == data
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_write_text(self, mock_file):
-        """測試寫入文字"""
-        manager = OutputManager(base_path="output/result")
+    def test_write_json_iterator_unbuffered(self, base_path, written_files):
+        """測試未啟用緩衝時，迭代器會先轉為 list 再寫入"""
+        manager = OutputManager(base_path=base_path, use_buffered=False)
+
+        path = manager.write_json(i for i in range(3))
+
+        assert json.loads(written_files[path]) == [0, 1, 2]
+
+    @pytest.mark.parametrize(
+        "data", [range(3), {0: "a", 1: "b", 2: "c"}.keys()], ids=["range", "keys"]
+    )
+    def test_write_json_iterable_unbuffered(self, base_path, written_files, data):
+        """測試未啟用緩衝時，range、dict views 等可迭代物件以陣列寫入"""
+        manager = OutputManager(base_path=base_path, use_buffered=False)
+
+        path = manager.write_json(data)
 
+        assert json.loads(written_files[path]) == [0, 1, 2]
+
+    def test_write_text(self, manager, base_path, written_files):
+        """測試寫入文字"""
         path = manager.write_text("Plain text content")
 
-        assert str(Path(path)) == str(Path("output/result.txt"))
-        mock_file.assert_called()
+        assert path == f"{base_path}.txt"
+        assert written_files[path] == "Plain text content"
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_write_html(self, mock_file):
+    def test_write_html(self, manager, base_path, written_files):
         """測試寫入HTML"""
-        manager = OutputManager(base_path="output/result")
-
         path = manager.write_html("Content", title="Test Page")
 
-        assert str(Path(path)) == str(Path("output/result.html"))
-        mock_file.assert_called()
-
-    @patch("builtins.open", new_callable=mock_open)
-    def test_write_all(self, mock_file):
-        """測試批次寫入"""
+        assert path == f"{base_path}.html"
+        assert "<title>Test Page</title>" in written_files[path]
+        assert "<pre>Content</pre>" in written_files[path]
+
+    @pytest.mark.parametrize(
+        "content,failing,expected_keys",
+        [
+            # 全部格式；未提供 html 時以 text 產生
+            (
+                {"text": "Plain text", "markdown": "# Title", "json_data": {"k": 1}},
+                None,
+                {"markdown", "json", "text", "html"},
+            ),
+            # html 分支 (lines 216-221)
+            ({"html": "<h1>Hi</h1>"}, None, {"html"}),
+            # 單一格式失敗時記錄後繼續寫入其他格式 (lines 223-224)
+            ({"text": "Plain text", "json_data": {}}, "write_json", {"text", "html"}),
+        ],
+        ids=["all", "html", "json-fails"],
+    )
+    def test_write_all(self, tmp_path, base_path, content, failing, expected_keys):
+        """測試批次寫入（實際寫入 tmp_path，驗證多個格式的檔案內容）"""
         manager = OutputManager(
-            base_path="output/result", formats=["md", "json", "txt"]
+            base_path=base_path, formats=["md", "json", "txt", "html"]
         )
 
-        content_dict = {
-            "text": "Plain text",
-            "markdown": "# Title",
-            "json_data": {"key": "value"},
-        }
-
-        paths = manager.write_all(content_dict)
+        if failing:
+            with patch.object(manager, failing, side_effect=Exception("Write Fail")):
+                paths = manager.write_all(content)
+        else:
+            paths = manager.write_all(content)
 
-        assert "markdown" in paths
-        assert "json" in paths
-        assert "text" in paths
-
-    def test_get_output_path(self):
+        written = {
+            str(path): path.read_text(encoding="utf-8") for path in tmp_path.iterdir()
+        }
+        assert set(paths) == expected_keys
+        assert set(written) == set(paths.values())
+        if "markdown" in paths:
+            assert written[paths["markdown"]] == content["markdown"]
+        if "text" in paths:
+            assert written[paths["text"]] == content["text"]
+        html = content.get("html") or content.get("text")
+        assert f"<pre>{html}</pre>" in written[paths["html"]]
+
+    def test_get_output_path(self, manager, base_path):
         """測試獲取輸出路徑"""
-        manager = OutputManager(base_path="output/result")
-
-        assert str(Path(manager.get_output_path("md"))) == str(Path("output/result.md"))
-        assert str(Path(manager.get_output_path("json"))) == str(
-            Path("output/result.json")
-        )
+        assert manager.get_output_path("md") == f"{base_path}.md"
+        assert manager.get_output_path("json") == f"{base_path}.json"
 
-    def test_context_manager(self):
+    def test_context_manager(self, base_path):
         """測試Context Manager"""
-        with OutputManager(base_path="output/result") as manager:
+        with OutputManager(base_path=base_path) as manager:
             assert isinstance(manager, OutputManager)
 
         # 驗證退出後清理完成
         assert len(manager.writers) == 0
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_write_markdown_custom_path(self, mock_file):
+    def test_write_markdown_custom_path(self, manager, tmp_path, written_files):
         """測試自定義路徑寫入"""
-        manager = OutputManager(base_path="output/result")
+        custom_path = str(tmp_path / "custom" / "path.md")
 
-        path = manager.write_markdown("Content", output_path="custom/path.md")
+        path = manager.write_markdown("Content", output_path=custom_path)
 
-        assert path == "custom/path.md"
+        assert path == custom_path
+        assert written_files[custom_path] == "Content"
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_write_json_with_indent(self, mock_file):
+    def test_write_json_with_indent(self, manager, written_files):
         """測試JSON縮排"""
-        manager = OutputManager(base_path="output/result")
-
         data = {"key": "value"}
-        manager.write_json(data, indent=4)
+        path = manager.write_json(data, indent=4)
 
-        mock_file.assert_called()
+        assert written_files[path] == json.dumps(data, ensure_ascii=False, indent=4)
 
 
 class TestOutputManagerAdvanced:
     """進階 OutputManager 測試 (Mocking & Edge Cases)"""
 
-    def test_import_fallback(self):
-        # Cover lines 21-22 (ImportError for BufferedJSONWriter)
-        # We need to reload output_manager with mocked imports
-        import importlib
+    def test_buffered_disabled_without_writer(self, output_manager_module, monkeypatch):
+        """BufferedJSONWriter 不可用時，use_buffered 一律為 False"""
+        monkeypatch.setattr(output_manager_module, "HAS_BUFFERED", False)
 
-        real_import = builtins.__import__
+        mgr = output_manager_module.OutputManager("test", use_buffered=True)
 
-        def mock_import(name, *args, **kwargs):
-            if name == "paddleocr_toolkit.core.buffered_writer":
-                raise ImportError("No Buffer")
-            return real_import(name, *args, **kwargs)
+        assert mgr.use_buffered is False
 
-        if "paddleocr_toolkit.outputs.output_manager" in sys.modules:
-            del sys.modules["paddleocr_toolkit.outputs.output_manager"]
-
-        with patch("builtins.__import__", side_effect=mock_import):
-            import paddleocr_toolkit.outputs.output_manager as om
-
-            assert om.HAS_BUFFERED is False
-
-        # Restore module
-        if "paddleocr_toolkit.outputs.output_manager" in sys.modules:
-            del sys.modules["paddleocr_toolkit.outputs.output_manager"]
-        importlib.import_module("paddleocr_toolkit.outputs.output_manager")
-
-    def test_buffered_writer_usage(self):
+    @pytest.mark.slow
+    def test_import_fallback(self, output_manager_module):
+        # Cover lines 21-22 (ImportError for BufferedJSONWriter)
+        # sys.modules 中的 None 會讓 import 拋出 ImportError；reload 沿用同一模組物件
+        try:
+            with patch.dict(
+                sys.modules, {"paddleocr_toolkit.core.buffered_writer": None}
+            ):
+                importlib.reload(output_manager_module)
+                assert output_manager_module.HAS_BUFFERED is False
+        finally:
+            importlib.reload(output_manager_module)
+
+    @pytest.mark.parametrize(
+        "data",
+        [[1, 2, 3], (1, 2, 3), (i for i in range(1, 4)), range(1, 4)],
+        ids=["list", "tuple", "generator", "range"],
+    )
+    def test_buffered_writer_usage(self, output_manager_module, data):
         # Cover lines 111-113 (use_buffered=True branch)
-        # Ensure module is loaded fresh or correctly
-        if "paddleocr_toolkit.outputs.output_manager" not in sys.modules:
-            import paddleocr_toolkit.outputs.output_manager
-
-        from paddleocr_toolkit.outputs.output_manager import OutputManager
-
-        # Trigger use_buffered=True and data is list
-        # We need to mock BufferedJSONWriter
-        with patch(
-            "paddleocr_toolkit.outputs.output_manager.BufferedJSONWriter"
+        # 緩衝寫入逐項消耗任何序列或迭代器，不需先組成 list
+        with patch.object(
+            output_manager_module, "BufferedJSONWriter", create=True
         ) as MockWriter:
             mock_instance = MockWriter.return_value
             mock_instance.__enter__.return_value = mock_instance
 
-            mgr = OutputManager("test", use_buffered=True)
+            mgr = output_manager_module.OutputManager("test", use_buffered=True)
             # Force switch if HAS_BUFFERED was false
             mgr.use_buffered = True
 
-            data = [1, 2, 3]
             mgr.write_json(data)
 
-            assert mock_instance.write.call_count == 3
-
-    def test_write_all_exceptions(self):
-        # Cover lines 216-224: html branch + exception handling in loop
-        from paddleocr_toolkit.outputs.output_manager import OutputManager
-
-        mgr = OutputManager("test", formats=["html", "json"])
-
-        # 1. HTML branch (lines 216-221)
-        with patch.object(mgr, "write_html") as mock_html:
-            mgr.write_all({"html": "<h1>Hi</h1>"})
-            mock_html.assert_called()
-
-        # 2. Exception in loop (lines 223-224)
-        with patch.object(mgr, "write_json", side_effect=Exception("Write Fail")):
-            # Should catch exception and continue/log
-            mgr.write_all({"json_data": {}})
+            assert [c.args[0] for c in mock_instance.write.call_args_list] == [1, 2, 3]
@@ -3,14 +3,8 @@
 paddleocr_toolkit 套件初始化測試
 """
 
-import os
-import sys
-
 import pytest
 
-# 新增專案路徑
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 
 class TestPackageInit:
     """測試套件初始化"""
@@ -49,7 +43,7 @@ class TestPackageInit:
         """測試 __all__ 匯出"""
         import paddleocr_toolkit
 
-        expected = [
+        expected = {
             "__version__",
             "__author__",
             "OCRResult",
@@ -60,10 +54,10 @@ class TestPackageInit:
             "SUPPORTED_IMAGE_FORMATS",
             "SUPPORTED_PDF_FORMAT",
             "get_paddle_ocr_tool",
-        ]
+        }
 
-        for name in expected:
-            assert name in paddleocr_toolkit.__all__
+        # 一次集合運算，失敗時直接列出缺少的名稱
+        assert expected - set(paddleocr_toolkit.__all__) == set()
 
 
 class TestCoreImports:
@@ -3,44 +3,78 @@
 測試 PaddleOCRFacade
 """
 
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
 from paddle_ocr_facade import PaddleOCRFacade
 from paddleocr_toolkit.core import OCRMode
+from paddleocr_toolkit.core.ocr_engine import OCREngineManager
+
+# 測試中反覆使用的模式常數
+_BASIC = OCRMode.BASIC
+_HYBRID = OCRMode.HYBRID
+
+
+@pytest.fixture(scope="module")
+def _patched_classes():
+    """整個模組只進入一次 OCREngineManager 與 HybridPDFProcessor 的 patch"""
+    with ExitStack() as stack:
+        engine_class = stack.enter_context(patch("paddle_ocr_facade.OCREngineManager"))
+        processor_class = stack.enter_context(
+            patch("paddleocr_toolkit.processors.hybrid_processor.HybridPDFProcessor")
+        )
+        yield engine_class, processor_class
+
+
+@pytest.fixture(autouse=True)
+def fx(_patched_classes):
+    """
+    每個測試重設 patch 後的類別，並換上新的實例
+
+    engine / processor 為兩者建構出的實例；預設為 BASIC 模式，
+    需要其他模式的測試自行設定 fx.engine.get_mode.return_value。
+    engine 以 spec_set=OCREngineManager 建立，拼錯方法名稱會直接報錯。
+    """
+    engine_class, processor_class = _patched_classes
+    engine_class.reset_mock()
+    processor_class.reset_mock()
+    engine = engine_class.return_value = Mock(spec_set=OCREngineManager)
+    engine.get_mode.return_value = _BASIC
+    processor = processor_class.return_value = Mock()
+
+    return SimpleNamespace(
+        engine_class=engine_class,
+        engine=engine,
+        processor_class=processor_class,
+        processor=processor,
+    )
 
 
 class TestPaddleOCRFacadeInitialization:
     """測試 PaddleOCRFacade 初始化"""
 
-    @patch("paddle_ocr_facade.OCREngineManager")
-    def test_init_basic_mode(self, mock_engine_class):
+    def test_init_basic_mode(self, fx):
         """測試基本模式初始化"""
-        mock_engine = Mock()
-        mock_engine.get_mode.return_value = OCRMode.BASIC
-        mock_engine_class.return_value = mock_engine
-
         facade = PaddleOCRFacade(mode="basic")
 
         assert facade.mode == "basic"
         assert facade.debug_mode is False
         assert facade.compress_images is True
         assert facade.jpeg_quality == 85
-        mock_engine.init_engine.assert_called_once()
+        fx.engine.init_engine.assert_called_once()
 
-    @patch("paddle_ocr_facade.OCREngineManager")
-    @patch("paddleocr_toolkit.processors.hybrid_processor.HybridPDFProcessor")
-    def test_init_hybrid_mode(self, mock_processor_class, mock_engine_class):
-        """測試混合模式初始化"""
-        mock_engine = Mock()
-        mock_engine.get_mode.return_value = OCRMode.HYBRID
-        mock_engine.init_engine = Mock()
-        mock_engine_class.return_value = mock_engine
+    def test_init_reuses_cached_engine(self, fx):
+        """測試 Facade 以行程內快取共用引擎"""
+        PaddleOCRFacade(mode="basic")
+
+        assert fx.engine_class.call_args.kwargs["reuse_engine"] is True
 
-        # Mock processor
-        mock_processor = Mock()
-        mock_processor_class.return_value = mock_processor
+    def test_init_hybrid_mode(self, fx):
+        """測試混合模式初始化"""
+        fx.engine.get_mode.return_value = _HYBRID
 
         facade = PaddleOCRFacade(mode="hybrid", debug_mode=True)
 
@@ -48,15 +82,10 @@ class TestPaddleOCRFacadeInitialization:
         assert facade.debug_mode is True
         assert hasattr(facade, "hybrid_processor")
         # 驗證 processor 被正確初始化
-        mock_processor_class.assert_called_once()
+        fx.processor_class.assert_called_once()
 
-    @patch("paddle_ocr_facade.OCREngineManager")
-    def test_init_with_custom_settings(self, mock_engine_class):
+    def test_init_with_custom_settings(self):
         """測試自訂設定初始化"""
-        mock_engine = Mock()
-        mock_engine.get_mode.return_value = OCRMode.BASIC
-        mock_engine_class.return_value = mock_engine
-
         facade = PaddleOCRFacade(
             mode="basic",
             device="gpu",
@@ -72,32 +101,19 @@ class TestPaddleOCRFacadeInitialization:
 class TestPaddleOCRFacadeProcessHybrid:
     """測試混合模式處理"""
 
-    @patch("paddle_ocr_facade.OCREngineManager")
-    @patch("paddleocr_toolkit.processors.hybrid_processor.HybridPDFProcessor")
-    def test_process_hybrid_delegation(self, mock_processor_class, mock_engine_class):
+    def test_process_hybrid_delegation(self, fx):
         """測試 process_hybrid 委派給 HybridPDFProcessor"""
-        mock_engine = Mock()
-        mock_engine.get_mode.return_value = OCRMode.HYBRID
-        mock_engine.init_engine = Mock()
-        mock_engine_class.return_value = mock_engine
-
-        mock_processor = Mock()
-        mock_processor.process_pdf.return_value = {"pages_processed": 5}
-        mock_processor_class.return_value = mock_processor
+        fx.engine.get_mode.return_value = _HYBRID
+        fx.processor.process_pdf.return_value = {"pages_processed": 5}
 
         facade = PaddleOCRFacade(mode="hybrid")
         result = facade.process_hybrid("input.pdf", "output.pdf")
 
-        mock_processor.process_pdf.assert_called_once()
+        fx.processor.process_pdf.assert_called_once()
         assert result["pages_processed"] == 5
 
-    @patch("paddle_ocr_facade.OCREngineManager")
-    def test_process_hybrid_wrong_mode_raises_error(self, mock_engine_class):
+    def test_process_hybrid_wrong_mode_raises_error(self):
         """測試錯誤模式時丟擲異常"""
-        mock_engine = Mock()
-        mock_engine.get_mode.return_value = OCRMode.BASIC
-        mock_engine_class.return_value = mock_engine
-
         facade = PaddleOCRFacade(mode="basic")
 
         with pytest.raises(ValueError, match="僅適用於 hybrid 模式"):
@@ -107,31 +123,18 @@ class TestPaddleOCRFacadeProcessHybrid:
 class TestPaddleOCRFacadeUnifiedProcess:
     """測試統一處理介面"""
 
-    @patch("paddle_ocr_facade.OCREngineManager")
-    @patch("paddleocr_toolkit.processors.hybrid_processor.HybridPDFProcessor")
-    def test_process_routes_to_hybrid(self, mock_processor_class, mock_engine_class):
+    def test_process_routes_to_hybrid(self, fx):
         """測試 process() 正確路由到 hybrid 模式"""
-        mock_engine = Mock()
-        mock_engine.get_mode.return_value = OCRMode.HYBRID
-        mock_engine.init_engine = Mock()
-        mock_engine_class.return_value = mock_engine
-
-        mock_processor = Mock()
-        mock_processor.process_pdf.return_value = {"mode": "hybrid"}
-        mock_processor_class.return_value = mock_processor
+        fx.engine.get_mode.return_value = _HYBRID
+        fx.processor.process_pdf.return_value = {"mode": "hybrid"}
 
         facade = PaddleOCRFacade(mode="hybrid")
         result = facade.process("input.pdf")
 
         assert result["mode"] == "hybrid"
 
-    @patch("paddle_ocr_facade.OCREngineManager")
-    def test_process_unsupported_mode_raises_error(self, mock_engine_class):
+    def test_process_unsupported_mode_raises_error(self):
         """測試不支援的模式"""
-        mock_engine = Mock()
-        mock_engine.get_mode.return_value = OCRMode.BASIC
-        mock_engine_class.return_value = mock_engine
-
         facade = PaddleOCRFacade(mode="unknown")
 
         with pytest.raises(ValueError, match="不支援的模式"):
@@ -141,46 +144,30 @@ class TestPaddleOCRFacadeUnifiedProcess:
 class TestPaddleOCRFacadeBackwardCompatibility:
     """測試向後相容性"""
 
-    @patch("paddle_ocr_facade.OCREngineManager")
-    def test_get_engine(self, mock_engine_class):
+    def test_get_engine(self, fx):
         """測試 get_engine() 方法"""
-        mock_engine = Mock()
-        mock_engine.get_mode.return_value = OCRMode.BASIC
         mock_real_engine = Mock()
-        mock_engine.get_engine.return_value = mock_real_engine
-        mock_engine_class.return_value = mock_engine
+        fx.engine.get_engine.return_value = mock_real_engine
 
         facade = PaddleOCRFacade()
         engine = facade.get_engine()
 
         assert engine == mock_real_engine
 
-    @patch("paddle_ocr_facade.OCREngineManager")
-    def test_predict(self, mock_engine_class):
+    def test_predict(self, fx):
         """測試 predict() 方法"""
-        mock_engine = Mock()
-        mock_engine.get_mode.return_value = OCRMode.BASIC
-        mock_engine.predict.return_value = ["result"]
-        mock_engine_class.return_value = mock_engine
+        fx.engine.predict.return_value = ["result"]
 
         facade = PaddleOCRFacade()
         result = facade.predict("image")
 
-        mock_engine.predict.assert_called_once_with("image")
+        fx.engine.predict.assert_called_once_with("image")
         assert result == ["result"]
 
     def test_repr(self):
         """測試字串表示"""
-        with patch("paddle_ocr_facade.OCREngineManager") as mock_engine_class:
-            mock_engine = Mock()
-            mock_engine.init_engine = Mock()
-            mock_engine_class.return_value = mock_engine
-
-            with patch(
-                "paddleocr_toolkit.processors.hybrid_processor.HybridPDFProcessor"
-            ):
-                facade = PaddleOCRFacade(mode="hybrid", device="gpu")
-                repr_str = repr(facade)
-
-                assert "mode=hybrid" in repr_str
-                assert "device=gpu" in repr_str
+        facade = PaddleOCRFacade(mode="hybrid", device="gpu")
+        repr_str = repr(facade)
+
+        assert "mode=hybrid" in repr_str
+        assert "device=gpu" in repr_str
@@ -2,39 +2,59 @@
 """
 Parallel PDF Processor Tests
 """
-import os
-import sys
-import pytest
-import numpy as np
+from multiprocessing.pool import ThreadPool
 from unittest.mock import MagicMock, Mock, patch
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+import pytest
 
+from paddleocr_toolkit.processors import parallel_pdf_processor
 from paddleocr_toolkit.processors.parallel_pdf_processor import ParallelPDFProcessor
 
 
+@pytest.fixture(scope="class")
+def fitz_doc_mock():
+    """Shared fitz document/page mocks; tests set __len__ to the page count they need"""
+    mock_page = MagicMock()
+    mock_page.get_pixmap.return_value.tobytes.return_value = b"img"
+    mock_doc = MagicMock()
+    mock_doc.load_page.return_value = mock_page
+    return mock_doc, mock_page
+
+
+@pytest.fixture
+def mock_fitz_open(fitz_doc_mock):
+    """Patch fitz.open to return the shared document mock"""
+    mock_doc, _ = fitz_doc_mock
+    mock_doc.reset_mock()
+    with patch("fitz.open", return_value=mock_doc) as mocked:
+        yield mocked
+
+
 class TestParallelPDFProcessor:
-    def test_init_default_workers(self):
-        """Test initialization with default workers from cpu_count"""
+    @pytest.mark.parametrize(
+        "ocr_workers,workers,expected",
+        [
+            (None, None, 7),  # cpu_count() - 1
+            ("4", None, 4),  # OCR_WORKERS env var
+            (None, 2, 2),  # explicit argument
+        ],
+        ids=["default", "env", "explicit"],
+    )
+    def test_init_workers(self, monkeypatch, ocr_workers, workers, expected):
+        """Test worker count from cpu_count, OCR_WORKERS and explicit argument"""
+        if ocr_workers is None:
+            monkeypatch.delenv("OCR_WORKERS", raising=False)
+        else:
+            monkeypatch.setenv("OCR_WORKERS", ocr_workers)
+
         with patch(
             "paddleocr_toolkit.processors.parallel_pdf_processor.cpu_count",
             return_value=8,
         ):
-            with patch.dict(os.environ, {}, clear=True):
-                processor = ParallelPDFProcessor()
-                assert processor.workers == 7  # 8 - 1
-
-    def test_init_env_workers(self):
-        """Test initialization with OCR_WORKERS env var"""
-        with patch.dict(os.environ, {"OCR_WORKERS": "4"}):
-            processor = ParallelPDFProcessor()
-            assert processor.workers == 4
+            processor = ParallelPDFProcessor(workers=workers)
 
-    def test_init_explicit_workers(self):
-        """Test initialization with explicit workers argument"""
-        processor = ParallelPDFProcessor(workers=2)
-        assert processor.workers == 2
+        assert processor.workers == expected
 
     @patch("paddleocr_toolkit.core.ocr_engine.OCREngineManager")
     @patch("cv2.imdecode")
@@ -51,6 +71,7 @@ class TestParallelPDFProcessor:
 
         assert page_num == 0
         assert result == "Standard Result"
+        mock_engine_cls.assert_called_once_with(reuse_engine=True, mode="basic")
         mock_engine.init_engine.assert_called_once()
 
     def test_process_single_page_error(self):
@@ -63,15 +84,10 @@ class TestParallelPDFProcessor:
         assert page_num == 1
         assert "Error on page 1" in str(result)
 
-    @patch("fitz.open")
-    def test_process_pdf_parallel_serial_fallback(self, mock_fitz_open):
+    def test_process_pdf_parallel_serial_fallback(self, fitz_doc_mock, mock_fitz_open):
         """Test serial processing when page count is small"""
-        mock_doc = MagicMock()
+        mock_doc, _ = fitz_doc_mock
         mock_doc.__len__.return_value = 1
-        mock_page = MagicMock()
-        mock_page.get_pixmap.return_value.tobytes.return_value = b"img"
-        mock_doc.load_page.return_value = mock_page
-        mock_fitz_open.return_value = mock_doc
 
         processor = ParallelPDFProcessor(workers=4)
 
@@ -85,43 +101,26 @@ class TestParallelPDFProcessor:
             assert mock_single.call_count == 1
             # Should NOT use Pool because total_pages (1) <= 2
 
-    @patch("fitz.open")
-    @patch("paddleocr_toolkit.processors.parallel_pdf_processor.Pool")
-    def test_process_pdf_parallel_pool_usage(self, mock_pool_cls, mock_fitz_open):
-        """Test parallel processing using Pool when page count is large"""
-        mock_doc = MagicMock()
+    def test_process_pdf_parallel_pool_usage(self, fitz_doc_mock, mock_fitz_open):
+        """Test parallel processing through a real Pool.map when page count is large"""
+        mock_doc, _ = fitz_doc_mock
         mock_doc.__len__.return_value = 5  # > 2
-        mock_page = MagicMock()
-        mock_page.get_pixmap.return_value.tobytes.return_value = b"img"
-        mock_doc.load_page.return_value = mock_page
-        mock_fitz_open.return_value = mock_doc
-
-        # Setup Pool Mock
-        mock_pool = MagicMock()
-        mock_pool.__enter__.return_value = mock_pool
-        mock_pool.map.return_value = [
-            (0, "R0"),
-            (1, "R1"),
-            (2, "R2"),
-            (3, "R3"),
-            (4, "R4"),
-        ]
-        mock_pool_cls.return_value = mock_pool
 
-        processor = ParallelPDFProcessor(workers=4)
-
-        results = processor.process_pdf_parallel("dummy.pdf")
+        # ThreadPool shares Pool's interface but runs in-process (no fork/pickling)
+        with patch.object(parallel_pdf_processor, "Pool", ThreadPool), patch.object(
+            ParallelPDFProcessor,
+            "_process_single_page",
+            staticmethod(lambda args: (args[0], f"R{args[0]}")),
+        ):
+            processor = ParallelPDFProcessor(workers=4)
+            results = processor.process_pdf_parallel("dummy.pdf")
 
-        assert len(results) == 5
-        assert results[0] == "R0"
-        mock_pool.map.assert_called_once()
+        assert results == ["R0", "R1", "R2", "R3", "R4"]
 
-    @patch("fitz.open")
-    def test_benchmark_run(self, mock_fitz_open):
+    def test_benchmark_run(self, fitz_doc_mock, mock_fitz_open):
         """Test benchmark method execution"""
-        mock_doc = MagicMock()
+        mock_doc, _ = fitz_doc_mock
         mock_doc.__len__.return_value = 2
-        mock_fitz_open.return_value = mock_doc
 
         processor = ParallelPDFProcessor(workers=1)
 
@@ -132,21 +131,16 @@ class TestParallelPDFProcessor:
 
 
 # Added from Ultra Coverage
-from paddleocr_toolkit.processors.parallel_pdf_processor import ParallelPDFProcessor
-from unittest.mock import MagicMock, patch
-import pytest
-import os
-import numpy as np
-
-
 class TestParallelProcessorUltra:
-    def test_parallel_processor_branches(self):
-        with patch.dict(os.environ, {"OCR_WORKERS": "invalid"}):
-            proc = ParallelPDFProcessor()
-            assert proc.workers >= 1
-        with patch(
-            "paddleocr_toolkit.processors.parallel_pdf_processor.HAS_PYMUPDF", False
-        ):
+    def test_parallel_processor_branches(
+        self, monkeypatch, fitz_doc_mock, mock_fitz_open
+    ):
+        monkeypatch.setenv("OCR_WORKERS", "invalid")
+        proc = ParallelPDFProcessor()
+        assert proc.workers >= 1
+        monkeypatch.delenv("OCR_WORKERS")
+        with monkeypatch.context() as m:
+            m.setattr(parallel_pdf_processor, "HAS_PYMUPDF", False)
             with pytest.raises(ImportError):
                 proc.process_pdf_parallel("test.pdf")
         with patch(
@@ -154,37 +148,32 @@ class TestParallelProcessorUltra:
             side_effect=Exception("Pool error"),
         ):
             proc = ParallelPDFProcessor(workers=4)
-            mock_doc = MagicMock()
+            mock_doc, _ = fitz_doc_mock
             mock_doc.__len__.return_value = 4
-            with patch("fitz.open", return_value=mock_doc), patch.object(
-                proc, "_process_single_page", return_value=(0, [])
-            ):
+            with patch.object(proc, "_process_single_page", return_value=(0, [])):
                 res = proc.process_pdf_parallel("test.pdf")
                 assert len(res) == 4
 
     def test_process_single_page_not_list(self):
-        proc = ParallelPDFProcessor()
         mock_engine = MagicMock()
         mock_engine.predict.return_value = "string_result"
         with patch(
             "paddleocr_toolkit.core.ocr_engine.OCREngineManager"
         ) as mock_mgr_cls, patch("cv2.imdecode", return_value=np.zeros((10, 10, 3))):
             mock_mgr_cls.return_value = mock_engine
-            res = proc._process_single_page((0, b"data", {}))
+            res = ParallelPDFProcessor._process_single_page((0, b"data", {}))
             assert res[1] == "string_result"
 
-    def test_parallel_block_simulation(self):
-        import runpy
-
-        with patch(
-            "paddleocr_toolkit.processors.parallel_pdf_processor.ParallelPDFProcessor.benchmark"
-        ):
-            with patch("os.path.exists", return_value=True):
-                with patch("fitz.open") as mock_fitz:
-                    mock_doc = MagicMock()
-                    mock_doc.__len__.return_value = 1
-                    mock_fitz.return_value = mock_doc
-                    runpy.run_module(
-                        "paddleocr_toolkit.processors.parallel_pdf_processor",
-                        run_name="__main__",
-                    )
+    @pytest.mark.parametrize("exists", [True, False])
+    def test_main(self, exists):
+        # Look the class up on the module: other tests may reload it, leaving the
+        # top-level ParallelPDFProcessor import pointing at a stale class
+        with patch.object(
+            parallel_pdf_processor.ParallelPDFProcessor, "benchmark"
+        ) as mock_benchmark, patch("os.path.exists", return_value=exists):
+            parallel_pdf_processor._main()
+
+        if exists:
+            mock_benchmark.assert_called_once_with("example.pdf")
+        else:
+            mock_benchmark.assert_not_called()
@@ -3,17 +3,14 @@
 PDF Generator 單元測試（擴充套件版）
 """
 
+import gc
+import io
 import os
-import sys
-import tempfile
 from unittest.mock import Mock, patch
 
 import numpy as np
 import pytest
 
-# 新增專案路徑
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 try:
     import fitz
 
@@ -32,6 +29,40 @@ from paddleocr_toolkit.core.models import OCRResult
 from paddleocr_toolkit.core.pdf_generator import PDFGenerator
 
 
+def _png_bytes(mode, color, size=(100, 100)):
+    """在記憶體中編碼 PNG 圖片（測試不在意檔案大小，以最低壓縮等級加快編碼）"""
+    buf = io.BytesIO()
+    Image.new(mode, size, color=color).save(buf, "PNG", compress_level=1)
+    return buf.getvalue()
+
+
+def _render_pixmap(width, height):
+    """以空白頁面渲染指定尺寸的 Pixmap"""
+    doc = fitz.open()
+    pixmap = doc.new_page(width=width, height=height).get_pixmap()
+    doc.close()
+    return pixmap
+
+
+# PDFGenerator 只讀取 Pixmap，各尺寸在模組內只渲染一次
+@pytest.fixture(scope="module")
+def pixmap_100():
+    """100x100 的空白 Pixmap"""
+    return _render_pixmap(100, 100)
+
+
+@pytest.fixture(scope="module")
+def pixmap_200x100():
+    """200x100 的空白 Pixmap"""
+    return _render_pixmap(200, 100)
+
+
+@pytest.fixture(scope="module")
+def pixmap_500():
+    """500x500 的空白 Pixmap"""
+    return _render_pixmap(500, 500)
+
+
 class TestPDFGeneratorInit:
     """測試 PDFGenerator 初始化"""
 
@@ -71,81 +102,60 @@ class TestPDFGeneratorAddPage:
     """測試新增頁面"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_add_page_from_pixmap(self):
+    def test_add_page_from_pixmap(self, tmp_path, pixmap_200x100):
         """測試從 Pixmap 新增頁面"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "test.pdf")
 
-        try:
-            gen = PDFGenerator(temp_path)
+        gen = PDFGenerator(temp_path)
 
-            doc = fitz.open()
-            page = doc.new_page(width=200, height=100)
-            pixmap = page.get_pixmap()
-            doc.close()
+        result = gen.add_page_from_pixmap(pixmap_200x100, [])
 
-            result = gen.add_page_from_pixmap(pixmap, [])
-
-            assert result is True
-            assert len(gen.doc) == 1
-            assert gen.page_count == 1
-
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert result is True
+        assert len(gen.doc) == 1
+        assert gen.page_count == 1
 
     @pytest.mark.skipif(
         not HAS_FITZ or not HAS_PIL, reason="Dependencies not installed"
     )
-    def test_add_page_from_image_file(self):
+    def test_add_page_from_image_file(self, tmp_path):
         """測試從圖片檔案新增頁面"""
         # 建立測試圖片
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            img_path = f.name
+        img_path = str(tmp_path / "image.png")
+        pdf_path = str(tmp_path / "test.pdf")
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            pdf_path = f.name
+        # 建立簡單圖片
+        with open(img_path, "wb") as f:
+            f.write(_png_bytes("RGB", "white"))
 
-        try:
-            # 建立簡單圖片
-            img = Image.new("RGB", (100, 100), color="white")
-            img.save(img_path)
+        gen = PDFGenerator(pdf_path)
+        result = gen.add_page(img_path, [])
 
-            gen = PDFGenerator(pdf_path)
-            result = gen.add_page(img_path, [])
+        assert result is True
+        assert gen.page_count == 1
 
-            assert result is True
-            assert gen.page_count == 1
+    @pytest.mark.skipif(
+        not HAS_FITZ or not HAS_PIL, reason="Dependencies not installed"
+    )
+    @pytest.mark.parametrize("wrap", [bytes, io.BytesIO], ids=["bytes", "bytesio"])
+    def test_add_page_from_image_data(self, wrap):
+        """測試以記憶體中的圖片資料新增頁面，不經過暫存檔"""
+        gen = PDFGenerator("test.pdf")
 
-        finally:
-            for path in [img_path, pdf_path]:
-                if os.path.exists(path):
-                    os.remove(path)
+        result = gen.add_page(wrap(_png_bytes("RGB", "white", size=(120, 80))), [])
+
+        assert result is True
+        assert gen.page_count == 1
+        assert (gen.doc[0].rect.width, gen.doc[0].rect.height) == (120, 80)
 
     @pytest.mark.skipif(
         not HAS_FITZ or not HAS_PIL, reason="Dependencies not installed"
     )
     def test_add_page_with_compression(self):
         """測試壓縮模式新增頁面"""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            img_path = f.name
-
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            pdf_path = f.name
-
-        try:
-            img = Image.new("RGB", (100, 100), color="red")
-            img.save(img_path)
-
-            gen = PDFGenerator(pdf_path, compress_images=True, jpeg_quality=50)
-            result = gen.add_page(img_path, [])
-
-            assert result is True
+        gen = PDFGenerator("test.pdf", compress_images=True, jpeg_quality=50)
+        result = gen.add_page(_png_bytes("RGB", "red"), [])
 
-        finally:
-            for path in [img_path, pdf_path]:
-                if os.path.exists(path):
-                    os.remove(path)
+        assert result is True
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
     def test_add_page_nonexistent_file(self):
@@ -161,152 +171,182 @@ class TestPDFGeneratorWithOCR:
     """測試帶 OCR 結果的頁面"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_add_page_with_ocr_results(self):
+    def test_add_page_with_ocr_results(self, tmp_path, pixmap_200x100):
         """測試新增帶 OCR 結果的頁面"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            gen = PDFGenerator(temp_path)
-
-            doc = fitz.open()
-            page = doc.new_page(width=200, height=100)
-            pixmap = page.get_pixmap()
-            doc.close()
-
-            ocr_results = [
-                OCRResult(
-                    text="Hello World",
-                    confidence=0.95,
-                    bbox=[[10, 10], [100, 10], [100, 30], [10, 30]],
-                ),
-                OCRResult(
-                    text="Test",
-                    confidence=0.90,
-                    bbox=[[10, 50], [50, 50], [50, 70], [10, 70]],
-                ),
-            ]
-
-            result = gen.add_page_from_pixmap(pixmap, ocr_results)
-
-            assert result is True
-
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        temp_path = str(tmp_path / "test.pdf")
 
-    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_add_page_with_empty_text(self):
-        """測試空文字的 OCR 結果"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        gen = PDFGenerator(temp_path)
+
+        ocr_results = [
+            OCRResult(
+                text="Hello World",
+                confidence=0.95,
+                bbox=[[10, 10], [100, 10], [100, 30], [10, 30]],
+            ),
+            OCRResult(
+                text="Test",
+                confidence=0.90,
+                bbox=[[10, 50], [50, 50], [50, 70], [10, 70]],
+            ),
+        ]
 
-        try:
-            gen = PDFGenerator(temp_path)
+        result = gen.add_page_from_pixmap(pixmap_200x100, ocr_results)
 
-            doc = fitz.open()
-            page = doc.new_page(width=100, height=100)
-            pixmap = page.get_pixmap()
-            doc.close()
+        assert result is True
 
-            ocr_results = [
-                OCRResult(
-                    text="   ",  # 空白文字
-                    confidence=0.95,
-                    bbox=[[10, 10], [50, 10], [50, 30], [10, 30]],
-                )
-            ]
+    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
+    def test_add_page_with_empty_text(self, tmp_path, pixmap_100):
+        """測試空文字的 OCR 結果"""
+        temp_path = str(tmp_path / "test.pdf")
 
-            result = gen.add_page_from_pixmap(pixmap, ocr_results)
-            assert result is True
+        gen = PDFGenerator(temp_path)
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        ocr_results = [
+            OCRResult(
+                text="   ",  # 空白文字
+                confidence=0.95,
+                bbox=[[10, 10], [50, 10], [50, 30], [10, 30]],
+            )
+        ]
+
+        result = gen.add_page_from_pixmap(pixmap_100, ocr_results)
+        assert result is True
 
 
 class TestPDFGeneratorSave:
     """測試儲存功能"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_save_pdf(self):
+    def test_save_pdf(self, tmp_path, pixmap_100):
         """測試儲存 PDF"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "test.pdf")
 
-        try:
-            gen = PDFGenerator(temp_path)
+        gen = PDFGenerator(temp_path)
 
-            doc = fitz.open()
-            page = doc.new_page(width=100, height=100)
-            pixmap = page.get_pixmap()
-            doc.close()
+        gen.add_page_from_pixmap(pixmap_100, [])
 
-            gen.add_page_from_pixmap(pixmap, [])
+        result = gen.save()
 
-            result = gen.save()
+        assert result is True
+        assert os.path.exists(temp_path)
 
-            assert result is True
-            assert os.path.exists(temp_path)
+        # 驗證 PDF 可以開啟
+        saved_doc = fitz.open(temp_path)
+        assert len(saved_doc) == 1
+        saved_doc.close()
 
-            # 驗證 PDF 可以開啟
-            saved_doc = fitz.open(temp_path)
-            assert len(saved_doc) == 1
-            saved_doc.close()
+    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
+    def test_save_empty_pdf(self, tmp_path):
+        """測試儲存空 PDF"""
+        temp_path = str(tmp_path / "test.pdf")
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        gen = PDFGenerator(temp_path)
+
+        # 沒有新增頁面就儲存
+        result = gen.save()
+
+        # 空 PDF 儲存應該回傳 False
+        assert result is False
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_save_empty_pdf(self):
-        """測試儲存空 PDF"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+    def test_save_multiple_pages(self, tmp_path, pixmap_100):
+        """測試儲存多頁 PDF"""
+        temp_path = str(tmp_path / "test.pdf")
 
-        try:
-            gen = PDFGenerator(temp_path)
+        gen = PDFGenerator(temp_path)
 
-            # 沒有新增頁面就儲存
-            result = gen.save()
+        # 新增多頁
+        for i in range(3):
+            gen.add_page_from_pixmap(pixmap_100, [])
 
-            # 空 PDF 儲存應該回傳 False
-            assert result is False
+        result = gen.save()
+
+        assert result is True
+        assert gen.page_count == 3
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # 驗證 PDF 可以開啟
+        saved_doc = fitz.open(temp_path)
+        assert len(saved_doc) == 3
+        saved_doc.close()
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_save_multiple_pages(self):
-        """測試儲存多頁 PDF"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+    def test_save_with_incremental_flush(self, tmp_path, pixmap_100):
+        """測試分批寫入暫存檔後儲存"""
+        output = tmp_path / "output.pdf"
+        gen = PDFGenerator(str(output), flush_every=2)
+
+        for i in range(5):
+            result = OCRResult(
+                text=f"page{i}",
+                confidence=0.9,
+                bbox=[[10, 10], [90, 10], [90, 40], [10, 40]],
+            )
+            gen.add_page_from_pixmap(pixmap_100, [result])
 
-        try:
-            gen = PDFGenerator(temp_path)
+        # 已寫入暫存檔
+        assert gen._tmp_path is not None
+        assert os.path.exists(gen._tmp_path)
 
-            # 新增多頁
-            for i in range(3):
-                doc = fitz.open()
-                page = doc.new_page(width=100, height=100)
-                pixmap = page.get_pixmap()
-                doc.close()
-                gen.add_page_from_pixmap(pixmap, [])
+        assert gen.save() is True
+        assert gen._tmp_path is None
+        assert os.listdir(tmp_path) == ["output.pdf"]
 
-            result = gen.save()
+        saved_doc = fitz.open(str(output))
+        assert len(saved_doc) == 5
+        assert [p.get_text().strip() for p in saved_doc] == [
+            f"page{i}" for i in range(5)
+        ]
+        saved_doc.close()
 
-            assert result is True
-            assert gen.page_count == 3
+    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
+    def test_context_exit_removes_partial_file(self, tmp_path, pixmap_100):
+        """測試處理中斷時離開 context 會刪除暫存檔"""
+        with pytest.raises(RuntimeError):
+            with PDFGenerator(str(tmp_path / "output.pdf"), flush_every=2) as gen:
+                for _ in range(3):
+                    gen.add_page_from_pixmap(pixmap_100, [])
+                assert os.path.exists(gen._tmp_path)
+                raise RuntimeError("aborted")
+
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
+    def test_abandoned_generator_removes_partial_file(self, tmp_path, pixmap_100):
+        """測試未呼叫 save() 就丟棄生成器時刪除暫存檔"""
+        gen = PDFGenerator(str(tmp_path / "output.pdf"), flush_every=2)
+        for _ in range(3):
+            gen.add_page_from_pixmap(pixmap_100, [])
+        assert len(os.listdir(tmp_path)) == 1
+
+        del gen
+        gc.collect()
+
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
+    def test_failed_first_flush_removes_partial_file(self, tmp_path, pixmap_100):
+        """測試第一次寫入暫存檔失敗時刪除 mkstemp 建立的檔案"""
+        gen = PDFGenerator(str(tmp_path / "output.pdf"), flush_every=2)
+        with patch.object(gen.doc, "save", side_effect=RuntimeError("disk full")):
+            for _ in range(2):
+                gen.add_page_from_pixmap(pixmap_100, [])
+
+        assert gen._tmp_path is None
+        assert os.listdir(tmp_path) == []
+        gen.close()
+
+    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
+    def test_close_after_save(self, tmp_path, pixmap_100):
+        """測試 save() 之後呼叫 close() 不影響輸出檔"""
+        output = tmp_path / "output.pdf"
+        gen = PDFGenerator(str(output), flush_every=2)
+        for _ in range(3):
+            gen.add_page_from_pixmap(pixmap_100, [])
+        assert gen.save() is True
 
-            # 驗證 PDF 可以開啟
-            saved_doc = fitz.open(temp_path)
-            assert len(saved_doc) == 3
-            saved_doc.close()
+        gen.close()
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert os.listdir(tmp_path) == ["output.pdf"]
 
 
 class TestOCRResultProperties:
@@ -367,54 +407,22 @@ class TestImageFormats:
     )
     def test_add_page_rgba_image(self):
         """測試 RGBA 圖片（有 alpha 通道）"""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            img_path = f.name
+        gen = PDFGenerator("test.pdf", compress_images=True)
+        result = gen.add_page(_png_bytes("RGBA", (255, 0, 0, 128)), [])
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            pdf_path = f.name
-
-        try:
-            # 建立 RGBA 圖片
-            img = Image.new("RGBA", (100, 100), color=(255, 0, 0, 128))
-            img.save(img_path)
-
-            gen = PDFGenerator(pdf_path, compress_images=True)
-            result = gen.add_page(img_path, [])
-
-            # 應該成功轉換為 RGB
-            assert result is True
-
-        finally:
-            for path in [img_path, pdf_path]:
-                if os.path.exists(path):
-                    os.remove(path)
+        # 應該成功轉換為 RGB
+        assert result is True
 
     @pytest.mark.skipif(
         not HAS_FITZ or not HAS_PIL, reason="Dependencies not installed"
     )
     def test_add_page_grayscale_image(self):
         """測試灰階圖片"""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            img_path = f.name
-
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            pdf_path = f.name
-
-        try:
-            # 建立灰階圖片
-            img = Image.new("L", (100, 100), color=128)
-            img.save(img_path)
+        gen = PDFGenerator("test.pdf", compress_images=True)
+        result = gen.add_page(_png_bytes("L", 128), [])
 
-            gen = PDFGenerator(pdf_path, compress_images=True)
-            result = gen.add_page(img_path, [])
-
-            # 應該成功轉換為 RGB
-            assert result is True
-
-        finally:
-            for path in [img_path, pdf_path]:
-                if os.path.exists(path):
-                    os.remove(path)
+        # 應該成功轉換為 RGB
+        assert result is True
 
 
 class TestPixmapCompression:
@@ -423,155 +431,119 @@ class TestPixmapCompression:
     @pytest.mark.skipif(
         not HAS_FITZ or not HAS_PIL, reason="Dependencies not installed"
     )
-    def test_add_page_from_pixmap_with_compression(self):
+    def test_add_page_from_pixmap_with_compression(self, tmp_path, pixmap_200x100):
         """測試從 pixmap 新增頁面並壓縮"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "test.pdf")
 
-        try:
-            gen = PDFGenerator(temp_path, compress_images=True, jpeg_quality=60)
+        gen = PDFGenerator(temp_path, compress_images=True, jpeg_quality=60)
 
-            doc = fitz.open()
-            page = doc.new_page(width=200, height=100)
-            pixmap = page.get_pixmap()
-            doc.close()
+        result = gen.add_page_from_pixmap(pixmap_200x100, [])
 
-            result = gen.add_page_from_pixmap(pixmap, [])
+        assert result is True
 
-            assert result is True
+    @pytest.mark.skipif(
+        not HAS_FITZ or not HAS_PIL, reason="Dependencies not installed"
+    )
+    def test_add_page_from_jpeg_bytes(self, pixmap_200x100):
+        """測試以預先編碼的 JPEG 資料新增頁面"""
+        gen = PDFGenerator("test.pdf", compress_images=True, jpeg_quality=60)
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        jpeg_data = gen.encode_jpeg(pixmap_200x100)
+
+        assert jpeg_data[:2] == b"\xff\xd8"
+        assert gen.add_page_from_jpeg_bytes(jpeg_data, 200, 100, []) is True
+        assert gen.page_count == 1
+        assert gen.doc[0].rect.width == 200
 
 
 class TestTextInsertionEdgeCases:
     """測試文字插入的邊界條件"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_very_small_text_area(self):
+    def test_very_small_text_area(self, tmp_path, pixmap_100):
         """測試極小的文字區域"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            gen = PDFGenerator(temp_path)
-
-            doc = fitz.open()
-            page = doc.new_page(width=100, height=100)
-            pixmap = page.get_pixmap()
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            # 極小的文字區域（高度 < 6）
-            ocr_results = [
-                OCRResult(
-                    text="T",
-                    confidence=0.9,
-                    bbox=[[10, 10], [15, 10], [15, 12], [10, 12]],  # 高度只有 2
-                )
-            ]
+        gen = PDFGenerator(temp_path)
 
-            result = gen.add_page_from_pixmap(pixmap, ocr_results)
-            assert result is True
+        # 極小的文字區域（高度 < 6）
+        ocr_results = [
+            OCRResult(
+                text="T",
+                confidence=0.9,
+                bbox=[[10, 10], [15, 10], [15, 12], [10, 12]],  # 高度只有 2
+            )
+        ]
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        result = gen.add_page_from_pixmap(pixmap_100, ocr_results)
+        assert result is True
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_very_large_text_area(self):
+    def test_very_large_text_area(self, tmp_path, pixmap_500):
         """測試極大的文字區域"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            gen = PDFGenerator(temp_path)
+        temp_path = str(tmp_path / "test.pdf")
 
-            doc = fitz.open()
-            page = doc.new_page(width=500, height=500)
-            pixmap = page.get_pixmap()
-            doc.close()
+        gen = PDFGenerator(temp_path)
 
-            # 極大的文字區域（高度 > 150）
-            ocr_results = [
-                OCRResult(
-                    text="LARGE",
-                    confidence=0.9,
-                    bbox=[[10, 10], [400, 10], [400, 200], [10, 200]],  # 高度 190
-                )
-            ]
-
-            result = gen.add_page_from_pixmap(pixmap, ocr_results)
-            assert result is True
+        # 極大的文字區域（高度 > 150）
+        ocr_results = [
+            OCRResult(
+                text="LARGE",
+                confidence=0.9,
+                bbox=[[10, 10], [400, 10], [400, 200], [10, 200]],  # 高度 190
+            )
+        ]
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        result = gen.add_page_from_pixmap(pixmap_500, ocr_results)
+        assert result is True
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_debug_mode_text_insertion(self):
+    def test_debug_mode_text_insertion(self, tmp_path, pixmap_100):
         """測試 debug 模式的文字插入（粉紅色文字）"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            gen = PDFGenerator(temp_path, debug_mode=True)
-
-            doc = fitz.open()
-            page = doc.new_page(width=100, height=100)
-            pixmap = page.get_pixmap()
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            ocr_results = [
-                OCRResult(
-                    text="DEBUG",
-                    confidence=0.9,
-                    bbox=[[10, 10], [50, 10], [50, 30], [10, 30]],
-                )
-            ]
+        gen = PDFGenerator(temp_path, debug_mode=True)
 
-            result = gen.add_page_from_pixmap(pixmap, ocr_results)
-            assert result is True
+        ocr_results = [
+            OCRResult(
+                text="DEBUG",
+                confidence=0.9,
+                bbox=[[10, 10], [50, 10], [50, 30], [10, 30]],
+            )
+        ]
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        result = gen.add_page_from_pixmap(pixmap_100, ocr_results)
+        assert result is True
 
 
 class TestErrorHandling:
     """測試錯誤處理與降級機制"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_text_insertion_font_fallback(self):
+    def test_text_insertion_font_fallback(self, tmp_path):
         """測試文字插入的字型降級"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            gen = PDFGenerator(temp_path)
+        temp_path = str(tmp_path / "test.pdf")
 
-            # Mock page object
-            page = Mock()
+        gen = PDFGenerator(temp_path)
 
-            # 讓第一次 insert_text 失敗, 第二次成功
-            page.insert_text.side_effect = [Exception("Font Error"), None]
+        # Mock page object
+        page = Mock()
 
-            result = OCRResult(
-                text="Fallback",
-                confidence=0.9,
-                bbox=[[0, 0], [100, 0], [100, 20], [0, 20]],
-            )
+        # 讓第一次 insert_text 失敗, 第二次成功
+        page.insert_text.side_effect = [Exception("Font Error"), None]
 
-            # 這裡我們不可避免地會依賴內部實作細節，但為了測試覆蓋率這是必要的
-            # 直接呼叫 _insert_invisible_text
-            gen._insert_invisible_text(page, result)
+        result = OCRResult(
+            text="Fallback",
+            confidence=0.9,
+            bbox=[[0, 0], [100, 0], [100, 20], [0, 20]],
+        )
 
-            # 應該嘗試兩次 (第一次失敗, 第二次重試)
-            assert page.insert_text.call_count == 2
+        # 這裡我們不可避免地會依賴內部實作細節，但為了測試覆蓋率這是必要的
+        # 直接呼叫 _insert_invisible_text
+        gen._insert_invisible_text(page, result)
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # 應該嘗試兩次 (第一次失敗, 第二次重試)
+        assert page.insert_text.call_count == 2
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
     def test_text_insertion_all_fonts_fail(self):
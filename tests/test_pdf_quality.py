@@ -3,15 +3,8 @@
 PDF Quality 單元測試
 """
 
-import os
-import sys
-import tempfile
-
 import pytest
 
-# 新增專案路徑
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 try:
     import fitz
 
@@ -45,48 +38,36 @@ class TestDetectPdfQuality:
         assert result["recommended_dpi"] >= 100
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_with_text_pdf(self):
+    def test_with_text_pdf(self, tmp_path):
         """測試有文字的 PDF"""
         # 建立有文字的 PDF
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            doc = fitz.open()
-            page = doc.new_page()
-            page.insert_text((100, 100), "This is test text " * 50)  # 足夠多的文字
-            doc.save(temp_path)
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            result = detect_pdf_quality(temp_path)
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((100, 100), "This is test text " * 50)  # 足夠多的文字
+        doc.save(temp_path)
+        doc.close()
 
-            # 有文字的 PDF
-            assert result["has_text"] is True or result["is_scanned"] is False
+        result = detect_pdf_quality(temp_path)
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # 有文字的 PDF
+        assert result["has_text"] is True or result["is_scanned"] is False
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_with_empty_pdf(self):
+    def test_with_empty_pdf(self, tmp_path):
         """測試空白 PDF"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "test.pdf")
 
-        try:
-            doc = fitz.open()
-            doc.new_page()  # 空白頁
-            doc.save(temp_path)
-            doc.close()
+        doc = fitz.open()
+        doc.new_page()  # 空白頁
+        doc.save(temp_path)
+        doc.close()
 
-            result = detect_pdf_quality(temp_path)
+        result = detect_pdf_quality(temp_path)
 
-            # 空白 PDF 沒有文字
-            assert "recommended_dpi" in result
-
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # 空白 PDF 沒有文字
+        assert "recommended_dpi" in result
 
 
 # 執行測試
@@ -3,15 +3,9 @@
 PDF 工具函式單元測試
 """
 
-import os
-import sys
-
 import numpy as np
 import pytest
 
-# 新增專案路徑
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from paddleocr_toolkit.core.pdf_utils import (
     add_image_page,
     create_pdf,
@@ -56,6 +50,29 @@ class TestPixmapToNumpy:
 
         assert result.shape == (10, 10, 3)  # 應該是 RGB
 
+    def test_conversion_into_reusable_buffer(self):
+        """測試寫入可重複使用的緩衝區"""
+
+        class MockPixmap:
+            def __init__(self):
+                self.width = 4
+                self.height = 2
+                self.n = 3
+                self.samples = np.arange(24, dtype=np.uint8).tobytes()
+
+        buffer = np.zeros(100, dtype=np.uint8)
+        result = pixmap_to_numpy(MockPixmap(), out=buffer)
+
+        assert result.shape == (2, 4, 3)
+        assert result.flags["C_CONTIGUOUS"]
+        assert np.shares_memory(result, buffer)
+        assert result.ravel().tolist() == list(range(24))
+
+        # 緩衝區不足時退回一般複製
+        small = np.zeros(8, dtype=np.uint8)
+        result = pixmap_to_numpy(MockPixmap(), out=small)
+        assert not np.shares_memory(result, small)
+
 
 class TestNumpyToPdfBytes:
     """測試 numpy_to_pdf_bytes"""
@@ -2,12 +2,9 @@
 # -*- coding: utf-8 -*-
 """
 效能模組測試
-測試GPU最佳化器、快取系統和並行處理器
+測試GPU最佳化器和並行處理器（快取系統見 test_model_cache.py）
 """
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 
@@ -20,30 +17,6 @@ def test_gpu_optimizer_import():
     assert processor.stats["total_images"] == 0
 
 
-def test_model_cache_singleton():
-    """測試模型快取單例模式"""
-    from paddleocr_toolkit.core.model_cache import ModelCache
-
-    cache1 = ModelCache()
-    cache2 = ModelCache()
-
-    # 應該是同一個例項
-    assert cache1 is cache2
-
-
-def test_result_cache():
-    """測試結果快取"""
-    from paddleocr_toolkit.core.model_cache import ResultCache
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        cache = ResultCache(cache_dir=Path(tmpdir))
-
-        # 測試統計
-        stats = cache.get_stats()
-        assert stats["hits"] == 0
-        assert stats["misses"] == 0
-
-
 def test_parallel_processor_init():
     """測試並行處理器初始化"""
     from paddleocr_toolkit.processors.parallel_pdf_processor import ParallelPDFProcessor
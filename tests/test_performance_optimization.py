@@ -3,8 +3,6 @@
 效能最佳化測試 - 驗證記憶體和 I/O 最佳化效果
 """
 
-import os
-import tempfile
 import time
 import tracemalloc
 from pathlib import Path
@@ -36,80 +34,62 @@ class TestStreamingUtils:
     """測試串流處理工具"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_open_pdf_context(self):
+    def test_open_pdf_context(self, tmp_path):
         """測試 PDF context manager"""
         # 建立測試 PDF
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "test.pdf")
 
-        try:
-            doc = fitz.open()
-            page = doc.new_page(width=100, height=100)
-            page.insert_text((10, 50), "Test")
-            doc.save(temp_path)
-            doc.close()
-
-            # 測試 context manager
-            with open_pdf_context(temp_path) as pdf_doc:
-                assert len(pdf_doc) == 1
+        doc = fitz.open()
+        page = doc.new_page(width=100, height=100)
+        page.insert_text((10, 50), "Test")
+        doc.save(temp_path)
+        doc.close()
 
-            # 確認已關閉
-            # PDF 已在 context manager 中關閉
+        # 測試 context manager
+        with open_pdf_context(temp_path) as pdf_doc:
+            assert len(pdf_doc) == 1
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # 確認已關閉
+        # PDF 已在 context manager 中關閉
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_pdf_pages_generator(self):
+    def test_pdf_pages_generator(self, tmp_path):
         """測試頁面生成器"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            # 建立 3 頁測試 PDF
-            doc = fitz.open()
-            for i in range(3):
-                page = doc.new_page(width=100, height=100)
-                page.insert_text((10, 50), f"Page {i+1}")
-            doc.save(temp_path)
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            # 測試生成器
-            pages = list(pdf_pages_generator(temp_path, dpi=72))
+        # 建立 3 頁測試 PDF
+        doc = fitz.open()
+        for i in range(3):
+            page = doc.new_page(width=100, height=100)
+            page.insert_text((10, 50), f"Page {i+1}")
+        doc.save(temp_path)
+        doc.close()
 
-            assert len(pages) == 3
-            assert all(page_num == i for i, (page_num, _) in enumerate(pages))
+        # 測試生成器
+        pages = list(pdf_pages_generator(temp_path, dpi=72))
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert len(pages) == 3
+        assert all(page_num == i for i, (page_num, _) in enumerate(pages))
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_batch_pages_generator(self):
+    def test_batch_pages_generator(self, tmp_path):
         """測試批次生成器"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            # 建立 10 頁測試 PDF
-            doc = fitz.open()
-            for i in range(10):
-                page = doc.new_page(width=100, height=100)
-                page.insert_text((10, 50), f"Page {i+1}")
-            doc.save(temp_path)
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            # 測試批次生成器 (batch_size=3)
-            batches = list(batch_pages_generator(temp_path, dpi=72, batch_size=3))
+        # 建立 10 頁測試 PDF
+        doc = fitz.open()
+        for i in range(10):
+            page = doc.new_page(width=100, height=100)
+            page.insert_text((10, 50), f"Page {i+1}")
+        doc.save(temp_path)
+        doc.close()
 
-            assert len(batches) == 4  # 10 頁分成 4 批 (3+3+3+1)
-            assert len(batches[0]) == 3
-            assert len(batches[-1]) == 1
+        # 測試批次生成器 (batch_size=3)
+        batches = list(batch_pages_generator(temp_path, dpi=72, batch_size=3))
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert len(batches) == 4  # 10 頁分成 4 批 (3+3+3+1)
+        assert len(batches[0]) == 3
+        assert len(batches[-1]) == 1
 
 
 class TestBufferedWriter:
@@ -174,37 +154,31 @@ class TestMemoryOptimization:
     """測試記憶體最佳化效果"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_memory_usage_streaming(self):
+    def test_memory_usage_streaming(self, tmp_path):
         """測試串流處理記憶體使用"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            # 建立較大的測試 PDF (20 頁)
-            doc = fitz.open()
-            for i in range(20):
-                page = doc.new_page(width=595, height=842)
-                page.insert_text((50, 50), f"Page {i+1}")
-            doc.save(temp_path)
-            doc.close()
-
-            # 測量記憶體
-            tracemalloc.start()
-
-            # 串流處理（記憶體應該恆定）
-            for page_num, image in pdf_pages_generator(temp_path, dpi=150):
-                pass  # 模擬處理
-
-            current, peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-
-            # 峰值記憶體應該小於 30MB（串流處理效果）
-            # 如果不用串流，100頁會需要 200MB+
-            assert peak < 30 * 1024 * 1024
-
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        temp_path = str(tmp_path / "test.pdf")
+
+        # 建立較大的測試 PDF (20 頁)
+        doc = fitz.open()
+        for i in range(20):
+            page = doc.new_page(width=595, height=842)
+            page.insert_text((50, 50), f"Page {i+1}")
+        doc.save(temp_path)
+        doc.close()
+
+        # 測量記憶體
+        tracemalloc.start()
+
+        # 串流處理（記憶體應該恆定）
+        for page_num, image in pdf_pages_generator(temp_path, dpi=150):
+            pass  # 模擬處理
+
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # 峰值記憶體應該小於 30MB（串流處理效果）
+        # 如果不用串流，100頁會需要 200MB+
+        assert peak < 30 * 1024 * 1024
 
 
 class TestIOOptimization:
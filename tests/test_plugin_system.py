@@ -3,15 +3,11 @@
 外掛系統測試
 """
 
-import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
-# 確保可以匯入模組
-sys.path.append(".")
-
 from paddleocr_toolkit.api.main import app, plugin_loader
 from paddleocr_toolkit.core.ocr_engine import OCREngineManager
 from paddleocr_toolkit.plugins.base import OCRPlugin
@@ -1,13 +1,9 @@
-import os
-import sys
 import unittest
 from types import SimpleNamespace
 
 import numpy as np
 
-# 將 custom 目錄加入 path 以便匯入插件
-sys.path.append(os.path.join(os.getcwd(), "custom"))
-
+# custom 目錄由 pytest.ini 的 pythonpath 加入 sys.path
 try:
     from doc_classifier import DocClassifierPlugin
     from pii_masking import PIIMaskingPlugin
@@ -3,8 +3,10 @@
 OCR 結果解析器測試
 """
 
+import json
 from unittest.mock import MagicMock, Mock
 
+import numpy as np
 import pytest
 
 from paddleocr_toolkit.core.models import OCRResult
@@ -60,6 +62,56 @@ class TestOCRResultParser:
         assert results[0].text == "Test"
         assert results[0].confidence == 0.88
 
+    def test_parse_polys_keep_precision(self):
+        """測試座標保留來源精度，不經 float32 轉換"""
+        parser = OCRResultParser()
+        poly = [[10.1, 0.2], [20.3, 0.2], [20.3, 5.7], [10.1, 5.7]]
+        mock_result = {
+            "rec_texts": ["A"],
+            "rec_scores": [0.9],
+            "dt_polys": np.array([poly], dtype=np.float64),
+        }
+
+        results = parser.parse_basic_result([mock_result])
+
+        # 10.1 無法以 float32 精確表示，降階後會變成 10.100000381469727
+        assert results[0].bbox == poly
+        assert json.loads(json.dumps(results[0].bbox)) == poly
+
+    def test_parse_polys_keep_int_coordinates(self):
+        """測試整數座標逐筆轉換後仍為 int，不受其他多邊形型別影響"""
+        parser = OCRResultParser()
+        mock_result = {
+            "rec_texts": ["A", "B"],
+            "rec_scores": [0.5, 0.25],
+            "dt_polys": [
+                np.array([[0, 0], [10, 0], [10, 5], [0, 5]], dtype=np.int16),
+                np.array([[0.5, 6], [10, 6], [10, 11], [0, 11]]),
+            ],
+        }
+
+        results = parser.parse_basic_result([mock_result])
+
+        assert results[0].bbox == [[0, 0], [10, 0], [10, 5], [0, 5]]
+        assert isinstance(results[0].bbox[0][0], int)
+
+    def test_parse_ragged_polys(self):
+        """測試頂點數不一致的多邊形"""
+        parser = OCRResultParser()
+        mock_result = {
+            "rec_texts": ["Quad", "Hex"],
+            "rec_scores": [0.9, 0.8],
+            "dt_polys": [
+                [[0, 0], [1, 0], [1, 1], [0, 1]],
+                [[0, 0], [1, 0], [2, 1], [1, 2], [0, 2], [-1, 1]],
+            ],
+        }
+
+        results = parser.parse_basic_result([mock_result])
+
+        assert len(results) == 2
+        assert len(results[1].bbox) == 6
+
     def test_parse_basic_result_empty(self):
         """測試解析空結果"""
         parser = OCRResultParser()
@@ -3,10 +3,11 @@
 語義處理器測試
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from paddleocr_toolkit.llm import OllamaClient, create_llm_client
 from paddleocr_toolkit.processors.semantic_processor import SemanticProcessor
 
 
@@ -141,8 +142,6 @@ class TestLLMClient:
 
     def test_ollama_client_creation(self):
         """測試 Ollama 客戶端建立處理"""
-        from paddleocr_toolkit.llm import OllamaClient, create_llm_client
-
         with patch("paddleocr_toolkit.llm.llm_client.HAS_REQUESTS", True):
             client = create_llm_client("ollama", model="qwen2.5:7b")
             assert isinstance(client, OllamaClient)
@@ -150,17 +149,10 @@ class TestLLMClient:
 
     def test_unsupported_provider(self):
         """測試不支援的提供商"""
-        from paddleocr_toolkit.llm import create_llm_client
-
         with pytest.raises(ValueError, match="不支援的 LLM 提供商"):
             create_llm_client("unsupported_provider")
 
 
-# Added from Ultra Coverage
-from paddleocr_toolkit.processors.semantic_processor import SemanticProcessor
-from unittest.mock import MagicMock, patch
-
-
 class TestSemanticExceptions:
     def test_summarize_exception(self):
         proc = SemanticProcessor()
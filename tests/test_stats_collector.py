@@ -3,15 +3,10 @@
 StatsCollector 單元測試（擴充套件版）
 """
 
-import os
-import sys
 import time
 
 import pytest
 
-# 新增專案路徑
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from paddleocr_toolkit.processors.stats_collector import (
     PageStats,
     ProcessingStats,
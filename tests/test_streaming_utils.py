@@ -4,8 +4,6 @@ Streaming Utils 測試 - v1.1.0 Week 1 Day 5-7
 補充測試以達到 85%+ 覆蓋率
 """
 
-import os
-import tempfile
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -28,267 +26,207 @@ class TestOpenPdfContext:
     """測試 PDF 上下文管理器"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_open_pdf_context_basic(self):
+    def test_open_pdf_context_basic(self, tmp_path):
         """測試基本 PDF 開啟"""
         # 建立測試 PDF
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "test.pdf")
 
-        try:
-            doc = fitz.open()
-            doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
+        doc = fitz.open()
+        doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-            # 測試上下文管理器
-            with open_pdf_context(temp_path) as pdf_doc:
-                assert pdf_doc is not None
-                assert len(pdf_doc) == 1
-
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # 測試上下文管理器
+        with open_pdf_context(temp_path) as pdf_doc:
+            assert pdf_doc is not None
+            assert len(pdf_doc) == 1
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_open_pdf_context_closes(self):
+    def test_open_pdf_context_closes(self, tmp_path):
         """測試 PDF 正確關閉"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            doc = fitz.open()
-            doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            # 使用上下文管理器
-            with open_pdf_context(temp_path) as pdf_doc:
-                doc_ref = pdf_doc
+        doc = fitz.open()
+        doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-            # 驗證已關閉（透過檢查是否可以訪問）
-            # fitz 檔案關閉後某些操作會失敗
-            assert doc_ref is not None
+        # 使用上下文管理器
+        with open_pdf_context(temp_path) as pdf_doc:
+            doc_ref = pdf_doc
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # 驗證已關閉（透過檢查是否可以訪問）
+        # fitz 檔案關閉後某些操作會失敗
+        assert doc_ref is not None
 
 
 class TestPdfPagesGenerator:
     """測試 PDF 頁面生成器"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_pdf_pages_generator_all_pages(self):
+    def test_pdf_pages_generator_all_pages(self, tmp_path):
         """測試生成所有頁面"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            # 建立3頁PDF
-            doc = fitz.open()
-            for i in range(3):
-                doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            # 測試生成器
-            pages = list(pdf_pages_generator(temp_path))
+        # 建立3頁PDF
+        doc = fitz.open()
+        for i in range(3):
+            doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-            assert len(pages) == 3
-            for i, (page_num, page) in enumerate(pages):
-                assert page_num == i
-                assert page is not None
+        # 測試生成器
+        pages = list(pdf_pages_generator(temp_path))
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert len(pages) == 3
+        for i, (page_num, page) in enumerate(pages):
+            assert page_num == i
+            assert page is not None
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_pdf_pages_generator_specific_pages(self):
+    def test_pdf_pages_generator_specific_pages(self, tmp_path):
         """測試生成特定頁面"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "test.pdf")
 
-        try:
-            doc = fitz.open()
-            for i in range(5):
-                doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
-
-            # 只生成第0,2,4頁
-            pages = list(pdf_pages_generator(temp_path, pages=[0, 2, 4]))
+        doc = fitz.open()
+        for i in range(5):
+            doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-            assert len(pages) == 3
-            assert pages[0][0] == 0
-            assert pages[1][0] == 2
-            assert pages[2][0] == 4
+        # 只生成第0,2,4頁
+        pages = list(pdf_pages_generator(temp_path, pages=[0, 2, 4]))
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert len(pages) == 3
+        assert pages[0][0] == 0
+        assert pages[1][0] == 2
+        assert pages[2][0] == 4
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_pdf_pages_generator_with_dpi(self):
+    def test_pdf_pages_generator_with_dpi(self, tmp_path):
         """測試帶DPI引數的生成"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "test.pdf")
 
-        try:
-            doc = fitz.open()
-            doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
+        doc = fitz.open()
+        doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-            # 測試不同DPI
-            pages_low = list(pdf_pages_generator(temp_path, dpi=72))
-            pages_high = list(pdf_pages_generator(temp_path, dpi=300))
+        # 測試不同DPI
+        pages_low = list(pdf_pages_generator(temp_path, dpi=72))
+        pages_high = list(pdf_pages_generator(temp_path, dpi=300))
 
-            assert len(pages_low) == 1
-            assert len(pages_high) == 1
-
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert len(pages_low) == 1
+        assert len(pages_high) == 1
 
 
 class TestBatchPagesGenerator:
     """測試批次頁面生成器"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_batch_pages_generator_basic(self):
+    def test_batch_pages_generator_basic(self, tmp_path):
         """測試基本批次生成"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "test.pdf")
 
-        try:
-            doc = fitz.open()
-            for i in range(10):
-                doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
-
-            # 批次大小為3
-            batches = list(batch_pages_generator(temp_path, batch_size=3))
-
-            # 應該有4個批次（3+3+3+1）
-            assert len(batches) == 4
-            assert len(batches[0]) == 3
-            assert len(batches[1]) == 3
-            assert len(batches[2]) == 3
-            assert len(batches[3]) == 1  # 最後一個批次
+        doc = fitz.open()
+        for i in range(10):
+            doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # 批次大小為3
+        batches = list(batch_pages_generator(temp_path, batch_size=3))
+
+        # 應該有4個批次（3+3+3+1）
+        assert len(batches) == 4
+        assert len(batches[0]) == 3
+        assert len(batches[1]) == 3
+        assert len(batches[2]) == 3
+        assert len(batches[3]) == 1  # 最後一個批次
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_batch_pages_generator_exact_fit(self):
+    def test_batch_pages_generator_exact_fit(self, tmp_path):
         """測試剛好整除的批次"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            doc = fitz.open()
-            for i in range(6):
-                doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            # 批次大小為2，剛好3批
-            batches = list(batch_pages_generator(temp_path, batch_size=2))
+        doc = fitz.open()
+        for i in range(6):
+            doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-            assert len(batches) == 3
-            assert all(len(batch) == 2 for batch in batches)
+        # 批次大小為2，剛好3批
+        batches = list(batch_pages_generator(temp_path, batch_size=2))
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert len(batches) == 3
+        assert all(len(batch) == 2 for batch in batches)
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_batch_pages_generator_single_batch(self):
+    def test_batch_pages_generator_single_batch(self, tmp_path):
         """測試單個批次"""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            doc = fitz.open()
-            for i in range(3):
-                doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            # 批次大小大於總頁數
-            batches = list(batch_pages_generator(temp_path, batch_size=10))
+        doc = fitz.open()
+        for i in range(3):
+            doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-            assert len(batches) == 1
-            assert len(batches[0]) == 3
+        # 批次大小大於總頁數
+        batches = list(batch_pages_generator(temp_path, batch_size=10))
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert len(batches) == 1
+        assert len(batches[0]) == 3
 
 
 class TestStreamingPDFProcessor:
     """測試 StreamingPDFProcessor"""
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
-    def test_process_pages(self):
+    def test_process_pages(self, tmp_path):
         """測試逐頁處理"""
         from paddleocr_toolkit.core.streaming_utils import StreamingPDFProcessor
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "test.pdf")
 
-        try:
-            doc = fitz.open()
-            for i in range(5):
-                doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
-
-            processor = StreamingPDFProcessor(temp_path)
+        doc = fitz.open()
+        for i in range(5):
+            doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-            # 定義處理函數
-            def process_func(image):
-                return image.shape
+        processor = StreamingPDFProcessor(temp_path)
 
-            results = list(processor.process_pages(process_func))
+        # 定義處理函數
+        def process_func(image):
+            return image.shape
 
-            assert len(results) == 5
-            for i, (page_num, res) in enumerate(results):
-                assert page_num == i
-                assert len(res) == 3  # shape
+        results = list(processor.process_pages(process_func))
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert len(results) == 5
+        for i, (page_num, res) in enumerate(results):
+            assert page_num == i
+            assert len(res) == 3  # shape
 
     @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
     @patch("paddleocr_toolkit.core.streaming_utils.gc.collect")
-    def test_gc_collection(self, mock_gc_collect):
+    def test_gc_collection(self, mock_gc_collect, tmp_path):
         """測試垃圾回收觸發"""
         from paddleocr_toolkit.core.streaming_utils import StreamingPDFProcessor
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            doc = fitz.open()
-            for i in range(12):  # 超過10頁
-                doc.new_page(width=100, height=100)
-            doc.save(temp_path)
-            doc.close()
+        temp_path = str(tmp_path / "test.pdf")
 
-            processor = StreamingPDFProcessor(temp_path)
-            list(processor.process_pages(lambda x: x))
+        doc = fitz.open()
+        for i in range(12):  # 超過10頁
+            doc.new_page(width=100, height=100)
+        doc.save(temp_path)
+        doc.close()
 
-            # 應該至少調用一次 gc.collect (在第10頁) + 上下文結束
-            assert mock_gc_collect.call_count >= 1
+        processor = StreamingPDFProcessor(temp_path)
+        list(processor.process_pages(lambda x: x))
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        # 應該至少調用一次 gc.collect (在第10頁) + 上下文結束
+        assert mock_gc_collect.call_count >= 1
 
     def test_progress_bar(self):
         """測試進度條顯示"""
@@ -3,14 +3,10 @@
 文書處理模組單元測試
 """
 
-import os
 import sys
 
 import pytest
 
-# 新增專案路徑
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from paddleocr_toolkit.processors.text_processor import (
     MERGE_TERMS,
     PROTECTED_TERMS,